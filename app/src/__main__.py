@@ -5,6 +5,7 @@ import traceback
 from datetime import datetime
 import os
 import sys
+import multiprocessing
 
 from .app_logic import VisualLayoutTool
 from .main_menu import MainMenu
@@ -93,6 +94,8 @@ class AppController:
         messagebox.showwarning("Work in Progress", "The Image Generator is currently under development.")
 
 if __name__ == "__main__":
+    # Required for the render worker pool when running as a frozen executable
+    multiprocessing.freeze_support()
     try:
         root = tk.Tk()
         app = AppController(root)
@@ -3,7 +3,11 @@
 from .config import get_google_creds, ACCOUNT_MAPPING, PLATFORM_MAPPING
 from .trello_client import TrelloClient
 from .google_drive_client import GoogleDriveClient
+from .drive_listing import DriveListingService
+from .download_stream import DownloadStream, DownloadError
 from .google_sheets_client import GoogleSheetsClient
+from .sheets_session import SheetsSession, get_sheets_session
+from .sheets_journal import SheetsJournal, get_sheets_journal
 from .account_mapper import AccountMapper
 
 # Backward Compatibility Functions
@@ -60,7 +64,14 @@ __all__ = [
     # New Modular Classes (Recommended)
     'TrelloClient',
     'GoogleDriveClient', 
+    'DriveListingService',
+    'DownloadStream',
+    'DownloadError',
     'GoogleSheetsClient',
+    'SheetsSession',
+    'get_sheets_session',
+    'SheetsJournal',
+    'get_sheets_journal',
     'AccountMapper',
     
     # Legacy Functions (Backward Compatibility)
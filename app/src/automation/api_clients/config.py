@@ -15,6 +15,13 @@ TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
 TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 
+# Indexes, caches and the Sheets journal live under the repository's cache/ folder
+# (ignored by git), whatever directory the app is started from
+CACHE_BASE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))),
+    "cache"
+)
+
 # --- GOOGLE API CONFIGURATION ---
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets", 
@@ -22,9 +29,63 @@ SCOPES = [
 ]
 SERVICE_ACCOUNT_FILE = "credentials.json"
 
+# Sheets sessions are reused across calls: the spreadsheet handle for an hour,
+# the worksheet list for five minutes (both refreshed after an API error)
+SHEETS_SESSION_TTL = 3600
+SHEETS_WORKSHEET_TTL = 300
+
+# Last content row per worksheet, kept across runs so appends only read the rows
+# below it instead of the whole sheet; rows are checked SHEETS_ROW_WINDOW at a time
+SHEETS_ROW_INDEX_FILE = os.path.join(CACHE_BASE_PATH, "sheets_row_index.json")
+SHEETS_ROW_WINDOW = 50
+
+# A project block (values, borders, merge) is one batchUpdate; quota and server
+# errors are retried with exponential backoff, like Drive downloads
+SHEETS_MAX_RETRIES = 4
+SHEETS_BACKOFF_SECONDS = 2
+SHEETS_MAX_BACKOFF_SECONDS = 32
+
+# Result rows are journaled to disk and written by a background worker, so a job
+# never waits on Sheets and rows survive a crash or quit (resent on next start).
+# Writes are paced below the per-minute quota; failed entries back off up to the cap
+SHEETS_JOURNAL_ENABLED = True
+SHEETS_JOURNAL_DIR = os.path.join(CACHE_BASE_PATH, "sheets_journal")
+SHEETS_WRITES_PER_MINUTE = 40
+SHEETS_WRITE_BURST = 5
+SHEETS_JOURNAL_MAX_BACKOFF_SECONDS = 600
+SHEETS_JOURNAL_MAX_ATTEMPTS = 8  # Attempts before an entry is moved to the journal's failed/ folder
+SHEETS_JOURNAL_EXIT_GRACE_SECONDS = 30  # How long the CLI waits for pending rows before exiting
+
 # --- DOWNLOAD CONFIGURATION ---
 DOWNLOADS_DIR = "temp_downloads"
 DOWNLOAD_TIMEOUT = 600  # 10 minutes
+DOWNLOAD_WORKERS = 4  # Files downloaded concurrently, each with its own HTTP connection
+# Bytes per ranged request (library default is 100 MB). Each worker holds one chunk
+# in memory, so WORKERS x CHUNK_SIZE is the peak buffer use
+DOWNLOAD_CHUNK_SIZE = 128 * 1024 * 1024
+DOWNLOAD_MAX_RETRIES = 5  # Per file; a .part file keeps its bytes across retries
+DOWNLOAD_BACKOFF_SECONDS = 2  # First retry delay, doubled on every further retry
+DOWNLOAD_MAX_BACKOFF_SECONDS = 60
+
+# Downloads kept across jobs, keyed by Drive file ID + md5Checksum/modifiedTime.
+# Keep it on the same disk as DOWNLOADS_DIR so hits are hardlinks, not copies
+DOWNLOAD_CACHE_ENABLED = True
+DOWNLOAD_CACHE_DIR = os.path.join(CACHE_BASE_PATH, "downloads")
+DOWNLOAD_CACHE_MAX_GB = 100
+
+# Background downloads feed the renderer as each file lands. At most this many files
+# are downloading or on disk waiting for their render, which bounds the disk the
+# downloads use ahead of encoding; a parallel render uses at most this many workers
+DOWNLOAD_PIPELINE_ENABLED = True
+DOWNLOAD_PIPELINE_MAX_AHEAD = 3
+
+# Start the background downloads as soon as the card is fetched, while the
+# confirmation dialog is still open (needs DOWNLOAD_PIPELINE_ENABLED)
+DOWNLOAD_PREFETCH_ENABLED = True
+
+# How long a folder listing is reused by the confirmation dialog; the download
+# step always lists the folder again so checksums are current
+DRIVE_LISTING_CACHE_SECONDS = 900
 
 # --- ACCOUNT MAPPING ---
 # Maps account codes to display names in Google Sheets
@@ -0,0 +1,49 @@
+# app/src/automation/api_clients/download_cache.py
+"""
+Download Cache Module
+Keeps Drive downloads across jobs so the same footage is only fetched once
+"""
+
+import json
+import hashlib
+from typing import Optional
+from ..video_processing.file_cache import FileCache
+from .config import DOWNLOAD_CACHE_ENABLED, DOWNLOAD_CACHE_DIR, DOWNLOAD_CACHE_MAX_GB
+
+class DownloadCache(FileCache):
+    """
+    Size-capped cache of downloaded Drive files
+    
+    Entries are keyed by the Drive file ID plus its md5Checksum (or
+    modifiedTime when Drive has no checksum), so a file edited on Drive gets a
+    new entry. Hits are hardlinked into the job's download folder.
+    """
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        super().__init__(
+            cache_dir or DOWNLOAD_CACHE_DIR,
+            max_bytes or int(DOWNLOAD_CACHE_MAX_GB * 1024 ** 3),
+            label="Download cache"
+        )
+    
+    def build_key(self, file_info: dict) -> Optional[str]:
+        """Build the cache key for a Drive listing entry (None if it has no version marker)"""
+        version = file_info.get('md5Checksum') or file_info.get('modifiedTime')
+        if not file_info.get('id') or not version:
+            return None
+        
+        key_data = {'file_id': file_info['id'], 'version': version}
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+# Shared instance so every download thread sees the same index and statistics
+_default_download_cache = None
+
+def get_download_cache() -> Optional[DownloadCache]:
+    """Get the shared download cache (None when disabled)"""
+    global _default_download_cache
+    if not DOWNLOAD_CACHE_ENABLED:
+        return None
+    if _default_download_cache is None:
+        _default_download_cache = DownloadCache()
+    return _default_download_cache
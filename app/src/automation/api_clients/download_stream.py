@@ -0,0 +1,208 @@
+# app/src/automation/api_clients/download_stream.py
+"""
+Download Stream Module
+Hands downloaded files to the consumer one at a time while the rest are still downloading
+"""
+
+import os
+import threading
+from typing import List, Optional, Tuple
+from ..video_processing.job_control import get_job_control
+
+class DownloadError(Exception):
+    """Raised when a file the consumer is waiting for can no longer arrive"""
+
+class DownloadStream:
+    """
+    Background downloads of one folder, consumed file by file
+    
+    Download threads call wait_for_slot() before starting a file and
+    mark_ready() when it is on disk. The consumer calls wait_for() for the
+    file it needs next and release() once it has rendered it. At most
+    max_ahead files are downloading or on disk waiting to be rendered, which
+    bounds the disk the downloads take ahead of encoding; 0 means no limit.
+    """
+    
+    # Seconds between cancellation checks while the consumer waits
+    POLL_INTERVAL = 1.0
+    
+    def __init__(self, local_paths: List[str], max_ahead: int = 0, progress=None, folder_url: str = None):
+        """
+        Args:
+            local_paths: Where each file will land, in listing order
+            max_ahead: Look-ahead limit in files (0 for none)
+            progress: Optional DownloadProgress the download threads report to
+            folder_url: Drive folder the files come from
+        """
+        if len(set(local_paths)) != len(local_paths):
+            # Ready files are tracked by path, so a repeated path would never complete
+            raise ValueError("DownloadStream needs a distinct local path per file")
+        self.local_paths = list(local_paths)
+        self.max_ahead = max_ahead
+        self.progress = progress
+        self.folder_url = folder_url
+        self._condition = threading.Condition()
+        self._ready = set()
+        self._released = set()
+        self._started = 0
+        self._error = None
+        self._cancelled = False
+        self._executor = None
+    
+    def attach(self, executor):
+        """Take ownership of the executor running the downloads"""
+        self._executor = executor
+    
+    # Consumer side
+    
+    def wait_for(self, local_path: str) -> str:
+        """
+        Block until one file is on disk
+        
+        Returns:
+            local_path, once it is complete
+        
+        Raises:
+            DownloadError: if a download failed or the stream was cancelled first
+        """
+        with self._condition:
+            while local_path not in self._ready and not self._error and not self._cancelled:
+                if not self._condition.wait(self.POLL_INTERVAL):
+                    get_job_control().check_cancelled()
+            
+            if local_path in self._ready:
+                return local_path
+            
+            raise DownloadError(self._error or "Downloads were cancelled")
+    
+    def wait_all(self) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Lift the look-ahead limit and block until every file is on disk
+        
+        Returns:
+            Tuple of (local paths in listing order, error_message)
+        """
+        with self._condition:
+            self.max_ahead = 0
+            self._condition.notify_all()
+            
+            while len(self._ready) < len(self.local_paths) and not self._error and not self._cancelled:
+                if not self._condition.wait(self.POLL_INTERVAL):
+                    get_job_control().check_cancelled()
+            
+            if self._error or len(self._ready) < len(self.local_paths):
+                return None, self._error or "Downloads were cancelled"
+            
+            return list(self.local_paths), None
+    
+    def release(self, local_path: str):
+        """Record that a file has been rendered, freeing its look-ahead slot"""
+        with self._condition:
+            if local_path in self._ready and local_path not in self._released:
+                self._released.add(local_path)
+                self._condition.notify_all()
+    
+    def is_ready(self, local_path: str) -> bool:
+        """Check whether a file is already on disk"""
+        with self._condition:
+            return local_path in self._ready
+    
+    def is_finished(self) -> bool:
+        """Check whether nothing more will arrive (all done, failed or cancelled)"""
+        with self._condition:
+            return len(self._ready) == len(self.local_paths) or bool(self._error) or self._cancelled
+    
+    def describe(self) -> str:
+        """One-line status for progress displays"""
+        with self._condition:
+            ready = len(self._ready)
+            error = self._error
+        
+        if error:
+            return f"Download failed: {error}"
+        if ready == len(self.local_paths):
+            return f"All {ready} files downloaded"
+        if self.progress:
+            return self.progress.describe()
+        return f"Downloaded {ready}/{len(self.local_paths)} files"
+    
+    def cancel(self):
+        """Stop the downloads; running ones stop after their current chunk"""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+    
+    def close(self, wait: bool = True):
+        """
+        Cancel the downloads and release the download threads
+        
+        Args:
+            wait: Block until running downloads have stopped (at most one chunk
+                each). With False the threads wind down in the background; a
+                later close() waits for them.
+        """
+        with self._condition:
+            pending = len(self._ready) < len(self.local_paths) and not self._error
+        if pending:
+            print("⏹️ Stopping background downloads...")
+        
+        self.cancel()
+        if self._executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            if wait:
+                self._executor = None
+    
+    # Producer side
+    
+    def is_cancelled(self) -> bool:
+        """Check whether download threads should stop"""
+        with self._condition:
+            return self._cancelled
+    
+    def commit(self, temp_path: str, local_path: str) -> bool:
+        """
+        Move a finished download into place unless the stream was cancelled
+        
+        Runs under the stream lock, so once cancel() has returned no new file
+        appears at a local path; a cancelled download keeps its temp file.
+        
+        Returns:
+            True if the file was moved into place
+        """
+        with self._condition:
+            if self._cancelled:
+                return False
+            os.replace(temp_path, local_path)
+            return True
+    
+    def wait_for_slot(self) -> bool:
+        """
+        Block until another download may start
+        
+        Returns:
+            False if the stream was cancelled or failed and the download should be skipped
+        """
+        with self._condition:
+            while (not self._cancelled and not self._error and self.max_ahead
+                   and self._started - len(self._released) >= self.max_ahead):
+                if not self._condition.wait(self.POLL_INTERVAL) and get_job_control().cancelled:
+                    self._cancelled = True
+            
+            if self._cancelled or self._error:
+                return False
+            
+            self._started += 1
+            return True
+    
+    def mark_ready(self, local_path: str):
+        """Record that a file is complete on disk"""
+        with self._condition:
+            self._ready.add(local_path)
+            self._condition.notify_all()
+    
+    def mark_failed(self, error: str):
+        """Record a failed download; nothing new starts after the first failure"""
+        with self._condition:
+            if not self._error:
+                self._error = error
+            self._condition.notify_all()
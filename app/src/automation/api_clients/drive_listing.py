@@ -0,0 +1,118 @@
+# app/src/automation/api_clients/drive_listing.py
+"""
+Drive Listing Module
+Complete, metadata-rich listing of the video files in a Drive folder
+"""
+
+import time
+import threading
+from typing import Dict, List
+from googleapiclient.discovery import build
+from .config import DRIVE_LISTING_CACHE_SECONDS
+
+# Everything the pipeline needs to plan a job before downloading anything
+LISTING_FIELDS = (
+    "nextPageToken, files(id, name, mimeType, size, md5Checksum, modifiedTime, "
+    "thumbnailLink, videoMediaMetadata(width, height, durationMillis))"
+)
+LISTING_PAGE_SIZE = 1000
+
+# Folder listings for this session; the download step bypasses them with refresh=True
+_listing_cache: Dict[str, tuple] = {}
+_listing_lock = threading.Lock()
+
+class DriveListingService:
+    """Lists every video in a folder, following nextPageToken until the end"""
+    
+    def __init__(self, credentials=None, service=None):
+        """
+        Args:
+            credentials: Google API credentials (used when no service is given)
+            service: Existing Drive v3 service to reuse
+        """
+        self.service = service or build("drive", "v3", credentials=credentials)
+    
+    def list_video_files(self, folder_id: str, refresh: bool = False) -> List[dict]:
+        """
+        Get all video files in a folder
+        
+        Args:
+            folder_id: Drive folder ID
+            refresh: Ignore the session cache and list again
+        
+        Returns:
+            List of file dicts with id, name, size, md5Checksum, modifiedTime,
+            thumbnailLink and videoMediaMetadata (when Drive has processed the video)
+        """
+        with _listing_lock:
+            cached = _listing_cache.get(folder_id)
+        if cached and not refresh and time.time() - cached[0] < DRIVE_LISTING_CACHE_SECONDS:
+            print(f"📁 Using cached listing: {len(cached[1])} video files")
+            return list(cached[1])
+        
+        query = f"'{folder_id}' in parents and mimeType contains 'video/'"
+        files = []
+        page_token = None
+        pages = 0
+        
+        while True:
+            results = self.service.files().list(
+                q=query,
+                fields=LISTING_FIELDS,
+                pageSize=LISTING_PAGE_SIZE,
+                pageToken=page_token
+            ).execute()
+            
+            files.extend(results.get("files", []))
+            pages += 1
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+        
+        print(f"📁 Found {len(files)} video files in folder ({pages} page(s))")
+        
+        with _listing_lock:
+            _listing_cache[folder_id] = (time.time(), files)
+        return list(files)
+    
+    @staticmethod
+    def summarize(files: List[dict]) -> Dict:
+        """
+        Totals for planning a job from the listing alone
+        
+        Returns:
+            Dict with file_count, total_bytes, total_duration (seconds, only
+            counting files Drive has metadata for), max_width, max_height and
+            missing_metadata (names of files without videoMediaMetadata)
+        """
+        summary = {
+            'file_count': len(files),
+            'total_bytes': 0,
+            'total_duration': 0.0,
+            'max_width': 0,
+            'max_height': 0,
+            'missing_metadata': []
+        }
+        
+        for file_info in files:
+            summary['total_bytes'] += int(file_info.get('size', 0))
+            
+            metadata = file_info.get('videoMediaMetadata')
+            if not metadata:
+                summary['missing_metadata'].append(file_info.get('name'))
+                continue
+            
+            summary['total_duration'] += int(metadata.get('durationMillis', 0)) / 1000
+            summary['max_width'] = max(summary['max_width'], int(metadata.get('width', 0)))
+            summary['max_height'] = max(summary['max_height'], int(metadata.get('height', 0)))
+        
+        return summary
+
+
+def clear_listing_cache(folder_id: str = None):
+    """Forget cached listings (one folder, or all of them)"""
+    with _listing_lock:
+        if folder_id:
+            _listing_cache.pop(folder_id, None)
+        else:
+            _listing_cache.clear()
@@ -5,11 +5,110 @@ Handles file downloads from Google Drive folders
 """
 
 import os
-from typing import List, Optional, Tuple
+import json
+import time
+import random
+import hashlib
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import httplib2
+import google_auth_httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
-from .config import DOWNLOADS_DIR, DOWNLOAD_TIMEOUT
+from .config import (
+    DOWNLOADS_DIR, DOWNLOAD_TIMEOUT, DOWNLOAD_WORKERS, DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_RETRIES, DOWNLOAD_BACKOFF_SECONDS, DOWNLOAD_MAX_BACKOFF_SECONDS,
+    DOWNLOAD_PIPELINE_MAX_AHEAD
+)
+from .download_cache import get_download_cache
+from .drive_listing import DriveListingService
+from .download_stream import DownloadStream
+from ..video_processing.content_hasher import get_content_hasher
+
+# HTTP statuses worth retrying; anything else (404, permission errors) fails at once
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+# Drive also throttles with a 403 carrying one of these reasons; other 403s are permission errors
+RETRYABLE_403_REASONS = {'userRateLimitExceeded', 'rateLimitExceeded'}
+
+def is_retryable_http_error(error: HttpError) -> bool:
+    """Check whether a Drive HTTP error is throttling or a server fault rather than a refusal"""
+    status = getattr(error.resp, 'status', None)
+    if status in RETRYABLE_STATUSES:
+        return True
+    return status == 403 and bool(_error_reasons(error) & RETRYABLE_403_REASONS)
+
+def _error_reasons(error: HttpError) -> set:
+    """The error.errors[].reason values of a Drive error response"""
+    try:
+        content = error.content.decode('utf-8') if isinstance(error.content, bytes) else error.content
+        details = json.loads(content).get('error', {})
+        return {item.get('reason') for item in details.get('errors', [])}
+    except (ValueError, AttributeError, TypeError):
+        return set()
+
+class ChecksumMismatchError(Exception):
+    """Raised when a downloaded file does not match Drive's md5Checksum"""
+
+class DownloadCancelled(Exception):
+    """Raised inside a download when its stream was cancelled"""
+
+class DownloadProgress:
+    """Aggregates byte counts from concurrent downloads into one progress line"""
+    
+    # Minimum seconds between monitor updates
+    REPORT_INTERVAL = 2.0
+    
+    def __init__(self, files: List[dict], monitor=None):
+        self.monitor = monitor
+        self.total_bytes = sum(int(f.get('size', 0)) for f in files)
+        self.total_files = len(files)
+        self.completed_files = 0
+        self._bytes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_report = 0.0
+    
+    def update(self, file_id: str, downloaded_bytes: int):
+        """Record how many bytes of a file have arrived"""
+        with self._lock:
+            self._bytes[file_id] = downloaded_bytes
+        self._report()
+    
+    def complete(self, file_id: str, file_name: str, file_size: int):
+        """Record a finished file"""
+        with self._lock:
+            self._bytes[file_id] = file_size
+            self.completed_files += 1
+        self._report(f"Completed: {file_name}", force=True)
+    
+    def describe(self) -> str:
+        """One-line summary of the downloads so far"""
+        with self._lock:
+            downloaded = sum(self._bytes.values())
+            completed = self.completed_files
+        
+        percent = int(downloaded / self.total_bytes * 100) if self.total_bytes else 0
+        return (f"Downloading {completed}/{self.total_files} files: {percent}% "
+                f"({downloaded / (1024 ** 3):.2f}/{self.total_bytes / (1024 ** 3):.2f} GB)")
+    
+    def _report(self, prefix: str = None, force: bool = False):
+        """Send the aggregate progress to the monitor, throttled"""
+        with self._lock:
+            now = time.time()
+            if not force and now - self._last_report < self.REPORT_INTERVAL:
+                return
+            self._last_report = now
+        
+        message = self.describe()
+        if prefix:
+            message = f"{prefix} - {message}"
+        
+        print(f"📥 {message}")
+        if self.monitor:
+            # Kept apart from render heartbeats so downloads can't mask a stalled render
+            self.monitor.update_download_activity(message)
+
 
 class GoogleDriveClient:
     """Handles Google Drive API operations"""
@@ -23,6 +122,8 @@ class GoogleDriveClient:
         """
         self.credentials = credentials
         self.service = None
+        # httplib2 is not thread-safe, so every download thread builds its own service
+        self._thread_local = threading.local()
         if credentials:
             try:
                 self.service = build("drive", "v3", credentials=credentials)
@@ -45,49 +146,14 @@ class GoogleDriveClient:
             return None, "Google Drive service not initialized"
         
         try:
-            if monitor:
-                monitor.update_activity("Connecting to Google Drive...")
-            
-            # Extract folder ID from URL
-            folder_id = self._extract_folder_id(folder_url)
-            if not folder_id:
-                return None, "Could not extract folder ID from Google Drive URL"
-            
-            # Create downloads directory
-            os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-            
-            if monitor:
-                monitor.update_activity("Searching for video files...")
-            
-            # Get list of video files in folder
-            video_files = self._get_video_files(folder_id)
+            video_files, error = self._find_video_files(folder_url, monitor)
+            if error:
+                return None, error
             
-            if not video_files:
-                return None, "No video files found in the Google Drive folder"
-            
-            if monitor:
-                monitor.update_activity(f"Found {len(video_files)} video files to download")
-            
-            # Download each file
-            downloaded_files = []
-            for i, file_info in enumerate(video_files):
-                file_id = file_info['id']
-                file_name = file_info['name']
-                file_size = int(file_info.get('size', 0))
-                
-                local_path = os.path.join(DOWNLOADS_DIR, file_name)
-                
-                if monitor:
-                    monitor.update_activity(f"Starting download: {file_name}")
-                
-                success = self._download_single_file(file_id, file_name, local_path, monitor)
-                
-                if success:
-                    downloaded_files.append(local_path)
-                    if monitor:
-                        monitor.update_activity(f"Completed: {file_name} ({i+1}/{len(video_files)})")
-                else:
-                    return None, f"Failed to download file: {file_name}"
+            # Download several files at once
+            downloaded_files, error = self._download_files(video_files, monitor)
+            if error:
+                return None, error
             
             if monitor:
                 monitor.update_activity(f"All downloads completed: {len(downloaded_files)} files")
@@ -103,6 +169,75 @@ class GoogleDriveClient:
             print(f"❌ {error_msg}")
             return None, error_msg
     
+    def start_folder_download(self, folder_url: str, monitor=None, order: Callable = None,
+                              on_ready: Callable = None) -> Tuple[Optional[DownloadStream], Optional[str]]:
+        """
+        Start downloading a folder in the background and return immediately
+        
+        Files download in the order the consumer will use them, and at most
+        DOWNLOAD_PIPELINE_MAX_AHEAD files are downloading or waiting to be
+        rendered at any time.
+        
+        Args:
+            folder_url: Google Drive folder URL
+            monitor: Optional activity monitor for progress updates
+            order: Optional function that sorts local paths into consumption order
+            on_ready: Optional callback run in the download thread with each finished path
+        
+        Returns:
+            Tuple of (DownloadStream, error_message)
+        """
+        if not self.service:
+            return None, "Google Drive service not initialized"
+        
+        try:
+            video_files, error = self._find_video_files(folder_url, monitor)
+            if error:
+                return None, error
+            
+            stream = self._start_download(
+                video_files, monitor, order=order, on_ready=on_ready,
+                max_ahead=DOWNLOAD_PIPELINE_MAX_AHEAD
+            )
+            stream.folder_url = folder_url
+            return stream, None
+        
+        except HttpError as e:
+            error_msg = f"Google Drive API error: {e}"
+            print(f"❌ {error_msg}")
+            return None, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected download error: {e}"
+            print(f"❌ {error_msg}")
+            return None, error_msg
+    
+    def _find_video_files(self, folder_url: str, monitor=None) -> Tuple[Optional[List[dict]], Optional[str]]:
+        """List the folder's video files and create the downloads directory"""
+        if monitor:
+            monitor.update_activity("Connecting to Google Drive...")
+        
+        # Extract folder ID from URL
+        folder_id = self._extract_folder_id(folder_url)
+        if not folder_id:
+            return None, "Could not extract folder ID from Google Drive URL"
+        
+        # Create downloads directory
+        os.makedirs(DOWNLOADS_DIR, exist_ok=True)
+        
+        if monitor:
+            monitor.update_activity("Searching for video files...")
+        
+        # Get list of video files in folder
+        video_files = self._get_video_files(folder_id)
+        
+        if not video_files:
+            return None, "No video files found in the Google Drive folder"
+        
+        if monitor:
+            monitor.update_activity(f"Found {len(video_files)} video files to download")
+        
+        return video_files, None
+    
     def _extract_folder_id(self, folder_url: str) -> Optional[str]:
         """Extract folder ID from Google Drive URL"""
         try:
@@ -115,65 +250,286 @@ class GoogleDriveClient:
         return None
     
     def _get_video_files(self, folder_id: str) -> List[dict]:
-        """Get list of video files in the folder"""
+        """Get list of video files in the folder (every page)"""
         try:
-            query = f"'{folder_id}' in parents and mimeType contains 'video/'"
-            results = self.service.files().list(
-                q=query, 
-                fields="files(id, name, size)"
-            ).execute()
-            
-            files = results.get("files", [])
-            print(f"📁 Found {len(files)} video files in folder")
-            
-            return files
+            # Listed fresh: a file replaced while the confirmation dialog was open
+            # has a new md5Checksum, and a stale one would fail every download retry
+            return DriveListingService(service=self.service).list_video_files(folder_id, refresh=True)
             
         except Exception as e:
             print(f"❌ Error getting file list: {e}")
             return []
     
-    def _download_single_file(self, file_id: str, file_name: str, local_path: str, monitor=None) -> bool:
+    def _download_files(self, video_files: List[dict], monitor=None) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Download files concurrently with DOWNLOAD_WORKERS threads
+        
+        Returns:
+            Tuple of (local paths in listing order, error_message)
+        """
+        stream = self._start_download(video_files, monitor)
+        try:
+            with monitor.waiting_for_downloads() if monitor else nullcontext():
+                local_paths, error = stream.wait_all()
+        finally:
+            stream.close()
+        
+        cache = get_download_cache()
+        if cache:
+            cache.print_stats()
+        return local_paths, error
+    
+    def _start_download(self, video_files: List[dict], monitor=None, order: Callable = None,
+                        on_ready: Callable = None, max_ahead: int = 0) -> DownloadStream:
+        """
+        Queue every file on DOWNLOAD_WORKERS threads
+        
+        Returns:
+            DownloadStream whose local_paths are in listing order
+        """
+        progress = DownloadProgress(video_files, monitor)
+        local_paths = self._local_paths(video_files)
+        stream = DownloadStream(local_paths, max_ahead, progress=progress)
+        
+        files_by_path = dict(zip(local_paths, video_files))
+        download_order = order(list(local_paths)) if order else local_paths
+        
+        workers = max(1, min(DOWNLOAD_WORKERS, len(video_files)))
+        print(f"📥 Downloading {len(video_files)} files with {workers} workers...")
+        
+        # Footage already fetched by an earlier job is linked in instead of downloaded
+        cache = get_download_cache()
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        for local_path in download_order:
+            executor.submit(
+                self._download_for_stream, stream, files_by_path[local_path],
+                local_path, progress, cache, on_ready
+            )
+        stream.attach(executor)
+        return stream
+    
+    def _local_paths(self, video_files: List[dict]) -> List[str]:
+        """
+        Pick a distinct local path for every listed file
+        
+        Drive allows several files with the same name in a folder. The first
+        keeps DOWNLOADS_DIR/<name>; later ones go to DOWNLOADS_DIR/<file id>/<name>
+        so the file name (and the version letter in it) stays unchanged.
+        """
+        local_paths = []
+        taken = set()
+        for file_info in video_files:
+            local_path = os.path.join(DOWNLOADS_DIR, file_info['name'])
+            if local_path in taken:
+                local_path = os.path.join(DOWNLOADS_DIR, file_info['id'], file_info['name'])
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                print(f"⚠️ Duplicate file name in folder: {file_info['name']} (saved under {file_info['id']}/)")
+            taken.add(local_path)
+            local_paths.append(local_path)
+        return local_paths
+    
+    def _download_for_stream(self, stream: DownloadStream, file_info: dict, local_path: str,
+                             progress: DownloadProgress, cache, on_ready: Callable = None):
+        """Fetch one file (from the download cache or Drive) and hand it to the stream"""
+        try:
+            if not stream.wait_for_slot():
+                return
+            
+            file_size = int(file_info.get('size', 0))
+            cache_key = cache.build_key(file_info) if cache else None
+            
+            # A cache hit goes through the .part name too, so a cancelled stream never gains a file
+            part_path = f"{local_path}.part"
+            if cache_key and cache.fetch(cache_key, part_path):
+                if not stream.commit(part_path, local_path):
+                    return
+            else:
+                if not self._download_single_file(
+                    file_info['id'], file_info['name'], local_path, progress,
+                    file_size or None, file_info.get('md5Checksum'), stream
+                ):
+                    if not stream.is_cancelled():
+                        stream.mark_failed(f"Failed to download file: {file_info['name']}")
+                    return
+                if cache_key:
+                    cache.store(cache_key, local_path)
+            
+            progress.complete(file_info['id'], file_info['name'], file_size)
+            self._remember_content_id(file_info, local_path)
+            
+            if on_ready:
+                try:
+                    on_ready(local_path)
+                except Exception as e:
+                    print(f"⚠️ Post-download step failed for {file_info['name']}: {e}")
+            
+            stream.mark_ready(local_path)
+        
+        except Exception as e:
+            stream.mark_failed(f"Failed to download file: {file_info['name']} ({e})")
+    
+    def _remember_content_id(self, file_info: dict, local_path: str):
+        """
+        Identify a downloaded file by its Drive md5Checksum
+        
+        The download was verified against the checksum (or restored from a
+        cache entry keyed by it), so render fingerprints can use it instead
+        of reading the whole file again. The file ID is left out: the render
+        cache should also hit for the same footage copied into another
+        card's folder.
+        """
+        if not file_info.get('md5Checksum'):
+            return
+        get_content_hasher().remember(local_path, f"drive-md5:{file_info['md5Checksum']}")
+    
+    def _get_thread_service(self):
+        """Get this thread's Drive service, with its own authorized HTTP connection"""
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=DOWNLOAD_TIMEOUT)
+            )
+            service = build("drive", "v3", http=http, cache_discovery=False)
+            self._thread_local.service = service
+        return service
+    
+    def _download_single_file(self, file_id: str, file_name: str, local_path: str,
+                              progress: DownloadProgress = None, file_size: int = None,
+                              md5_checksum: str = None, stream: DownloadStream = None) -> bool:
         """
         Download a single file from Google Drive
         
+        Bytes go to local_path + '.part'. A failed attempt keeps the bytes it
+        received and the next one resumes with a Range request, backing off
+        exponentially, up to DOWNLOAD_MAX_RETRIES retries. The file is renamed
+        into place only after it matches Drive's md5Checksum. If the stream is
+        cancelled the download stops after the current chunk and the .part
+        file stays for the next attempt.
+        
         Args:
             file_id: Google Drive file ID
             file_name: Name of the file
             local_path: Local path to save the file
-            monitor: Optional activity monitor
+            progress: Optional aggregate progress shared by concurrent downloads
+            file_size: Size reported by the folder listing
+            md5_checksum: Checksum reported by the folder listing
+            stream: Optional DownloadStream whose cancellation stops the download
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (including cancelled)
         """
+        part_path = f"{local_path}.part"
         
-        try:
-            print(f"📥 Downloading {file_name}...")
+        for attempt in range(DOWNLOAD_MAX_RETRIES + 1):
+            if stream and stream.is_cancelled():
+                print(f"⏹️ Stopped {file_name} - partial download kept for resuming")
+                return False
+            if attempt:
+                delay = min(DOWNLOAD_MAX_BACKOFF_SECONDS, DOWNLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                delay *= random.uniform(0.8, 1.2)
+                print(f"🔁 Retrying {file_name} in {delay:.1f}s (retry {attempt}/{DOWNLOAD_MAX_RETRIES})")
+                time.sleep(delay)
             
-            request = self.service.files().get_media(fileId=file_id)
+            try:
+                self._download_to_part(file_id, file_name, part_path, file_size, progress, stream)
+                self._verify_checksum(part_path, md5_checksum)
+                if stream:
+                    if not stream.commit(part_path, local_path):
+                        print(f"⏹️ Stopped {file_name} - complete download kept for resuming")
+                        return False
+                else:
+                    os.replace(part_path, local_path)
+                print(f"✅ Downloaded: {file_name}")
+                return True
             
-            with open(local_path, "wb") as f:
-                downloader = MediaIoBaseDownload(f, request)
-                done = False
-                last_progress = 0
+            except DownloadCancelled:
+                print(f"⏹️ Stopped {file_name} - partial download kept for resuming")
+                return False
+            except ChecksumMismatchError as e:
+                # The bytes on disk are wrong, so resuming would keep them; start over
+                print(f"❌ {file_name}: {e}")
+                self._remove_part(part_path)
+            except HttpError as e:
+                if not is_retryable_http_error(e):
+                    print(f"❌ Failed to download {file_name}: {e}")
+                    return False
+                print(f"⚠️ Download of {file_name} interrupted: HTTP {getattr(e.resp, 'status', None)}")
+            except Exception as e:
+                print(f"⚠️ Download of {file_name} interrupted: {e}")
+        
+        print(f"❌ Failed to download {file_name} after {DOWNLOAD_MAX_RETRIES} retries")
+        return False
+    
+    def _download_to_part(self, file_id: str, file_name: str, part_path: str,
+                          file_size: Optional[int], progress: DownloadProgress = None,
+                          stream: DownloadStream = None):
+        """Fetch the bytes the .part file is missing, one ranged request per chunk"""
+        request = self._get_thread_service().files().get_media(fileId=file_id)
+        
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if file_size and offset > file_size:
+            self._remove_part(part_path)
+            offset = 0
+        
+        if offset:
+            print(f"📥 Resuming {file_name} at {offset / (1024 ** 2):.0f} MB...")
+        else:
+            print(f"📥 Downloading {file_name}...")
+        
+        with open(part_path, "ab") as f:
+            while not file_size or offset < file_size:
+                if stream and stream.is_cancelled():
+                    raise DownloadCancelled()
                 
-                while not done:
-                    status, done = downloader.next_chunk()
-                    if status:
-                        progress = int(status.progress() * 100)
-                        
-                        # Update progress every 5% or when done
-                        if progress - last_progress >= 5 or done:
-                            if monitor:
-                                monitor.update_activity(f"Downloading {file_name}: {progress}%")
-                            print(f"Download {progress}%")
-                            last_progress = progress
-            
-            print(f"✅ Downloaded: {file_name}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to download {file_name}: {e}")
-            return False
+                headers = dict(request.headers)
+                headers['range'] = f"bytes={offset}-{offset + DOWNLOAD_CHUNK_SIZE - 1}"
+                response, content = request.http.request(request.uri, method="GET", headers=headers)
+                
+                if response.status == 416:
+                    # Asked past the end: the file is complete
+                    break
+                if response.status not in (200, 206):
+                    raise HttpError(response, content, uri=request.uri)
+                if response.status == 200 and offset:
+                    # The server ignored the range and sent the whole file
+                    f.seek(0)
+                    f.truncate()
+                    offset = 0
+                
+                f.write(content)
+                offset += len(content)
+                if progress:
+                    progress.update(file_id, offset)
+                
+                if response.status == 200 or not content:
+                    break
+                if not file_size:
+                    # Size unknown up front; Content-Range carries it as "bytes a-b/total"
+                    total = response.get('content-range', '').rpartition('/')[2]
+                    file_size = int(total) if total.isdigit() else None
+                    if file_size is None and len(content) < DOWNLOAD_CHUNK_SIZE:
+                        break
+    
+    def _verify_checksum(self, part_path: str, md5_checksum: Optional[str]):
+        """Compare the downloaded bytes with Drive's md5Checksum"""
+        if not md5_checksum:
+            return
+        
+        md5 = hashlib.md5()
+        with open(part_path, "rb") as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                md5.update(block)
+        
+        if md5.hexdigest() != md5_checksum:
+            raise ChecksumMismatchError(f"md5 {md5.hexdigest()} does not match Drive's {md5_checksum}")
+    
+    def _remove_part(self, part_path: str):
+        """Delete a .part file, ignoring one that is already gone"""
+        try:
+            os.remove(part_path)
+        except FileNotFoundError:
+            pass
     
     def cleanup_downloads(self):
         """Clean up downloaded files"""
@@ -1,9 +1,10 @@
 # app/src/automation/api_clients/google_sheets_client.py - ADDED CUSTOM COLUMN 1 SUPPORT
 
-import gspread
-from typing import List, Optional, Tuple
-from .config import GOOGLE_SHEET_ID
+import re
+from typing import Callable, List, Optional, Tuple
 from .account_mapper import AccountMapper
+from .sheets_session import get_sheets_session
+from .config import SHEETS_ROW_WINDOW
 
 class GoogleSheetsClient:
     """Handles Google Sheets API operations - ENHANCED with custom column 1 names"""
@@ -18,14 +19,14 @@ class GoogleSheetsClient:
         self.credentials = credentials
         self.client = None
         self.spreadsheet = None
+        self.session = None
         self.account_mapper = AccountMapper()
         
         if credentials:
-            try:
-                self.client = gspread.authorize(credentials)
-                self.spreadsheet = self.client.open_by_key(GOOGLE_SHEET_ID)
-            except Exception as e:
-                print(f"❌ Failed to initialize Google Sheets client: {e}")
+            # Authorization, the spreadsheet handle and the worksheet list are shared across clients
+            self.session = get_sheets_session(credentials)
+            self.spreadsheet = self.session.get_spreadsheet()
+            self.client = self.session.client
     
     def write_to_sheet(self, concept_name: str, data_rows: List[List], credentials) -> Tuple[Optional[str], int]:
         """
@@ -84,6 +85,8 @@ class GoogleSheetsClient:
                 return None, start_version
                 
             except Exception as insert_error:
+                # The cached worksheet may be stale (renamed, deleted, resized)
+                self.session.invalidate_worksheets()
                 # Don't hide insertion errors - report them properly
                 error_msg = f"Failed to insert data into Google Sheets: {insert_error}"
                 print(f"❌ {error_msg}")
@@ -114,9 +117,9 @@ class GoogleSheetsClient:
             
             print(f"🔍 SHEETS CLIENT - Account: '{account_code}', Platform: '{platform_code}'")
             
-            # Get all worksheet titles
-            worksheets = self.spreadsheet.worksheets()
-            worksheet_titles = [ws.title for ws in worksheets]
+            # Get all worksheet titles (cached by the session)
+            worksheets = self.session.get_worksheet_map()
+            worksheet_titles = list(worksheets)
             
             print(f"📋 Available worksheets: {worksheet_titles}")
             
@@ -127,14 +130,47 @@ class GoogleSheetsClient:
             
             if target_worksheet:
                 print(f"✅ EXACT MATCH FOUND: '{target_worksheet}'")
-                return self.spreadsheet.worksheet(target_worksheet), None
+                return worksheets[target_worksheet], None
             else:
                 print(f"⚠️ No exact match found, using first worksheet: '{worksheet_titles[0]}'")
-                return self.spreadsheet.worksheet(worksheet_titles[0]), None
+                return worksheets[worksheet_titles[0]], None
                 
         except Exception as e:
+            self.session.invalidate()
             return None, f"Error finding worksheet: {e}"
     
+    def resolve_worksheet(self, routing_name: str, account_code: str = None,
+                          platform_code: str = None) -> Tuple[Optional[object], Optional[str]]:
+        """
+        Find the worksheet for a write, by exact account/platform when known
+        
+        Args:
+            routing_name: Card title, used when the codes are not known
+            account_code: Detected account code (e.g. "BC3")
+            platform_code: Detected platform code (e.g. "FB")
+        
+        Returns:
+            Tuple of (worksheet_object, error_message)
+        """
+        if not (account_code and platform_code):
+            return self.find_correct_worksheet(routing_name)
+        
+        if not self.spreadsheet:
+            return None, "Google Sheets not initialized"
+        
+        try:
+            worksheets = self.session.get_worksheet_map()
+            target_worksheet = self.account_mapper.find_exact_worksheet_match(
+                list(worksheets), account_code, platform_code
+            )
+        except Exception as e:
+            self.session.invalidate()
+            return None, f"Error finding worksheet: {e}"
+        
+        if not target_worksheet:
+            return None, f"No worksheet found for {account_code} - {platform_code}"
+        return worksheets[target_worksheet], None
+    
     def _insert_project_data_with_custom_name(self, worksheet, column1_name: str, data_rows: List[List]) -> int:
         """
         ENHANCED: Insert project data with custom column 1 name
@@ -152,69 +188,11 @@ class GoogleSheetsClient:
         """
         
         try:
-            # Find absolute last row with any content
-            all_values = worksheet.get_all_values()
-            last_content_row = 0
-            for i, row in enumerate(all_values):
-                if any(cell.strip() for cell in row if cell):
-                    last_content_row = i + 1
-            
-            # Always insert at end
-            insert_row_index = last_content_row + 1
-            print(f"📝 Adding new project '{column1_name}' at row {insert_row_index}")
-            
             # Get starting version number (simplified for now)
             start_version = 1
             
-            # Prepare data with correct column structure using CUSTOM column 1 name
-            rows_to_insert = []
-            for i, row in enumerate(data_rows):
-                if i == 0:
-                    # First row gets CUSTOM column 1 name (folder name, not card title)
-                    rows_to_insert.append([column1_name] + row)
-                else:
-                    # Subsequent rows have empty column A
-                    rows_to_insert.append([""] + row)
-            
-            print(f"📝 Inserting {len(rows_to_insert)} rows with column 1 name: '{column1_name}'")
-            
-            # Use batch update which is more reliable and provides better error reporting
-            try:
-                # Prepare the range for batch update
-                end_col_letter = chr(ord('A') + len(rows_to_insert[0]) - 1)  # A, B, C, D etc.
-                end_row = insert_row_index + len(rows_to_insert) - 1
-                range_name = f"A{insert_row_index}:{end_col_letter}{end_row}"
-                
-                print(f"📝 Batch updating range: {range_name}")
-                
-                # Perform batch update
-                worksheet.update(range_name, rows_to_insert)
-                
-                print(f"✅ Batch update successful for {len(rows_to_insert)} rows")
-                
-            except Exception as batch_error:
-                print(f"❌ Batch update failed: {batch_error}")
-                print(f"🔄 Falling back to individual cell updates...")
-                
-                # Fallback: individual cell updates with detailed error reporting
-                for row_offset, row_data in enumerate(rows_to_insert):
-                    current_row = insert_row_index + row_offset
-                    for col_offset, cell_value in enumerate(row_data):
-                        if cell_value:  # Only write non-empty cells
-                            try:
-                                worksheet.update_cell(current_row, col_offset + 1, str(cell_value))
-                            except Exception as cell_error:
-                                error_msg = f"Failed to update cell ({current_row}, {col_offset + 1}): {cell_error}"
-                                print(f"❌ {error_msg}")
-                                raise Exception(error_msg)
-                
-                print(f"✅ Individual cell updates completed for {len(rows_to_insert)} rows")
-            
-            # Apply formatting (don't fail if formatting fails)
-            try:
-                self._apply_project_formatting(worksheet, insert_row_index, len(rows_to_insert))
-            except Exception as format_error:
-                print(f"⚠️ Warning: Could not apply formatting: {format_error}")
+            print(f"📝 Inserting {len(data_rows)} rows with column 1 name: '{column1_name}'")
+            self.write_project_blocks(worksheet, [(column1_name, data_rows)])
             
             return start_version
             
@@ -224,56 +202,221 @@ class GoogleSheetsClient:
             print(f"❌ {error_msg}")
             raise Exception(error_msg)
     
-    def _apply_project_formatting(self, worksheet, start_row: int, num_rows: int):
+    def write_project_blocks(self, worksheet, blocks: List[Tuple[str, List[List]]],
+                             on_placed: Callable[[int], None] = None) -> List[int]:
         """
-        Apply professional formatting to the inserted project data
+        Append project blocks below the last content row, then format them
+        
+        The rows go out in one spreadsheets.values.append anchored on the last
+        content row. The server places them after the table that row belongs
+        to, so a stale row record or another writer appending at the same time
+        cannot put two blocks on the same rows. Borders and the column A merge
+        follow in one batchUpdate at the range the append reports.
         
         Args:
-            worksheet: Google Sheets worksheet
-            start_row: Starting row index
-            num_rows: Number of rows to format
+            worksheet: Google Sheets worksheet object
+            blocks: (column 1 name, data rows) per project, in sheet order
+            on_placed: Called with the anchor row before anything is sent; the
+                blocks land below it, so a caller can later find_block() them
+        
+        Returns:
+            First row of each block
+        
+        Raises:
+            Exception: If the append fails
         """
+        # Prepare data with correct column structure using CUSTOM column 1 name
+        block_rows = []
+        for column1_name, data_rows in blocks:
+            # First row gets CUSTOM column 1 name (folder name, not card title),
+            # subsequent rows have empty column A
+            block_rows.append(
+                [[column1_name if i == 0 else ""] + row for i, row in enumerate(data_rows)]
+            )
+        
+        # Only an anchor: the append itself finds the end of the table below it
+        anchor_row = self._find_last_content_row(worksheet)
+        if on_placed:
+            on_placed(anchor_row)
+        
+        first_name = blocks[0][0]
+        all_rows = [row for rows in block_rows for row in rows]
+        print(f"📝 Appending {len(all_rows)} rows for {len(blocks)} project(s) below row {anchor_row}")
+        # An append is not idempotent: a resend first checks whether the rows landed
+        response = self.session.append_rows(
+            worksheet, all_rows, anchor_row,
+            is_applied=lambda: self.find_block(worksheet, anchor_row, first_name) is not None
+        )
+        if response:
+            first_row = self._first_row_of(response['updates']['updatedRange'])
+        else:
+            first_row = self.find_block(worksheet, anchor_row, first_name)
+            if first_row is None:
+                raise Exception(f"Appended rows for '{first_name}' not found below row {anchor_row}")
+        
+        start_rows = []
+        next_row = first_row
+        for (column1_name, _), rows in zip(blocks, block_rows):
+            print(f"📝 Added new project '{column1_name}' at row {next_row}")
+            start_rows.append(next_row)
+            next_row += len(rows)
+        end_row = next_row - 1
+        
+        requests = []
+        for start_row, rows in zip(start_rows, block_rows):
+            requests.extend(self._build_project_block_requests(worksheet, start_row, rows))
         
         try:
-            end_row = start_row + num_rows - 1
-            
-            # Apply top border
-            top_border_range = f'A{start_row}:D{start_row}'
-            worksheet.format(top_border_range, {
-                "borders": {
-                    "top": {"style": "SOLID_THICK", "color": {"red": 0, "green": 0, "blue": 0}}
-                }
-            })
+            # Formatting is idempotent, so an interrupted attempt is simply resent
+            self.session.batch_update(requests, is_applied=lambda: False)
+            print(f"✅ Appended and formatted rows {first_row}-{end_row}")
+        except Exception as e:
+            # The rows are in; failing here would only get them appended again
+            print(f"⚠️ Rows {first_row}-{end_row} were written but not formatted: {e}")
+        
+        if end_row > worksheet.row_count:
+            # The append grew the sheet; the cached worksheet still reports the old row count
+            self.session.invalidate_worksheets()
+        self.session.set_last_row(worksheet, end_row)
+        
+        return start_rows
+    
+    def find_block(self, worksheet, below_row: int, column1_name: str) -> Optional[int]:
+        """
+        Find a project block appended below a row (a write that may have landed)
+        
+        Reads column A only, from below_row + 1 down
+        
+        Returns:
+            The block's first row, or None if it is not there
+        """
+        first_row = below_row + 1
+        rows = worksheet.get(f"A{first_row}:A")
+        for offset, row in enumerate(rows):
+            if row and str(row[0]).strip() == column1_name.strip():
+                return first_row + offset
+        return None
+    
+    def _first_row_of(self, a1_range: str) -> int:
+        """First row of an A1 range such as 'Sheet 1'!A120:K135"""
+        match = re.match(r"[A-Za-z]*(\d+)", a1_range.rsplit('!', 1)[-1])
+        if not match:
+            raise Exception(f"Unexpected range in append response: {a1_range}")
+        return int(match.group(1))
+    
+    def _find_last_content_row(self, worksheet) -> int:
+        """
+        Find the row the next append is anchored on
+        
+        Starts from the row recorded after the previous insert and reads only
+        the rows below it, so the cost does not grow with the sheet. Without a
+        usable record (first insert, or the recorded row is empty now) only
+        column A is read: every block starts with its name there, and the
+        append finds the rest of that block's table on its own.
+        
+        Returns:
+            1-based row number, 0 for an empty sheet
+        """
+        known_last = self.session.get_last_row(worksheet)
+        if known_last:
+            last_row = self._scan_below(worksheet, known_last)
+            if last_row is not None:
+                return last_row
+            print(f"🔄 Recorded last row {known_last} of '{worksheet.title}' is stale - rereading column A")
+        
+        column_a = worksheet.col_values(1)
+        last_content_row = 0
+        for i, value in enumerate(column_a):
+            if str(value).strip():
+                last_content_row = i + 1
+        
+        self.session.set_last_row(worksheet, last_content_row)
+        return last_content_row
+    
+    def _scan_below(self, worksheet, known_last: int) -> Optional[int]:
+        """
+        Read from the recorded last row downward, SHEETS_ROW_WINDOW whole rows per request
+        
+        A window that ends in empty rows does not end the scan, since content can
+        resume below a gap; reading stops at the first window with no content at
+        all, or at the bottom of the grid.
+        
+        Returns:
+            The last content row, or None if the recorded row itself is empty
+        """
+        start = known_last
+        last_row = known_last
+        
+        while start <= worksheet.row_count:
+            end = start + SHEETS_ROW_WINDOW - 1
+            # Whole rows, so content in any column counts
+            rows = worksheet.get(f"{start}:{end}")
             
-            # Apply bottom border
-            bottom_border_range = f'A{end_row}:D{end_row}'
-            worksheet.format(bottom_border_range, {
-                "borders": {
-                    "bottom": {"style": "SOLID_THICK", "color": {"red": 0, "green": 0, "blue": 0}}
-                }
-            })
+            if start == known_last and not (rows and self._row_has_content(rows[0])):
+                return None
             
-            # Merge and format column A for project name (if multiple rows)
-            if num_rows > 1:
-                try:
-                    merge_range = f'A{start_row}:A{end_row}'
-                    worksheet.merge_cells(merge_range)
-                    
-                    # Apply vertical alignment, horizontal alignment, and text wrapping
-                    worksheet.format(merge_range, {
-                        "verticalAlignment": "MIDDLE",
-                        "horizontalAlignment": "CENTER",
-                        "wrapStrategy": "WRAP",
-                        "textFormat": {"bold": False}
-                    })
-                    
-                    print(f"✅ Applied formatting with merged cells, borders, and horizontal centering")
-                    
-                except Exception as format_error:
-                    print(f"⚠️ Warning: Could not apply cell formatting: {format_error}")
+            window_last = None
+            for offset, row in enumerate(rows):
+                if self._row_has_content(row):
+                    window_last = start + offset
+            if window_last is None:
+                break
             
-        except Exception as e:
-            print(f"⚠️ Warning: Could not apply formatting: {e}")
+            last_row = window_last
+            start = end + 1
+        
+        return last_row
+    
+    def _row_has_content(self, row: List) -> bool:
+        """Check whether any cell of a row holds something other than whitespace"""
+        return any(str(cell).strip() for cell in row if cell)
+    
+    def _build_project_block_requests(self, worksheet, start_row: int, rows: List[List]) -> List[dict]:
+        """
+        Build the batchUpdate requests that format one appended project block
+        
+        Args:
+            worksheet: Google Sheets worksheet
+            start_row: First row of the block (1-based)
+            rows: Row values, column A first
+        
+        Returns:
+            Requests for spreadsheets.batchUpdate: thick top and bottom borders,
+            and (for multi-row blocks) column A merged and centered
+        """
+        sheet_id = worksheet.id
+        start_index = start_row - 1
+        end_index = start_index + len(rows)
+        width = max(len(row) for row in rows)
+        block_range = {
+            "sheetId": sheet_id,
+            "startRowIndex": start_index, "endRowIndex": end_index,
+            "startColumnIndex": 0, "endColumnIndex": width
+        }
+        thick_border = {"style": "SOLID_THICK", "color": {"red": 0, "green": 0, "blue": 0}}
+        
+        requests = [
+            {"updateBorders": {
+                "range": block_range, "top": thick_border, "bottom": thick_border
+            }}
+        ]
+        
+        # Merge and format column A for project name (if multiple rows)
+        if len(rows) > 1:
+            name_range = dict(block_range, endColumnIndex=1)
+            requests.append({"mergeCells": {"range": name_range, "mergeType": "MERGE_ALL"}})
+            requests.append({"repeatCell": {
+                "range": name_range,
+                "cell": {"userEnteredFormat": {
+                    "verticalAlignment": "MIDDLE",
+                    "horizontalAlignment": "CENTER",
+                    "wrapStrategy": "WRAP",
+                    "textFormat": {"bold": False}
+                }},
+                "fields": "userEnteredFormat(verticalAlignment,horizontalAlignment,wrapStrategy,textFormat.bold)"
+            }})
+        
+        return requests
     
     def get_worksheet_names(self) -> List[str]:
         """Get list of all worksheet names"""
@@ -281,8 +424,7 @@ class GoogleSheetsClient:
             return []
         
         try:
-            worksheets = self.spreadsheet.worksheets()
-            return [ws.title for ws in worksheets]
+            return [ws.title for ws in self.session.get_worksheets()]
         except Exception as e:
             print(f"❌ Error getting worksheet names: {e}")
             return []
\ No newline at end of file
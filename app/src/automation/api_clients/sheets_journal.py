@@ -0,0 +1,385 @@
+# app/src/automation/api_clients/sheets_journal.py
+"""
+Sheets Journal Module
+Durable queue of pending result rows, written to Google Sheets by a background worker
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+from typing import Dict, List, Optional
+from .config import (
+    get_google_creds, SHEETS_JOURNAL_ENABLED, SHEETS_JOURNAL_DIR, SHEETS_WRITES_PER_MINUTE,
+    SHEETS_WRITE_BURST, SHEETS_BACKOFF_SECONDS, SHEETS_JOURNAL_MAX_BACKOFF_SECONDS,
+    SHEETS_JOURNAL_MAX_ATTEMPTS
+)
+from .google_sheets_client import GoogleSheetsClient
+from .account_mapper import AccountMapper
+from .sheets_session import get_sheets_session
+
+# HTTP statuses a resend cannot fix (bad request, no permission, spreadsheet gone)
+PERMANENT_STATUSES = {400, 403, 404}
+# Routing errors that a resend cannot fix either
+PERMANENT_ERRORS = ("No worksheet found",)
+
+def is_permanent_error(error) -> bool:
+    """Check whether a failed write (exception or error message) can never succeed"""
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status in PERMANENT_STATUSES or str(error).startswith(PERMANENT_ERRORS)
+
+class TokenBucket:
+    """Paces calls to a steady rate while allowing short bursts"""
+    
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call may be made"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class SheetsJournal:
+    """
+    Pending Sheets writes, one JSON file per project block
+    
+    enqueue() writes the entry to disk and returns at once; a daemon worker
+    sends due entries, grouped per worksheet so each worksheet costs one
+    batchUpdate per pass, paced by a token bucket. A failed entry stays on
+    disk and is retried with exponential backoff, and entries left behind
+    when the app exits are picked up by resume() on the next start.
+    
+    An entry that fails inside a batch is retried on its own, so one bad
+    block cannot keep failing the others. An entry whose error is permanent,
+    or that runs out of SHEETS_JOURNAL_MAX_ATTEMPTS, is moved to failed/
+    (move the file back into the journal directory to send it again).
+    
+    Before sending, the worker records the row each block is going to so a
+    resend after a crash can check whether the earlier attempt landed
+    instead of writing the rows twice.
+    """
+    
+    # Seconds the idle worker sleeps between looks at the journal
+    POLL_INTERVAL = 30.0
+    
+    def __init__(self, journal_dir: str = SHEETS_JOURNAL_DIR):
+        self.journal_dir = journal_dir
+        self.credentials = None
+        self.bucket = TokenBucket(SHEETS_WRITES_PER_MINUTE, SHEETS_WRITE_BURST)
+        self._condition = threading.Condition()
+        self._worker = None
+        self._wake = False
+        self.failed_dir = os.path.join(self.journal_dir, "failed")
+        os.makedirs(self.journal_dir, exist_ok=True)
+    
+    def enqueue(self, routing_name: str, column1_name: str, data_rows: List[List], credentials=None,
+                account_code: str = None, platform_code: str = None) -> Optional[str]:
+        """
+        Journal one project block for writing
+        
+        Args:
+            routing_name: Card title, used to find the worksheet
+            column1_name: Name to display in column 1
+            data_rows: Data rows to insert
+            credentials: Google credentials for the worker (config credentials if omitted)
+            account_code, platform_code: Detected codes for exact worksheet routing
+        
+        Returns:
+            Entry ID, or None if there was nothing to write
+        """
+        if not data_rows:
+            return None
+        
+        entry = {
+            'id': f"{time.time_ns()}-{uuid.uuid4().hex[:8]}",
+            'created': time.time(),
+            'routing_name': routing_name,
+            'column1_name': column1_name,
+            'rows': data_rows,
+            'account_code': account_code,
+            'platform_code': platform_code,
+            'attempts': 0,
+            'next_attempt': 0,
+            'target': None,
+            'last_error': None
+        }
+        self._save(entry)
+        
+        if credentials:
+            self.credentials = credentials
+        print(f"🗒️ Queued {len(data_rows)} rows for Google Sheets ('{column1_name}')")
+        self.start()
+        return entry['id']
+    
+    def resume(self):
+        """Start the worker if an earlier run left entries behind"""
+        pending = self.pending_count()
+        if pending:
+            print(f"🗒️ Resuming {pending} pending Google Sheets write(s)")
+            self.start()
+    
+    def start(self):
+        """Start the worker (if needed) and wake it"""
+        with self._condition:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="sheets-journal", daemon=True)
+                self._worker.start()
+            self._wake = True
+            self._condition.notify_all()
+    
+    def check_route(self, credentials=None, account_code: str = None,
+                    platform_code: str = None) -> Optional[str]:
+        """
+        Check up front that a block has a worksheet to go to
+        
+        Lets the job report a routing problem to the operator instead of
+        queueing rows that can never be written. Only the session's cached
+        worksheet list is consulted, so the job never waits on the Sheets API;
+        without it (or without exact codes) the worker does the routing.
+        
+        Returns:
+            The error if the block can never be written, otherwise None
+        """
+        if not (account_code and platform_code):
+            return None
+        credentials = credentials or self.credentials or get_google_creds()
+        if not credentials:
+            return None
+        
+        titles = get_sheets_session(credentials).get_cached_worksheet_titles()
+        if titles is None:
+            return None
+        if AccountMapper().find_exact_worksheet_match(titles, account_code, platform_code):
+            return None
+        return f"No worksheet found for {account_code} - {platform_code}"
+    
+    def pending_count(self) -> int:
+        """Number of entries not yet written"""
+        return len(self._entry_paths())
+    
+    def failed_count(self) -> int:
+        """Number of entries given up on (kept in failed/)"""
+        return len(self._entry_paths(self.failed_dir))
+    
+    def flush(self, timeout: float) -> int:
+        """
+        Wait for the journal to empty
+        
+        Returns:
+            Entries still pending when the timeout ran out (they stay on disk)
+        """
+        deadline = time.time() + timeout
+        with self._condition:
+            self._condition.notify_all()
+            while self.pending_count() and time.time() < deadline:
+                self._condition.wait(min(1.0, max(0.0, deadline - time.time())))
+        return self.pending_count()
+    
+    # Worker
+    
+    def _run(self):
+        """Send due entries until the process exits"""
+        while True:
+            try:
+                next_due = self._send_due_entries()
+            except Exception as e:
+                print(f"⚠️ Sheets journal worker error: {e}")
+                next_due = time.time() + SHEETS_BACKOFF_SECONDS
+            
+            with self._condition:
+                self._condition.notify_all()
+                delay = self.POLL_INTERVAL if next_due is None else next_due - time.time()
+                # An entry queued during the pass has already set _wake
+                if delay > 0 and not self._wake:
+                    self._condition.wait(min(delay, self.POLL_INTERVAL))
+                self._wake = False
+    
+    def _send_due_entries(self) -> Optional[float]:
+        """
+        One pass over the journal
+        
+        Returns:
+            When the next deferred entry is due (None if nothing is waiting)
+        """
+        entries = self._load_entries()
+        now = time.time()
+        due = [entry for entry in entries if entry['next_attempt'] <= now]
+        if not due:
+            return min((entry['next_attempt'] for entry in entries), default=None)
+        
+        client = GoogleSheetsClient(self.credentials or get_google_creds())
+        if not client.spreadsheet:
+            for entry in due:
+                self._defer(entry, "Google Sheets not initialized")
+            return self._next_due()
+        
+        # Group by worksheet, keeping journal order inside each group. An entry
+        # waiting on its backoff holds back later ones for the same worksheet
+        # (at most until it runs out of attempts). An entry that failed before
+        # is sent on its own
+        groups: Dict[int, tuple] = {}
+        retries = []
+        held_back = set()
+        for entry in entries:
+            worksheet, error = client.resolve_worksheet(
+                entry['routing_name'], entry['account_code'], entry['platform_code']
+            )
+            if error:
+                if entry['next_attempt'] <= now:
+                    self._defer(entry, error)
+                continue
+            if entry['next_attempt'] > now or worksheet.id in held_back:
+                held_back.add(worksheet.id)
+                continue
+            if self._already_written(client, worksheet, entry):
+                print(f"✅ '{entry['column1_name']}' was already written to '{worksheet.title}'")
+                self._remove(entry)
+                continue
+            if entry['attempts']:
+                retries.append((worksheet, [entry]))
+                continue
+            groups.setdefault(worksheet.id, (worksheet, []))[1].append(entry)
+        
+        for worksheet, group in retries + list(groups.values()):
+            self._write_group(client, worksheet, group)
+        
+        return self._next_due()
+    
+    def _write_group(self, client: GoogleSheetsClient, worksheet, group: List[dict]):
+        """Write every entry for one worksheet in a single batchUpdate"""
+        def record_targets(anchor_row):
+            # The blocks are appended somewhere below the anchor
+            for entry in group:
+                entry['target'] = {'worksheet_id': worksheet.id, 'below_row': anchor_row}
+                self._save(entry)
+        
+        self.bucket.acquire()
+        try:
+            client.write_project_blocks(
+                worksheet, [(entry['column1_name'], entry['rows']) for entry in group],
+                on_placed=record_targets
+            )
+        except Exception as e:
+            client.session.invalidate_worksheets()
+            # Which block of a batch was rejected is unknown; each is retried on its own
+            for entry in group:
+                self._defer(entry, e, may_fail=len(group) == 1)
+            return
+        
+        for entry in group:
+            self._remove(entry)
+        print(f"✅ Google Sheets: wrote {len(group)} queued project(s) to '{worksheet.title}'")
+    
+    def _already_written(self, client: GoogleSheetsClient, worksheet, entry: dict) -> bool:
+        """Check whether an interrupted earlier attempt of this entry landed"""
+        target = entry.get('target')
+        if not target or target['worksheet_id'] != worksheet.id:
+            return False
+        try:
+            return client.find_block(worksheet, target['below_row'], entry['column1_name']) is not None
+        except Exception:
+            return False
+    
+    def _defer(self, entry: dict, error, may_fail: bool = True):
+        """
+        Schedule a failed entry's retry with exponential backoff
+        
+        Args:
+            entry: The failed entry
+            error: Exception or error message
+            may_fail: Give up on the entry if the error is permanent or it is
+                out of attempts (False when the error may belong to another block)
+        """
+        entry['attempts'] += 1
+        entry['last_error'] = str(error)
+        if may_fail and (is_permanent_error(error) or entry['attempts'] >= SHEETS_JOURNAL_MAX_ATTEMPTS):
+            self._fail(entry)
+            return
+        
+        delay = min(SHEETS_JOURNAL_MAX_BACKOFF_SECONDS, SHEETS_BACKOFF_SECONDS * 2 ** entry['attempts'])
+        entry['next_attempt'] = time.time() + delay
+        self._save(entry)
+        print(f"⚠️ Sheets write for '{entry['column1_name']}' failed (attempt {entry['attempts']}), "
+              f"retrying in {delay:.0f}s: {error}")
+    
+    def _fail(self, entry: dict):
+        """Move an entry that will never be written to failed/"""
+        os.makedirs(self.failed_dir, exist_ok=True)
+        self._save(entry, self.failed_dir)
+        self._remove(entry)
+        print(f"❌ Gave up on Sheets write for '{entry['column1_name']}' after {entry['attempts']} "
+              f"attempt(s): {entry['last_error']} - rows kept in {self.failed_dir}")
+    
+    def _next_due(self) -> Optional[float]:
+        """When the earliest remaining entry is due"""
+        return min((entry['next_attempt'] for entry in self._load_entries()), default=None)
+    
+    # Storage
+    
+    def _entry_paths(self, directory: str = None) -> List[str]:
+        """Journal files in creation order"""
+        directory = directory or self.journal_dir
+        try:
+            names = sorted(name for name in os.listdir(directory) if name.endswith('.json'))
+        except FileNotFoundError:
+            return []
+        return [os.path.join(directory, name) for name in names]
+    
+    def _load_entries(self) -> List[dict]:
+        """Read every readable entry, oldest first"""
+        entries = []
+        for path in self._entry_paths():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError) as e:
+                # Out of the way, so it neither blocks flush() nor is reread every pass
+                print(f"⚠️ Moving unreadable Sheets journal entry {path} to failed/: {e}")
+                os.makedirs(self.failed_dir, exist_ok=True)
+                os.replace(path, os.path.join(self.failed_dir, os.path.basename(path)))
+        return entries
+    
+    def _entry_path(self, entry: dict, directory: str = None) -> str:
+        return os.path.join(directory or self.journal_dir, f"{entry['id']}.json")
+    
+    def _save(self, entry: dict, directory: str = None):
+        """Write an entry atomically, so a crash never leaves half a file"""
+        path = self._entry_path(entry, directory)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    
+    def _remove(self, entry: dict):
+        try:
+            os.remove(self._entry_path(entry))
+        except FileNotFoundError:
+            pass
+
+
+# Shared instance so every writer feeds the same worker
+_default_sheets_journal = None
+
+def get_sheets_journal() -> Optional[SheetsJournal]:
+    """Get the shared Sheets journal (None when disabled)"""
+    global _default_sheets_journal
+    if not SHEETS_JOURNAL_ENABLED:
+        return None
+    if _default_sheets_journal is None:
+        _default_sheets_journal = SheetsJournal()
+    return _default_sheets_journal
@@ -0,0 +1,240 @@
+# app/src/automation/api_clients/sheets_session.py
+"""
+Sheets Session Module
+Authorized gspread session, spreadsheet handle and worksheet list shared by every Sheets call
+"""
+
+import os
+import json
+import time
+import random
+import threading
+from typing import Callable, Dict, List, Optional
+import gspread
+from gspread.exceptions import APIError
+from .config import (
+    GOOGLE_SHEET_ID, SHEETS_SESSION_TTL, SHEETS_WORKSHEET_TTL, SHEETS_ROW_INDEX_FILE,
+    SHEETS_MAX_RETRIES, SHEETS_BACKOFF_SECONDS, SHEETS_MAX_BACKOFF_SECONDS
+)
+
+# HTTP statuses worth retrying; anything else (bad request, permissions) fails at once
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+class SheetsSession:
+    """
+    One authorized Sheets connection, reused until its TTL runs out
+    
+    gspread.authorize + open_by_key cost a metadata fetch, and listing the
+    worksheets costs another. A job used to pay both on every Sheets call (the
+    version check and the results write of every mode); the session keeps the
+    spreadsheet for SHEETS_SESSION_TTL seconds and the worksheet list for
+    SHEETS_WORKSHEET_TTL seconds. Callers invalidate() after an API error so a
+    renamed or deleted worksheet is picked up.
+    """
+    
+    def __init__(self, credentials, spreadsheet_id: str = None):
+        self.credentials = credentials
+        self.spreadsheet_id = spreadsheet_id or GOOGLE_SHEET_ID
+        self.client = None
+        self._spreadsheet = None
+        self._opened_at = 0.0
+        self._worksheets: Optional[List] = None
+        self._listed_at = 0.0
+        self._lock = threading.Lock()
+        self._last_rows = self._load_row_index()
+    
+    def get_spreadsheet(self):
+        """Get the spreadsheet handle, authorizing and opening it if needed (None on failure)"""
+        with self._lock:
+            if self._spreadsheet is not None and time.time() - self._opened_at < SHEETS_SESSION_TTL:
+                return self._spreadsheet
+            
+            try:
+                self.client = gspread.authorize(self.credentials)
+                self._spreadsheet = self.client.open_by_key(self.spreadsheet_id)
+                self._opened_at = time.time()
+                self._worksheets = None
+                print("🔗 Google Sheets session opened")
+            except Exception as e:
+                print(f"❌ Failed to initialize Google Sheets client: {e}")
+                self._spreadsheet = None
+            
+            return self._spreadsheet
+    
+    def get_worksheets(self) -> List:
+        """Get every worksheet of the spreadsheet, from cache while it is fresh"""
+        spreadsheet = self.get_spreadsheet()
+        if spreadsheet is None:
+            raise Exception("Google Sheets not initialized")
+        
+        with self._lock:
+            if self._worksheets is not None and time.time() - self._listed_at < SHEETS_WORKSHEET_TTL:
+                return list(self._worksheets)
+        
+        worksheets = spreadsheet.worksheets()
+        with self._lock:
+            self._worksheets = worksheets
+            self._listed_at = time.time()
+        return list(worksheets)
+    
+    def get_cached_worksheet_titles(self) -> Optional[List[str]]:
+        """Worksheet titles if the list is cached and fresh, without calling the API (None otherwise)"""
+        with self._lock:
+            if self._worksheets is None or time.time() - self._listed_at >= SHEETS_WORKSHEET_TTL:
+                return None
+            return [worksheet.title for worksheet in self._worksheets]
+    
+    def get_worksheet_map(self) -> Dict[str, object]:
+        """Get worksheets by title"""
+        return {worksheet.title: worksheet for worksheet in self.get_worksheets()}
+    
+    def invalidate_worksheets(self):
+        """Forget the cached worksheet list"""
+        with self._lock:
+            self._worksheets = None
+    
+    def invalidate(self):
+        """Forget everything; the next call authorizes and opens the spreadsheet again"""
+        with self._lock:
+            self._spreadsheet = None
+            self._worksheets = None
+    
+    def batch_update(self, requests: List[dict], is_applied: Callable[[], bool] = None) -> Optional[dict]:
+        """
+        Send requests as one spreadsheets.batchUpdate call
+        
+        The Sheets API applies a batch atomically, but a network error can
+        arrive after the server applied it, and requests such as appendDimension
+        are not idempotent. Before every resend is_applied() is asked whether
+        the earlier attempt landed; if it did, nothing is resent. Without
+        is_applied only the rejected attempts (HTTP errors, which change
+        nothing) are resent. Quota (429) and server errors are retried with
+        exponential backoff, up to SHEETS_MAX_RETRIES retries; anything else
+        is raised at once.
+        
+        Returns:
+            The API response, or None when a resend found the batch already applied
+        """
+        spreadsheet = self.get_spreadsheet()
+        if spreadsheet is None:
+            raise Exception("Google Sheets not initialized")
+        
+        body = {"requests": requests}
+        return self._send(lambda: spreadsheet.batch_update(body), is_applied)
+    
+    def append_rows(self, worksheet, rows: List[List], table_row: int,
+                    is_applied: Callable[[], bool] = None) -> Optional[dict]:
+        """
+        Append rows after the table that holds table_row (spreadsheets.values.append)
+        
+        The server picks the rows, so concurrent writers never land on the same
+        ones; the response's updates.updatedRange says where they went. Values
+        are stored RAW into the empty rows below the table, growing the grid if
+        needed. Retried like batch_update; an append is not idempotent either,
+        so only is_applied makes a dropped connection safe to resend.
+        
+        Returns:
+            The API response, or None when a resend found the rows already appended
+        """
+        return self._send(
+            lambda: worksheet.append_rows(
+                rows, value_input_option='RAW', insert_data_option='OVERWRITE',
+                table_range=f"A{max(table_row, 1)}"
+            ),
+            is_applied
+        )
+    
+    def _send(self, call: Callable[[], dict], is_applied: Callable[[], bool] = None) -> Optional[dict]:
+        """Run one write request with the retry rules described in batch_update"""
+        for attempt in range(SHEETS_MAX_RETRIES + 1):
+            if attempt:
+                delay = min(SHEETS_MAX_BACKOFF_SECONDS, SHEETS_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                delay *= random.uniform(0.8, 1.2)
+                print(f"🔁 Retrying Sheets update in {delay:.1f}s (retry {attempt}/{SHEETS_MAX_RETRIES})")
+                time.sleep(delay)
+                
+                if may_have_landed:
+                    try:
+                        if is_applied():
+                            print("✅ The interrupted Sheets update had been applied - not resending")
+                            return None
+                    except Exception as e:
+                        # Resending without knowing could apply the batch twice
+                        if attempt == SHEETS_MAX_RETRIES:
+                            raise
+                        print(f"⚠️ Could not check whether the Sheets update landed: {e}")
+                        continue
+            
+            may_have_landed = False
+            try:
+                return call()
+            except APIError as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status not in RETRYABLE_STATUSES or attempt == SHEETS_MAX_RETRIES:
+                    raise
+                print(f"⚠️ Sheets update rejected: HTTP {status}")
+            except Exception as e:
+                # The request may have reached the server before the connection failed
+                if attempt == SHEETS_MAX_RETRIES or not is_applied:
+                    raise
+                may_have_landed = True
+                print(f"⚠️ Sheets update interrupted: {e}")
+    
+    def get_last_row(self, worksheet) -> Optional[int]:
+        """Last content row recorded for a worksheet (a hint: callers verify it)"""
+        with self._lock:
+            return self._last_rows.get(self._row_key(worksheet))
+    
+    def set_last_row(self, worksheet, row: Optional[int]):
+        """Record a worksheet's last content row (None forgets it)"""
+        with self._lock:
+            if row:
+                self._last_rows[self._row_key(worksheet)] = row
+            else:
+                self._last_rows.pop(self._row_key(worksheet), None)
+            self._save_row_index()
+    
+    def _row_key(self, worksheet) -> str:
+        """Row index key, stable across renames of the worksheet"""
+        return f"{self.spreadsheet_id}:{worksheet.id}"
+    
+    def _load_row_index(self) -> Dict[str, int]:
+        """Read the persisted last-row index"""
+        if not os.path.exists(SHEETS_ROW_INDEX_FILE):
+            return {}
+        try:
+            with open(SHEETS_ROW_INDEX_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read Sheets row index, starting fresh: {e}")
+            return {}
+    
+    def _save_row_index(self):
+        """Write the last-row index atomically (caller holds the lock)"""
+        temp_path = f"{SHEETS_ROW_INDEX_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(SHEETS_ROW_INDEX_FILE), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._last_rows, f, indent=2)
+            os.replace(temp_path, SHEETS_ROW_INDEX_FILE)
+        except OSError as e:
+            print(f"⚠️ Could not save Sheets row index: {e}")
+
+
+# Sessions shared by every GoogleSheetsClient, keyed by service account + spreadsheet
+_sessions: Dict[tuple, SheetsSession] = {}
+_sessions_lock = threading.Lock()
+
+def get_sheets_session(credentials, spreadsheet_id: str = None) -> SheetsSession:
+    """Get the pooled session for these credentials and spreadsheet"""
+    spreadsheet_id = spreadsheet_id or GOOGLE_SHEET_ID
+    # get_google_creds() builds a new Credentials object per call, so pool by account
+    identity = getattr(credentials, 'service_account_email', None) or id(credentials)
+    key = (identity, spreadsheet_id)
+    
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = SheetsSession(credentials, spreadsheet_id)
+            _sessions[key] = session
+        return session
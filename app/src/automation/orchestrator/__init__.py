@@ -26,9 +26,24 @@ from .ui_preparation import UIPreparation
 from .ui_processing import UIProcessing
 from .ui_progress import UIProgress
 from .ui_sheets import UISheets
+from ..api_clients import get_sheets_journal
+from ..api_clients.config import SHEETS_JOURNAL_EXIT_GRACE_SECONDS
 
 def main(card_id=None, use_ui=True):
     """Main entry point for automation - SIMPLIFIED"""
+    # Sheets rows queued by an earlier run that did not get to send them
+    journal = get_sheets_journal()
+    if journal:
+        journal.resume()
+    
+    try:
+        return _run(card_id, use_ui)
+    finally:
+        if journal:
+            _flush_sheets_journal(journal)
+
+def _run(card_id, use_ui):
+    """Run one card, with or without the UI"""
     orchestrator = AutomationOrchestrator()
     
     if use_ui:
@@ -52,6 +67,17 @@ def main(card_id=None, use_ui=True):
             print("❌ Headless mode requires a Trello card ID")
             return False
 
+def _flush_sheets_journal(journal):
+    """Give queued Sheets rows a moment to go out before the process exits"""
+    if not journal.pending_count():
+        return
+    print("📊 Waiting for queued Google Sheets writes...")
+    remaining = journal.flush(SHEETS_JOURNAL_EXIT_GRACE_SECONDS)
+    if remaining:
+        print(f"⚠️ {remaining} Google Sheets write(s) still pending - they are saved and will be sent on the next run")
+    else:
+        print("✅ All queued Google Sheets writes sent")
+
 # Export the main function and classes for backward compatibility
 __all__ = [
     'AutomationOrchestrator', 
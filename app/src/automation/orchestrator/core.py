@@ -5,6 +5,7 @@ import time
 from ..robust_monitoring import RobustMonitoringSystem
 from ..validation_engine import ValidationEngine
 from ..instruction_parser import InstructionParser
+from ..video_processing.job_control import get_job_control
 
 # Import UI components
 from ..unified_workflow_dialog import UnifiedWorkflowDialog
@@ -30,6 +31,7 @@ class AutomationOrchestrator:
         self.processing_mode = None
         self.project_info = None
         self.downloaded_videos = None
+        self.download_stream = None
         self.project_paths = None
         self.creds = None
         self.processed_files = None
@@ -65,6 +67,7 @@ class AutomationOrchestrator:
         
         self.trello_card_id = trello_card_id
         self.start_time = time.time()
+        get_job_control().begin(trello_card_id)
         
         try:
             print("🚀 Starting AI Automation with UI Workflow")
@@ -81,6 +84,9 @@ class AutomationOrchestrator:
                 print(f"❌ Failed to fetch Trello card: {error}")
                 return False
             
+            # Download in the background while the user reviews the confirmation tab
+            self.processing_steps.start_prefetch(self.card_data)
+            
             # Step 2: Parse instructions WITHOUT asset validation
             from ..workflow_utils import parse_project_info
             
@@ -139,10 +145,14 @@ class AutomationOrchestrator:
                 print("\n" + "="*60)
                 print("❌ Automation cancelled by user")
                 print("="*60)
+                self.processing_steps.discard_prefetch()
             
             return success
             
         except Exception as e:
+            # Stop the transfers without holding up the error dialog, then remove
+            # the files already in place so the next card doesn't pick them up
+            self.processing_steps.discard_prefetch()
             self.error_handler.handle_automation_error(e, trello_card_id)
             return False
     
@@ -150,6 +160,7 @@ class AutomationOrchestrator:
         """Legacy headless execution - fallback for command line"""
         self.trello_card_id = trello_card_id
         self.start_time = time.time()
+        get_job_control().begin(trello_card_id)
         
         try:
             print("🚀 Starting AI Automation (Headless Mode)")
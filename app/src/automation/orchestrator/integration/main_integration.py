@@ -61,4 +61,7 @@ class UIIntegration:
                 )
             
         except Exception as e:
+            # A failed job leaves its downloads behind; stop them and remove the
+            # finished files so the next card doesn't pick them up
+            self.orchestrator.processing_steps.discard_prefetch()
             return self.error_handler.handle_processing_error(e)
\ No newline at end of file
@@ -7,8 +7,13 @@ Enhanced with improved video dimension handling
 
 import time
 import os
+import shutil
 from ...workflow_dialog.helpers import create_processing_result_from_orchestrator
 from .mode_utilities import ModeUtilities
+from ...video_processing.ffmpeg_runner import progress_listener, band_progress
+from ...video_processing.job_control import get_job_control
+from ...robust_monitoring import ActivityTimeoutError
+from ..processing.video_processing_modules import JobManifest, ModeProcessor
 
 class MultiModeProcessor:
     """Handles multi-mode processing workflow"""
@@ -28,7 +33,15 @@ class MultiModeProcessor:
         # Download assets only once
         downloaded_once = False
         
+        # Encode each client video once and let every mode reuse the segment
+        shared_segment_dir = self._start_shared_client_segments(selected_modes)
+        job = get_job_control()
+        
         for i, mode in enumerate(selected_modes, 1):
+            if job.cancelled:
+                print(f"⏹️ Job cancelled - skipping remaining modes: {job.cancel_reason}")
+                break
+            
             print(f"\n{'='*60}")
             print(f"🔄 Processing mode {i}/{len(selected_modes)}: {mode.upper()}")
             print(f"{'='*60}")
@@ -56,6 +69,10 @@ class MultiModeProcessor:
             except Exception as mode_error:
                 print(f"❌ Error processing mode {mode}: {mode_error}")
                 
+                # A timeout only stops this mode; the next one gets a fresh job
+                if isinstance(mode_error, ActivityTimeoutError) and job.cancelled:
+                    job.begin(job.job_name)
+                
                 # Check if it's a video dimension issue
                 if "video dimensions" in str(mode_error).lower():
                     print(f"🔧 Attempting video dimension fix for {mode}...")
@@ -78,6 +95,8 @@ class MultiModeProcessor:
                 print(f"⚠️ Skipping mode {mode} due to error: {mode_error}")
                 continue
         
+        self._stop_shared_client_segments(shared_segment_dir)
+        
         # Reset to original project name
         self.orchestrator.project_info['project_name'] = original_project_name
         
@@ -148,21 +167,40 @@ class MultiModeProcessor:
         # Configure transitions for this mode
         self._configure_transitions_for_mode(mode, use_transitions)
         
-        # Process videos with error handling
-        self.orchestrator.processed_files = self.orchestrator.processing_steps.process_videos(
-            self.orchestrator.downloaded_videos,
-            self.orchestrator.project_paths,
-            self.orchestrator.project_info,
-            self.orchestrator.processing_mode,
-            self.orchestrator.creds
-        )
+        # A mode an earlier run finished (rendered, logged and reported) is not redone
+        manifest = JobManifest(self.orchestrator.project_paths['project_root'])
+        # Fingerprinting reads every client video, so only do it up front when there is a run to reuse
+        mode_fingerprint = self._get_mode_fingerprint(manifest, mode) if manifest.has_mode(mode) else None
+        completed_files = manifest.get_completed_mode(mode, mode_fingerprint)
+        if completed_files is not None:
+            print(f"⏭️ {mode} already completed by an earlier run - reusing its {len(completed_files)} output(s)")
+            self.orchestrator.processed_files = completed_files
+            return {
+                'processed_files': completed_files,
+                'output_folder': self.orchestrator.project_paths['project_root'],
+                'downloaded_once': downloaded_once
+            }
+        
+        # Process videos with error handling, showing live render progress
+        with progress_listener(band_progress(progress_callback, progress_percent, progress_percent + 30 / total_modes)):
+            self.orchestrator.processed_files = self.orchestrator.processing_steps.process_videos(
+                self.orchestrator.downloaded_videos,
+                self.orchestrator.project_paths,
+                self.orchestrator.project_info,
+                self.orchestrator.processing_mode,
+                self.orchestrator.creds
+            )
         
         # Step 5: Write to Google Sheets
-        self._update_mode_google_sheets(mode, mode_index, total_modes, progress_callback)
+        sheets_updated = self._update_mode_google_sheets(mode, mode_index, total_modes, progress_callback)
         
         # Step 6: Generate reports
         self._generate_mode_reports(mode, use_transitions)
         
+        if sheets_updated:
+            mode_fingerprint = mode_fingerprint or self._get_mode_fingerprint(manifest, mode)
+            manifest.mark_mode_complete(mode, mode_fingerprint, self.orchestrator.processed_files)
+        
         # Step 7: Cleanup (DEFER for multi-mode - cleanup after all modes complete)
         # self._cleanup_mode_processing(mode)  # Skip cleanup for now
         
@@ -172,6 +210,77 @@ class MultiModeProcessor:
             'downloaded_once': downloaded_once
         }
     
+    def _get_mode_fingerprint(self, manifest, mode):
+        """Fingerprint a mode from every client video, its assets and its render settings"""
+        client_videos = list(self.orchestrator.downloaded_videos or [])
+        if not client_videos:
+            return None
+        
+        try:
+            self.orchestrator.processing_steps.wait_for_all_downloads()
+            mode_processor = ModeProcessor(self.orchestrator)
+            asset_paths = mode_processor.get_render_inputs(client_videos[0], mode)[1:]
+            recipe = mode_processor.get_render_recipe(mode)
+            return manifest.build_fingerprint(sorted(client_videos) + asset_paths, recipe)
+        except Exception as e:
+            print(f"⚠️ Could not fingerprint {mode}, it will be processed: {e}")
+            return None
+    
+    def _start_shared_client_segments(self, selected_modes):
+        """
+        Point the video processor at a job-scoped client segment cache
+        
+        The first mode encodes each client video to the normalized segment
+        format; every later mode joins its own endpoint onto that segment
+        instead of decoding and normalizing the client again.
+        
+        Returns:
+            The job's cache directory, or None when sharing is not worthwhile
+        """
+        if len(selected_modes) <= 1:
+            return None
+        
+        try:
+            from ...video_processing import ProcessorConfig
+            from ...video_processor import set_client_segment_cache_dir
+            
+            base_dir = ProcessorConfig.CLIENT_SEGMENT_CACHE_DIR
+            self._remove_stale_client_segments(base_dir)
+            
+            job_dir = os.path.join(base_dir, f"job_{os.getpid()}_{int(time.time())}")
+            os.makedirs(job_dir, exist_ok=True)
+            set_client_segment_cache_dir(job_dir)
+            
+            print(f"♻️ Sharing client segments across {len(selected_modes)} modes: {job_dir}")
+            return job_dir
+        
+        except Exception as e:
+            print(f"⚠️ Could not enable shared client segments: {e}")
+            return None
+    
+    def _stop_shared_client_segments(self, job_dir):
+        """Stop sharing client segments and delete the job's cache directory"""
+        if not job_dir:
+            return
+        
+        from ...video_processor import set_client_segment_cache_dir
+        set_client_segment_cache_dir(None)
+        
+        shutil.rmtree(job_dir, ignore_errors=True)
+        print(f"🧹 Removed shared client segments: {job_dir}")
+    
+    def _remove_stale_client_segments(self, base_dir, max_age_hours=24):
+        """Remove job directories left behind by runs that crashed"""
+        if not os.path.isdir(base_dir):
+            return
+        
+        cutoff = time.time() - max_age_hours * 3600
+        for entry in os.listdir(base_dir):
+            entry_path = os.path.join(base_dir, entry)
+            if os.path.isdir(entry_path) and os.path.getmtime(entry_path) < cutoff:
+                shutil.rmtree(entry_path, ignore_errors=True)
+                print(f"🧹 Removed stale client segments: {entry}")
+    
     def _handle_mode_video_dimension_error(self, mode, error, mode_index, total_modes,
                                          confirmation_data, progress_callback, 
                                          use_transitions, original_project_name, downloaded_once):
@@ -288,9 +397,11 @@ class MultiModeProcessor:
                 current_mode=mode  # Pass current mode for correct type suffix
             )
             print(f"✅ Google Sheets updated for {mode}")
+            return True
             
         except Exception as sheets_error:
             print(f"⚠️ Google Sheets update failed for {mode}: {sheets_error}")
+            return False
     
     def _generate_mode_reports(self, mode, use_transitions):
         """Generate breakdown reports for specific mode"""
@@ -7,6 +7,7 @@ Extracted from ui_integration_base.py for better maintainability
 import time
 import os
 from ...workflow_dialog.helpers import create_processing_result_from_orchestrator
+from ...video_processing.ffmpeg_runner import progress_listener, band_progress
 
 class SingleModeProcessor:
     """Handles single-mode processing workflow"""
@@ -51,13 +52,15 @@ class SingleModeProcessor:
         
         # Process videos with enhanced error handling
         try:
-            self.orchestrator.processed_files = self.orchestrator.processing_steps.process_videos(
-                self.orchestrator.downloaded_videos,
-                self.orchestrator.project_paths,
-                self.orchestrator.project_info,
-                self.orchestrator.processing_mode,
-                self.orchestrator.creds
-            )
+            # Show live render progress, moving through 60-90% before the Sheets update
+            with progress_listener(band_progress(progress_callback, 60, 90)):
+                self.orchestrator.processed_files = self.orchestrator.processing_steps.process_videos(
+                    self.orchestrator.downloaded_videos,
+                    self.orchestrator.project_paths,
+                    self.orchestrator.project_info,
+                    self.orchestrator.processing_mode,
+                    self.orchestrator.creds
+                )
         except Exception as video_error:
             print(f"❌ Video processing failed: {video_error}")
             # Check if it's a video dimension issue
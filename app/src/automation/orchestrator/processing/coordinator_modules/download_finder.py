@@ -82,6 +82,15 @@ class DownloadFinder:
                 if f.lower().endswith(video_extensions)
             ]
             
+            # Files sharing a name with another download sit one level down (<file id>/<name>)
+            for entry in all_files:
+                subdir = os.path.join(directory_path, entry)
+                if os.path.isdir(subdir):
+                    video_files.extend(
+                        os.path.join(entry, f) for f in os.listdir(subdir)
+                        if f.lower().endswith(video_extensions)
+                    )
+            
             print(f"   Found {len(video_files)} video files: {video_files}")
             return video_files
             
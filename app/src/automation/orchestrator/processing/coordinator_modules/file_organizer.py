@@ -43,7 +43,7 @@ class FileOrganizer:
     def _move_single_file(self, filename, source_dir, dest_dir):
         """Move a single file with error handling"""
         source_path = os.path.join(source_dir, filename)
-        dest_path = os.path.join(dest_dir, filename)
+        dest_path = os.path.join(dest_dir, os.path.basename(filename))
         
         try:
             # Check if source exists
@@ -52,10 +52,15 @@ class FileOrganizer:
                 return False
             
             # Handle destination conflicts
-            dest_path = self._handle_destination_conflict(dest_path, filename, dest_dir)
+            dest_path = self._handle_destination_conflict(dest_path, os.path.basename(filename), dest_dir)
             
             # Perform the move
             shutil.move(source_path, dest_path)
+            
+            # A duplicate-name download leaves its own subdirectory behind
+            source_parent = os.path.dirname(source_path)
+            if os.path.normpath(source_parent) != os.path.normpath(source_dir) and not os.listdir(source_parent):
+                os.rmdir(source_parent)
             print(f"📁 ✅ Moved: {filename} → _Footage/Video/Client/")
             return True
             
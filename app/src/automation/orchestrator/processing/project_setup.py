@@ -4,7 +4,11 @@ Project Setup Module - Handles card fetching, validation, and project setup
 """
 
 import os
-from ...api_clients import (get_trello_card_data, download_files_from_gdrive, get_google_creds)
+from ...api_clients import (get_trello_card_data, download_files_from_gdrive, get_google_creds,
+                            GoogleDriveClient)
+from ...api_clients.config import DOWNLOAD_PIPELINE_ENABLED, DOWNLOAD_PREFETCH_ENABLED
+from ...video_processing.probe_service import get_probe_service
+from .video_sorter import VideoSorter
 from ...workflow_utils import create_project_structure
 from ....naming_generator import generate_project_folder_name
 
@@ -13,6 +17,8 @@ class ProjectSetup:
     
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
+        # A discarded prefetch whose threads may still be finishing a chunk
+        self._stopping_stream = None
     
     def fetch_and_validate_card(self, trello_card_id):
         """Step 1: Fetch Trello card and validate basic data"""
@@ -74,16 +80,41 @@ class ProjectSetup:
         
         # Download videos
         def download_videos():
-            videos, error = download_files_from_gdrive(gdrive_link, creds)
+            videos, error = download_files_from_gdrive(gdrive_link, creds, self.orchestrator.monitor)
             if error:
                 raise Exception(f"Failed to download videos: {error}")
             return videos
         
-        downloaded_videos = self.orchestrator.monitor.execute_with_activity_monitoring(
-            download_videos,
-            "Video Download",
-            no_activity_timeout=300
-        )
+        # Or start them in the background so rendering begins once the first file lands
+        def start_downloads():
+            stream, error = self._start_folder_download(gdrive_link, creds)
+            if error:
+                raise Exception(f"Failed to download videos: {error}")
+            return stream
+        
+        prefetched = getattr(self.orchestrator, 'download_stream', None)
+        if prefetched and prefetched.folder_url != gdrive_link:
+            self.discard_prefetch()
+            prefetched = None
+        
+        if DOWNLOAD_PIPELINE_ENABLED and prefetched:
+            print(f"♻️ Using prefetched downloads: {prefetched.describe()}")
+            downloaded_videos = prefetched.local_paths
+        elif DOWNLOAD_PIPELINE_ENABLED:
+            stream = self.orchestrator.monitor.execute_with_activity_monitoring(
+                start_downloads,
+                "Video Download",
+                no_activity_timeout=300
+            )
+            self.orchestrator.download_stream = stream
+            downloaded_videos = stream.local_paths
+        else:
+            self.orchestrator.download_stream = None
+            downloaded_videos = self.orchestrator.monitor.execute_with_activity_monitoring(
+                download_videos,
+                "Video Download",
+                no_activity_timeout=300
+            )
         
         # Create project structure
         def create_structure():
@@ -136,8 +167,80 @@ class ProjectSetup:
             no_activity_timeout=60
         )
         
-        print(f"✅ Downloaded {len(downloaded_videos)} videos")
+        if DOWNLOAD_PIPELINE_ENABLED:
+            print(f"✅ Downloading {len(downloaded_videos)} videos in the background")
+        else:
+            print(f"✅ Downloaded {len(downloaded_videos)} videos")
         print(f"✅ Project structure created at: {project_paths['project_root']}")
         print(f"✅ Output folder ready at: {project_paths['_AME']}")
         
-        return creds, downloaded_videos, project_paths
\ No newline at end of file
+        return creds, downloaded_videos, project_paths
+    
+    def start_prefetch(self, card_data):
+        """
+        Start downloading the card's footage while the confirmation dialog is open
+        
+        Best effort: any problem is logged and the download simply starts later
+        in download_and_setup instead.
+        """
+        if not (DOWNLOAD_PIPELINE_ENABLED and DOWNLOAD_PREFETCH_ENABLED):
+            return
+        
+        try:
+            gdrive_link = self.orchestrator.validator.extract_gdrive_link(card_data.get('desc', ''))
+            if not gdrive_link:
+                return
+            
+            creds = get_google_creds()
+            if not creds:
+                return
+            
+            stream, error = self._start_folder_download(gdrive_link, creds)
+            if error:
+                print(f"⚠️ Prefetch not started: {error}")
+                return
+            
+            self.orchestrator.download_stream = stream
+            print(f"📥 Prefetching {len(stream.local_paths)} videos while the confirmation dialog is open")
+        
+        except Exception as e:
+            print(f"⚠️ Prefetch not started: {e}")
+    
+    def discard_prefetch(self):
+        """Stop a prefetch nobody is going to use and remove the files it finished"""
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if not stream:
+            return
+        
+        # Called from the UI thread: don't wait for running transfers. Each stops
+        # after its current chunk and no file is moved into place after this
+        stream.close(wait=False)
+        self._stopping_stream = stream
+        self.orchestrator.download_stream = None
+        
+        # Left behind, they would be moved into the next card's client folder
+        # (finished files stay in the download cache; .part files keep for resuming)
+        for video_path in stream.local_paths:
+            try:
+                if os.path.exists(video_path):
+                    os.remove(video_path)
+            except OSError as e:
+                print(f"⚠️ Could not remove prefetched file {video_path}: {e}")
+        print("🧹 Discarded prefetched downloads")
+    
+    def _start_folder_download(self, gdrive_link, creds):
+        """Start the background download of a folder in version-letter order"""
+        if self._stopping_stream:
+            # The old threads may still hold the same .part files
+            self._stopping_stream.close()
+            self._stopping_stream = None
+        
+        return GoogleDriveClient(creds).start_folder_download(
+            gdrive_link, self.orchestrator.monitor,
+            order=VideoSorter().sort_videos_by_version_letter,
+            on_ready=self._probe_download
+        )
+    
+    def _probe_download(self, video_path):
+        """Probe a file as soon as it lands so the renderer finds it in the probe cache"""
+        get_probe_service().probe(video_path)
@@ -4,7 +4,7 @@ Sheets Writer Module - FIXED to properly use original card title for routing
 All issues with UNKNOWN worksheet resolved
 """
 
-from ...api_clients import write_to_google_sheets
+from ...api_clients import write_to_google_sheets, get_sheets_journal
 
 class SheetsWriter:
     """Handles writing results to Google Sheets"""
@@ -79,6 +79,13 @@ class SheetsWriter:
         # Prepare data rows
         data_rows = self._prepare_data_rows(processed_files, type_suffix)
         
+        # Journal the rows; the background worker writes them without holding up the job
+        journal = get_sheets_journal()
+        if journal:
+            # Routed by card title, which always finds a worksheet; the worker resolves it
+            journal.enqueue(routing_name, display_name, data_rows, creds)
+            return "Queued"
+        
         # Write to sheets with proper routing
         def write_sheets():
             try:
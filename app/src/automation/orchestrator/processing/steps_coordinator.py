@@ -4,6 +4,8 @@ Main ProcessingSteps coordinator class - REFACTORED
 Now uses modular components for file organization
 """
 
+import os
+from ...api_clients import DownloadError
 from .project_setup import ProjectSetup
 from .video_processor import VideoProcessingOrchestrator
 from .sheets_writer import SheetsWriter
@@ -47,6 +49,75 @@ class ProcessingSteps:
         """Step 3: Download videos and set up project structure"""
         return self.project_setup.download_and_setup(card_data, project_info)
     
+    def start_prefetch(self, card_data):
+        """Start downloading the card's footage before the user confirms"""
+        self.project_setup.start_prefetch(card_data)
+    
+    def discard_prefetch(self):
+        """Cancel a prefetch whose job will not run"""
+        self.project_setup.discard_prefetch()
+    
+    def wait_for_download(self, video_path):
+        """Block until a client video downloading in the background is on disk"""
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if not stream or video_path not in stream.local_paths:
+            return
+        
+        if stream.is_ready(video_path):
+            return
+        
+        print(f"⏳ Waiting for download: {os.path.basename(video_path)}")
+        try:
+            # Download progress keeps the job alive only while it is waiting here
+            with self.orchestrator.monitor.waiting_for_downloads():
+                stream.wait_for(video_path)
+        except DownloadError as e:
+            raise Exception(f"Failed to download videos: {e}")
+    
+    def wait_for_all_downloads(self):
+        """Block until every client video downloading in the background is on disk"""
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if not stream:
+            return
+        
+        # Lifts the look-ahead limit, or the files nobody has rendered yet
+        # would hold every slot
+        with self.orchestrator.monitor.waiting_for_downloads():
+            _, error = stream.wait_all()
+        if error:
+            raise Exception(f"Failed to download videos: {error}")
+    
+    def release_download(self, video_path):
+        """Let the next background download start once a client video has been rendered"""
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if stream and video_path in stream.local_paths:
+            stream.release(video_path)
+    
+    def is_download_ready(self, video_path):
+        """
+        Check without blocking whether wait_for_download() would return at once
+        
+        Also True once the downloads have failed or stopped, so the caller's
+        wait_for_download() raises instead of waiting
+        """
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if not stream or video_path not in stream.local_paths:
+            return True
+        return stream.is_ready(video_path) or stream.is_finished()
+    
+    def finish_downloads(self, wait=True):
+        """
+        Stop background downloads that are no longer needed
+        
+        Args:
+            wait: Block until running downloads have stopped (needed before the
+                downloads directory is moved or removed)
+        """
+        stream = getattr(self.orchestrator, 'download_stream', None)
+        if stream:
+            stream.close(wait=wait)
+            self.orchestrator.download_stream = None
+    
     def process_videos(self, client_videos, project_paths, project_info, processing_mode, creds):
         """Step 4: Process all videos based on mode"""
         # Sort videos first
@@ -76,6 +147,9 @@ class ProcessingSteps:
         """
         print("\n--- Step 6: Organizing Files & Cleanup ---")
         
+        # Nothing may still be writing into the downloads directory while it is moved
+        self.finish_downloads()
+        
         try:
             # Import config for downloads directory
             from ...api_clients.config import DOWNLOADS_DIR
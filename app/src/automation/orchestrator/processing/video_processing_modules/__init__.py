@@ -9,11 +9,15 @@ from .mode_processors import ModeProcessor
 from .video_validator import VideoValidator
 from .timeout_manager import TimeoutManager
 from .output_builder import OutputBuilder
+from .parallel_renderer import ParallelRenderer
+from .job_manifest import JobManifest
 
 __all__ = [
     'PathHandler',
     'ModeProcessor',
     'VideoValidator',
     'TimeoutManager',
-    'OutputBuilder'
+    'OutputBuilder',
+    'ParallelRenderer',
+    'JobManifest'
 ]
\ No newline at end of file
@@ -0,0 +1,188 @@
+# app/src/automation/orchestrator/processing/video_processing_modules/job_manifest.py
+"""
+Job Manifest Module
+Checkpoints every planned output with a fingerprint of its inputs and encode
+settings so a rerun only renders what is missing
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, List, Optional
+from ....video_processing import get_content_hasher
+
+MANIFEST_FILENAME = "job_manifest.json"
+
+def get_partial_output_path(output_path: str) -> str:
+    """Temp name an output is written under until it is complete"""
+    stem, ext = os.path.splitext(output_path)
+    return f"{stem}.partial{ext}"
+
+def commit_partial_output(partial_path: str, output_path: str):
+    """Move a finished output into place in one step"""
+    os.replace(partial_path, output_path)
+
+
+class JobManifest:
+    """
+    Per-project record of planned outputs and completed modes
+    
+    The manifest lives in the project root. Each output is keyed by its path
+    relative to the project and stores the fingerprint it was rendered with;
+    a rerun skips an output when the fingerprint matches and the file on disk
+    still has the recorded size.
+    """
+    
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        self.manifest_path = os.path.join(project_root, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._data = self._load()
+    
+    def build_fingerprint(self, input_paths: List[str], recipe: Dict) -> Optional[str]:
+        """
+        Fingerprint a render from the contents of its inputs and its recipe
+        
+        Client videos downloaded from Drive are identified by their
+        md5Checksum, recorded at download time; other inputs by a SHA-256
+        the content hasher keeps per (path, size, mtime).
+        
+        Args:
+            input_paths: Every file the render reads, in order
+            recipe: JSON-serializable encode settings
+        
+        Returns:
+            Hex digest, or None if an input could not be hashed
+        """
+        hasher = get_content_hasher()
+        input_hashes = []
+        for input_path in input_paths:
+            digest = hasher.get_hash(input_path)
+            if not digest:
+                return None
+            input_hashes.append(digest)
+        
+        payload = json.dumps({'inputs': input_hashes, 'recipe': recipe}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def is_output_complete(self, output_path: str, fingerprint: Optional[str]) -> bool:
+        """Check whether an output was completed with this fingerprint and is still on disk"""
+        if not fingerprint:
+            return False
+        
+        with self._lock:
+            entry = self._data['outputs'].get(self._key(output_path))
+        
+        if not entry or entry.get('status') != 'complete' or entry.get('fingerprint') != fingerprint:
+            return False
+        
+        try:
+            return os.path.getsize(output_path) == entry.get('size')
+        except OSError:
+            return False
+    
+    def mark_output_pending(self, output_path: str, fingerprint: Optional[str]):
+        """Record that an output is about to be rendered"""
+        with self._lock:
+            self._data['outputs'][self._key(output_path)] = {
+                'fingerprint': fingerprint,
+                'status': 'pending',
+                'updated_at': time.time()
+            }
+            self._save()
+    
+    def mark_output_complete(self, output_path: str, fingerprint: Optional[str]):
+        """Record that an output finished and is in place"""
+        try:
+            size = os.path.getsize(output_path)
+        except OSError:
+            return
+        
+        with self._lock:
+            self._data['outputs'][self._key(output_path)] = {
+                'fingerprint': fingerprint,
+                'status': 'complete',
+                'size': size,
+                'updated_at': time.time()
+            }
+            self._save()
+    
+    def has_mode(self, mode: str) -> bool:
+        """Check whether any earlier run recorded this mode as complete"""
+        with self._lock:
+            return mode in self._data['modes']
+    
+    def get_completed_mode(self, mode: str, fingerprint: Optional[str]) -> Optional[List[Dict]]:
+        """
+        Get the processed files of a mode that already completed with this fingerprint
+        
+        Returns:
+            The mode's processed file list, or None if the mode has to run
+        """
+        if not fingerprint:
+            return None
+        
+        with self._lock:
+            entry = self._data['modes'].get(mode)
+        
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return None
+        
+        processed_files = entry.get('processed_files', [])
+        for processed_file in processed_files:
+            output_path = processed_file.get('output_path')
+            with self._lock:
+                output_entry = self._data['outputs'].get(self._key(output_path)) if output_path else None
+            if not output_entry or output_entry.get('status') != 'complete':
+                return None
+            if not self.is_output_complete(output_path, output_entry.get('fingerprint')):
+                return None
+        
+        return processed_files
+    
+    def mark_mode_complete(self, mode: str, fingerprint: Optional[str], processed_files: List[Dict]):
+        """Record that a mode rendered, logged and reported all of its outputs"""
+        if not fingerprint:
+            return
+        
+        with self._lock:
+            self._data['modes'][mode] = {
+                'fingerprint': fingerprint,
+                'processed_files': processed_files,
+                'completed_at': time.time()
+            }
+            self._save()
+    
+    def _key(self, output_path: str) -> str:
+        """Manifest key for an output, stable if the project folder moves"""
+        return os.path.relpath(os.path.abspath(output_path), os.path.abspath(self.project_root))
+    
+    def _load(self) -> Dict:
+        """Load the manifest from the project folder"""
+        data = {'outputs': {}, 'modes': {}}
+        if not os.path.exists(self.manifest_path):
+            return data
+        
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            data['outputs'].update(stored.get('outputs', {}))
+            data['modes'].update(stored.get('modes', {}))
+            print(f"📋 Loaded job manifest: {len(data['outputs'])} output(s), {len(data['modes'])} completed mode(s)")
+        except Exception as e:
+            print(f"⚠️ Could not read job manifest, starting fresh: {e}")
+        
+        return data
+    
+    def _save(self):
+        """Write the manifest atomically (caller holds the lock)"""
+        try:
+            os.makedirs(self.project_root, exist_ok=True)
+            temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            print(f"⚠️ Could not save job manifest: {e}")
@@ -4,8 +4,11 @@ Mode Processors Module - FIXED
 Handles different processing modes and returns actual video paths used
 """
 
-import shutil
 import os
+from dataclasses import asdict
+from ....video_processing.job_control import get_job_control
+from ....video_processing import ProcessorConfig, get_transition_timing
+from .job_manifest import get_partial_output_path, commit_partial_output
 
 class ModeProcessor:
     """Processes videos based on different modes"""
@@ -15,13 +18,24 @@ class ModeProcessor:
     
     def process_save_only(self, client_video, output_path, version_num):
         """
-        Process save_only mode - just copy the file
+        Process save_only mode - copy the file, or remux it when only the container changes
         
         Returns:
             Tuple of (result, description, endpoint_type, video_paths)
         """
+        from ....video_processor import process_video_sequence
+        
+        job = get_job_control()
+        
         def save_video():
-            shutil.copy(client_video, output_path)
+            # A remux runs ffmpeg, so the temp file is removed on cancel or timeout too
+            partial_path = get_partial_output_path(output_path)
+            job.register_output(partial_path)
+            error = process_video_sequence(client_video, partial_path, None, None, "save_only")
+            if error:
+                raise Exception(error)
+            commit_partial_output(partial_path, output_path)
+            job.complete_output(partial_path)
             return f"Saved: {os.path.basename(output_path)}"
         
         result = self.orchestrator.monitor.execute_with_activity_monitoring(
@@ -44,6 +58,88 @@ class ModeProcessor:
         """
         from ....video_processor import process_video_sequence
         
+        description, endpoint_type, video_paths = self.get_endpoint_info(client_video, processing_mode)
+        
+        # Process with FFmpeg
+        job = get_job_control()
+        
+        def process_with_ffmpeg():
+            # Render under a temp name that is removed on cancel or timeout, then move into place
+            partial_path = get_partial_output_path(output_path)
+            job.register_output(partial_path)
+            error = process_video_sequence(
+                client_video, partial_path, target_width, 
+                target_height, processing_mode
+            )
+            if error:
+                raise Exception(error)
+            commit_partial_output(partial_path, output_path)
+            job.complete_output(partial_path)
+            return f"Processed: {os.path.basename(output_path)}"
+        
+        result = self.orchestrator.monitor.execute_with_activity_monitoring(
+            process_with_ffmpeg,
+            f"Process Video v{version_num:02d}",
+            no_activity_timeout=timeout_seconds
+        )
+        
+        # Return with video_paths
+        return result, description, endpoint_type, video_paths
+    
+    def get_render_recipe(self, processing_mode, target_width=None, target_height=None):
+        """
+        Describe every setting besides the input files that shapes a rendered output
+        
+        Returns:
+            JSON-serializable dict used to fingerprint renders
+        """
+        from ....video_processor import get_processor_worker_settings
+        
+        settings = get_processor_worker_settings()
+        
+        # Client video, plus the connector and the endpoint when the mode has them
+        segment_count = 1 + ('connector' in processing_mode) + any(
+            endpoint in processing_mode for endpoint in ('quiz', 'svsl', 'vsl')
+        )
+        timing = get_transition_timing(segment_count)
+        # The smart and the full render share the timing but not the encoder settings
+        render_path = None
+        if timing:
+            render_path = 'smart' if ProcessorConfig.SMART_RENDER_ENABLED else 'full'
+        
+        return {
+            'processing_mode': processing_mode,
+            'target_width': target_width,
+            'target_height': target_height,
+            'use_transitions': settings.get('use_transitions'),
+            'transition_type': settings.get('transition_type'),
+            'transition_duration': settings.get('transition_duration'),
+            'transition_timing': asdict(timing) if timing else None,
+            'render_path': render_path,
+            'smart_render_enabled': ProcessorConfig.SMART_RENDER_ENABLED,
+            'tail_cache_enabled': ProcessorConfig.TAIL_CACHE_ENABLED,
+            'video_crf': ProcessorConfig.DEFAULT_VIDEO_CRF,
+            'audio_bitrate': ProcessorConfig.DEFAULT_AUDIO_BITRATE,
+            'segment_preset': ProcessorConfig.SEGMENT_PRESET,
+            'segment_gop_seconds': ProcessorConfig.SEGMENT_GOP_SECONDS,
+            'concat_strategy': ProcessorConfig.CONCAT_STRATEGY
+        }
+    
+    def get_render_inputs(self, client_video, processing_mode):
+        """List every file a render of this mode reads, client video first"""
+        if processing_mode == "save_only":
+            return [client_video]
+        
+        _, _, video_paths = self.get_endpoint_info(client_video, processing_mode)
+        return [client_video] + [video_paths[key] for key in sorted(video_paths)]
+    
+    def get_endpoint_info(self, client_video, processing_mode):
+        """
+        Describe the endpoint and the asset videos a mode will use
+        
+        Returns:
+            Tuple of (description, endpoint_type, video_paths)
+        """
         # Build description
         original_filename = os.path.basename(client_video)
         description = f"Copy of OO_{original_filename}"
@@ -82,21 +178,4 @@ class ModeProcessor:
             if connector_video:
                 video_paths['connector_path'] = connector_video
         
-        # Process with FFmpeg
-        def process_with_ffmpeg():
-            error = process_video_sequence(
-                client_video, output_path, target_width, 
-                target_height, processing_mode
-            )
-            if error:
-                raise Exception(error)
-            return f"Processed: {os.path.basename(output_path)}"
-        
-        result = self.orchestrator.monitor.execute_with_activity_monitoring(
-            process_with_ffmpeg,
-            f"Process Video v{version_num:02d}",
-            no_activity_timeout=timeout_seconds
-        )
-        
-        # Return with video_paths
-        return result, description, endpoint_type, video_paths
\ No newline at end of file
+        return description, endpoint_type, video_paths
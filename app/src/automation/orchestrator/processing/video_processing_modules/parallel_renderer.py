@@ -0,0 +1,178 @@
+# app/src/automation/orchestrator/processing/video_processing_modules/parallel_renderer.py
+"""
+Parallel Renderer Module
+Renders several client versions at once in a bounded process pool
+"""
+
+import os
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from ....video_processing import ProcessorConfig
+from ....video_processing.ffmpeg_runner import dispatch_progress
+from ....video_processing.remuxer import record_remux_decision
+from ....video_processing.job_control import get_job_control
+from .job_manifest import get_partial_output_path, commit_partial_output
+
+class ParallelRenderer:
+    """Renders prepared version jobs concurrently, each worker with its own VideoProcessor"""
+    
+    def __init__(self, orchestrator):
+        self.orchestrator = orchestrator
+        self.config = ProcessorConfig()
+    
+    def should_render_in_parallel(self, job_count, processing_mode):
+        """Check whether a batch is worth spreading over a process pool"""
+        if not self.config.PARALLEL_RENDER_ENABLED:
+            return False
+        if processing_mode == "save_only" or job_count <= 1:
+            return False
+        
+        workers, _ = self.config.get_render_worker_budget(job_count)
+        return workers > 1
+    
+    def render_all(self, client_videos, prepare_job, target_width, target_height,
+                   processing_mode, timeout_seconds):
+        """
+        Render every version, starting each one as soon as its download is on disk
+        
+        Versions are taken in order. While a later client video is still
+        downloading, the versions already on disk render in the pool.
+        
+        Args:
+            client_videos: Client video paths in version order
+            prepare_job: Called as prepare_job(index, client_video) once the video is
+                on disk; returns the job dict (client_video, output_path, version_num),
+                with 'render' False when the output needs no render this run
+            target_width: Target width
+            target_height: Target height
+            processing_mode: Processing mode string
+            timeout_seconds: Per-video no-activity timeout
+        
+        Returns:
+            List of (job, result) in version order; result is None for jobs not rendered
+        """
+        from ....video_processor import (get_processor_worker_settings,
+                                         init_render_worker, render_in_worker)
+        
+        workers, threads = self.config.get_render_worker_budget(len(client_videos))
+        settings = get_processor_worker_settings()
+        monitor = self.orchestrator.monitor
+        processing_steps = self.orchestrator.processing_steps
+        job = get_job_control()
+        
+        print(f"🚀 Rendering up to {len(client_videos)} versions in parallel: "
+              f"{workers} workers × {threads} encoder threads")
+        
+        # Workers announce their pid, then send their ffmpeg progress back here
+        # to reach the monitor and the UI
+        manager = multiprocessing.Manager()
+        progress_queue = manager.Queue()
+        worker_pids = set()
+        
+        def render_pool():
+            jobs = [None] * len(client_videos)
+            results = [None] * len(client_videos)
+            partial_paths = {}
+            futures = {}
+            pending = set()
+            next_index = 0
+            rendered = 0
+            
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=init_render_worker,
+                                     initargs=(settings, threads, progress_queue)) as executor:
+                try:
+                    while next_index < len(client_videos) or pending:
+                        # Submit every version whose download has landed, in order
+                        while next_index < len(client_videos):
+                            client_video = client_videos[next_index]
+                            if pending and not processing_steps.is_download_ready(client_video):
+                                break
+                            # Nothing is rendering, so just block on the download
+                            processing_steps.wait_for_download(client_video)
+                            
+                            render_job = prepare_job(next_index, client_video)
+                            jobs[next_index] = render_job
+                            if render_job.get('render', True):
+                                partial_path = get_partial_output_path(render_job['output_path'])
+                                job.register_output(partial_path)
+                                partial_paths[next_index] = partial_path
+                                future = executor.submit(
+                                    render_in_worker, render_job['client_video'], partial_path,
+                                    target_width, target_height, processing_mode
+                                )
+                                futures[future] = next_index
+                                pending.add(future)
+                            else:
+                                processing_steps.release_download(client_video)
+                            next_index += 1
+                        
+                        if not pending:
+                            continue
+                        
+                        done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+                        self._forward_worker_progress(progress_queue, job, worker_pids)
+                        
+                        if monitor.timeout_occurred and monitor.timeout_exception:
+                            raise monitor.timeout_exception
+                        job.check_cancelled()
+                        
+                        for future in done:
+                            index = futures[future]
+                            render_job = jobs[index]
+                            error = future.result()
+                            if error:
+                                raise Exception(error)
+                            
+                            commit_partial_output(partial_paths[index], render_job['output_path'])
+                            job.complete_output(partial_paths[index])
+                            processing_steps.release_download(client_videos[index])
+                            results[index] = f"Processed: {os.path.basename(render_job['output_path'])}"
+                            rendered += 1
+                            print(f"✅ Version {render_job['version_num']:02d} rendered "
+                                  f"({rendered}/{len(futures)} started)")
+                            monitor.update_activity(f"Rendered {rendered}/{len(futures)} versions")
+                except BaseException as e:
+                    for future in pending:
+                        future.cancel()
+                    # Pick up workers that started since the last poll before killing them
+                    self._forward_worker_progress(progress_queue, job, worker_pids)
+                    # Kill the workers so the pool shuts down now, not when their renders finish
+                    job.terminate(f"Parallel render stopped: {e}")
+                    raise
+                finally:
+                    for pid in worker_pids:
+                        job.unregister_process(pid)
+            
+            return list(zip(jobs, results))
+        
+        # Each job shares the CPU with the others, so allow the slowest one proportionally longer
+        try:
+            return monitor.execute_with_activity_monitoring(
+                render_pool,
+                f"Process Videos ({len(client_videos)} versions, parallel)",
+                no_activity_timeout=timeout_seconds * workers
+            )
+        finally:
+            manager.shutdown()
+    
+    def _forward_worker_progress(self, progress_queue, job, worker_pids):
+        """
+        Drain the worker queue: register announced worker pids with the job, so
+        cancelling it kills their ffmpeg trees, count their remux decisions and
+        re-dispatch progress events here
+        """
+        while True:
+            try:
+                progress = progress_queue.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                return
+            
+            if 'worker_pid' in progress:
+                worker_pids.add(progress['worker_pid'])
+                job.register_pid(progress['worker_pid'])
+            elif 'remux_decision' in progress:
+                record_remux_decision(progress['remux_decision'])
+            else:
+                dispatch_progress(progress)
@@ -9,9 +9,13 @@ from ...api_clients import write_to_google_sheets
 from ...video_processor import (get_video_dimensions, set_processor_account_platform)
 from ....naming_generator import generate_output_name, get_image_description
 from .video_sorter import VideoSorter
+from ...video_processing.ffmpeg_runner import progress_listener, format_progress
+from ...video_processing.job_control import get_job_control
+from ...video_processing.render_cache import get_render_cache
+from ...video_processing.remuxer import reset_remux_stats, print_remux_stats
 from .video_processing_modules import (
     PathHandler, ModeProcessor, VideoValidator, 
-    TimeoutManager, OutputBuilder
+    TimeoutManager, OutputBuilder, ParallelRenderer, JobManifest
 )
 
 class VideoProcessingOrchestrator:
@@ -26,6 +30,9 @@ class VideoProcessingOrchestrator:
         self.mode_processor = ModeProcessor(orchestrator)
         self.timeout_manager = TimeoutManager()
         self.output_builder = OutputBuilder()
+        self.parallel_renderer = ParallelRenderer(orchestrator)
+        self.manifest = None
+        self.render_cache = get_render_cache()
     
     def process_all_videos(self, sorted_client_videos, project_paths, project_info, 
                           processing_mode, creds):
@@ -48,30 +55,154 @@ class VideoProcessingOrchestrator:
         # Get starting version number
         start_version = self._get_starting_version(project_info, processing_mode, creds)
         
-        # Process each video
-        processed_files = []
-        for i, client_video in enumerate(sorted_client_videos):
-            version_num = start_version + i
+        # Outputs completed by an earlier run of this card are skipped
+        self.manifest = JobManifest(project_paths['project_root'])
+        reset_remux_stats()
+        
+        # Every ffmpeg progress line counts as activity for the no-activity timeout
+        with progress_listener(self._report_ffmpeg_progress):
+            if self.parallel_renderer.should_render_in_parallel(len(sorted_client_videos), processing_mode):
+                # Each version joins the process pool as soon as its download lands
+                return self._process_videos_parallel(
+                    sorted_client_videos, project_paths, project_info, processing_mode,
+                    start_version, target_width, target_height
+                )
+            
+            # Process each video
+            processed_files = []
+            for i, client_video in enumerate(sorted_client_videos):
+                get_job_control().check_cancelled()
+                version_num = start_version + i
+                letter = self.video_sorter.extract_version_letter(os.path.basename(client_video))
+                
+                print(f"\n--- Processing Version {version_num:02d} (Letter {letter or 'N/A'}) ---")
+                
+                # Later versions may still be downloading while this one renders
+                self.orchestrator.processing_steps.wait_for_download(client_video)
+                
+                processed_file = self.process_single_video(
+                    client_video, project_paths, project_info, processing_mode,
+                    version_num, target_width, target_height
+                )
+                self.orchestrator.processing_steps.release_download(client_video)
+                
+                processed_file['version_letter'] = letter if letter else ''
+                processed_files.append(processed_file)
+            
+            self._print_render_cache_stats(processing_mode)
+            return processed_files
+    
+    def _report_ffmpeg_progress(self, progress):
+        """Feed ffmpeg progress to the activity monitor"""
+        self.orchestrator.monitor.update_activity(format_progress(progress))
+    
+    def process_single_video(self, client_video, project_paths, project_info, 
+                        processing_mode, version_num, target_width, target_height):
+        """
+        Process a single video file - FIXED to handle video paths
+        """
+        
+        # Steps 1-3: Validate paths, generate output name, prepare output path
+        job = self._prepare_single_video(client_video, project_info, processing_mode, version_num)
+        client_video = job['client_video']
+        output_path = job['output_path']
+        
+        manifest = self._get_manifest(project_paths)
+        fingerprint = self._get_output_fingerprint(manifest, job, processing_mode, target_width, target_height)
+        if manifest.is_output_complete(output_path, fingerprint):
+            return self._finish_reused_video(job, processing_mode, "Skipped (already rendered)")
+        if self._restore_cached_render(output_path, fingerprint, processing_mode):
+            manifest.mark_output_complete(output_path, fingerprint)
+            return self._finish_reused_video(job, processing_mode, "Reused cached render")
+        manifest.mark_output_pending(output_path, fingerprint)
+        
+        # Step 4: Process based on mode
+        video_paths = {}  # Initialize
+        
+        if processing_mode == "save_only":
+            # Now expects 4 return values
+            result, description, endpoint_type, video_paths = self.mode_processor.process_save_only(
+                client_video, output_path, version_num
+            )
+        else:
+            # Validate required videos exist
+            self._validate_required_videos(project_info, project_paths, processing_mode)
+            
+            # Get appropriate timeout
+            timeout = self.timeout_manager.get_processing_timeout(processing_mode)
+            
+            # Process with transitions - now returns video_paths
+            result, description, endpoint_type, video_paths = self.mode_processor.process_with_transitions(
+                client_video, output_path, target_width, target_height,
+                processing_mode, timeout, version_num
+            )
+        
+        manifest.mark_output_complete(output_path, fingerprint)
+        self._store_render(output_path, fingerprint, processing_mode)
+        
+        # Step 5: Build output information with actual video paths
+        return self._finish_single_video(job, result, description, endpoint_type, video_paths)
+    
+    def _process_videos_parallel(self, sorted_client_videos, project_paths, project_info,
+                                 processing_mode, start_version, target_width, target_height):
+        """Render versions in a process pool as their downloads land, then finish in order"""
+        self._validate_required_videos(project_info, project_paths, processing_mode)
+        reused = {}
+        
+        def prepare_job(index, client_video):
+            version_num = start_version + index
             letter = self.video_sorter.extract_version_letter(os.path.basename(client_video))
             
-            print(f"\n--- Processing Version {version_num:02d} (Letter {letter or 'N/A'}) ---")
+            print(f"\n--- Preparing Version {version_num:02d} (Letter {letter or 'N/A'}) ---")
             
-            processed_file = self.process_single_video(
-                client_video, project_paths, project_info, processing_mode,
-                version_num, target_width, target_height
+            job = self._prepare_single_video(client_video, project_info, processing_mode, version_num)
+            job['letter'] = letter
+            job['fingerprint'] = self._get_output_fingerprint(
+                self.manifest, job, processing_mode, target_width, target_height
             )
             
-            processed_file['version_letter'] = letter if letter else ''
+            if self.manifest.is_output_complete(job['output_path'], job['fingerprint']):
+                reused[job['output_path']] = "Skipped (already rendered)"
+                job['render'] = False
+            elif self._restore_cached_render(job['output_path'], job['fingerprint'], processing_mode):
+                self.manifest.mark_output_complete(job['output_path'], job['fingerprint'])
+                reused[job['output_path']] = "Reused cached render"
+                job['render'] = False
+            else:
+                self.manifest.mark_output_pending(job['output_path'], job['fingerprint'])
+            return job
+        
+        timeout = self.timeout_manager.get_processing_timeout(processing_mode)
+        rendered = self.parallel_renderer.render_all(
+            sorted_client_videos, prepare_job, target_width, target_height, processing_mode, timeout
+        )
+        
+        processed_files = []
+        for job, result in rendered:
+            if result:
+                self.manifest.mark_output_complete(job['output_path'], job['fingerprint'])
+                self._store_render(job['output_path'], job['fingerprint'], processing_mode)
+                description, endpoint_type, video_paths = self.mode_processor.get_endpoint_info(
+                    job['client_video'], processing_mode
+                )
+                processed_file = self._finish_single_video(
+                    job, result, description, endpoint_type, video_paths
+                )
+            else:
+                processed_file = self._finish_reused_video(job, processing_mode, reused[job['output_path']])
+            processed_file['version_letter'] = job['letter'] if job['letter'] else ''
             processed_files.append(processed_file)
         
+        self._print_render_cache_stats(processing_mode)
         return processed_files
     
-    def process_single_video(self, client_video, project_paths, project_info, 
-                        processing_mode, version_num, target_width, target_height):
-        """
-        Process a single video file - FIXED to handle video paths
+    def _prepare_single_video(self, client_video, project_info, processing_mode, version_num):
         """
+        Validate the client path and work out the output name and path
         
+        Returns:
+            Job dict with client_video, output_name, output_path, actual_letter, version_num
+        """
         # Step 1: Validate and prepare paths
         client_video = self.path_handler.validate_and_convert_path(client_video)
         
@@ -93,44 +224,81 @@ class VideoProcessingOrchestrator:
             project_info, output_name, version_num
         )
         
-        # Step 4: Process based on mode
-        video_paths = {}  # Initialize
+        return {
+            'client_video': client_video,
+            'output_name': output_name,
+            'output_path': output_path,
+            'actual_letter': actual_letter,
+            'version_num': version_num
+        }
+    
+    def _get_manifest(self, project_paths):
+        """Get the job manifest for this project, loading it on first use"""
+        project_root = project_paths['project_root']
+        if not self.manifest or self.manifest.project_root != project_root:
+            self.manifest = JobManifest(project_root)
+        return self.manifest
+    
+    def _get_output_fingerprint(self, manifest, job, processing_mode, target_width, target_height):
+        """Fingerprint a job from its input files and render settings"""
+        input_paths = self.mode_processor.get_render_inputs(job['client_video'], processing_mode)
+        recipe = self.mode_processor.get_render_recipe(processing_mode, target_width, target_height)
+        return manifest.build_fingerprint(input_paths, recipe)
+    
+    def _restore_cached_render(self, output_path, fingerprint, processing_mode):
+        """Materialize an identical earlier render from the render cache"""
+        if not self.render_cache or not fingerprint or processing_mode == "save_only":
+            return False
+        return self.render_cache.fetch(fingerprint, output_path)
+    
+    def _store_render(self, output_path, fingerprint, processing_mode):
+        """Add a finished render to the render cache"""
+        if not self.render_cache or not fingerprint or processing_mode == "save_only":
+            return
+        self.render_cache.store(fingerprint, output_path)
+    
+    def _print_render_cache_stats(self, processing_mode):
+        """Report the render cache hit rate and remux fast-path count after a batch"""
+        if self.render_cache and processing_mode != "save_only":
+            self.render_cache.print_stats()
+        print_remux_stats()
+    
+    def _finish_reused_video(self, job, processing_mode, result_label):
+        """Build the processed file info for an output that was not rendered this run"""
+        print(f"⏭️ Version {job['version_num']:02d}: {result_label.lower()} - same inputs and settings")
         
         if processing_mode == "save_only":
-            # Now expects 4 return values
-            result, description, endpoint_type, video_paths = self.mode_processor.process_save_only(
-                client_video, output_path, version_num
-            )
+            description, endpoint_type, video_paths = "", "", {}
         else:
-            # Validate required videos exist
-            video_validator = VideoValidator(project_info, project_paths)
-            _, missing_videos = video_validator.validate_required_videos(processing_mode)
-            
-            if missing_videos:
-                error_msg = video_validator.generate_missing_video_error(
-                    missing_videos, processing_mode
-                )
-                print(f"\n{error_msg}")
-                raise Exception(error_msg)
-            
-            # Get appropriate timeout
-            timeout = self.timeout_manager.get_processing_timeout(processing_mode)
-            
-            # Process with transitions - now returns video_paths
-            result, description, endpoint_type, video_paths = self.mode_processor.process_with_transitions(
-                client_video, output_path, target_width, target_height,
-                processing_mode, timeout, version_num
+            description, endpoint_type, video_paths = self.mode_processor.get_endpoint_info(
+                job['client_video'], processing_mode
             )
         
-        # Step 5: Build output information with actual video paths
+        result = f"{result_label}: {os.path.basename(job['output_path'])}"
+        return self._finish_single_video(job, result, description, endpoint_type, video_paths)
+    
+    def _validate_required_videos(self, project_info, project_paths, processing_mode):
+        """Raise if any asset video the mode needs is missing"""
+        video_validator = VideoValidator(project_info, project_paths)
+        _, missing_videos = video_validator.validate_required_videos(processing_mode)
+        
+        if missing_videos:
+            error_msg = video_validator.generate_missing_video_error(
+                missing_videos, processing_mode
+            )
+            print(f"\n{error_msg}")
+            raise Exception(error_msg)
+    
+    def _finish_single_video(self, job, result, description, endpoint_type, video_paths):
+        """Build the processed file info for a rendered job"""
         processed_file_info = self.output_builder.build_processed_file_info(
-            client_video, output_path, output_name, version_num,
-            actual_letter, video_paths,  # Now contains actual paths used
+            job['client_video'], job['output_path'], job['output_name'], job['version_num'],
+            job['actual_letter'], video_paths,  # Now contains actual paths used
             description, endpoint_type
         )
         
         print(f"✅ {result}")
-        print(f"📁 Output saved to: {output_path}")
+        print(f"📁 Output saved to: {job['output_path']}")
         
         return processed_file_info
     
@@ -139,6 +307,8 @@ class VideoProcessingOrchestrator:
         if processing_mode == "save_only" or not sorted_client_videos:
             return None, None
         
+        self.orchestrator.processing_steps.wait_for_download(sorted_client_videos[0])
+        
         def get_dimensions():
             width, height, error = get_video_dimensions(sorted_client_videos[0])
             if error:
@@ -12,6 +12,7 @@ class UIPreparation:
     
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
+        self._listed_files = None  # Drive listing behind the last confirmation data
     
     def prepare_confirmation_data(self):
         """Prepare data for the confirmation dialog - FIXED to preserve card title"""
@@ -147,6 +148,7 @@ class UIPreparation:
         # NEW: Lightweight approach - just count files, don't download
         print("🔍 Getting video count from Google Drive (lightweight)...")
         
+        self._listed_files = None
         video_list = self._get_video_list_from_drive()
         
         print(f"DEBUG: Using videos for UI: {video_list}")
@@ -158,7 +160,8 @@ class UIPreparation:
             processing_mode=self.orchestrator.processing_mode,
             project_info=self.orchestrator.project_info,
             downloaded_videos=video_list,  # Use video list for display
-            validation_issues=asset_issues
+            validation_issues=asset_issues,
+            listed_files=self._listed_files
         )
         
         # Enhance confirmation data with account/platform for dropdown display
@@ -205,19 +208,13 @@ class UIPreparation:
                 print(f"❌ Could not get Google credentials")
                 return self._create_fallback_video_list()
             
-            # Create Drive service and list files (NO DOWNLOAD)
-            from googleapiclient.discovery import build
-            service = build("drive", "v3", credentials=creds)
+            # List every page of the folder (NO DOWNLOAD)
+            from ..api_clients.drive_listing import DriveListingService
+            files = DriveListingService(creds).list_video_files(folder_id)
             
-            # Query for video files in the folder
-            query = f"'{folder_id}' in parents and mimeType contains 'video/'"
-            results = service.files().list(
-                q=query, 
-                fields="files(id, name, size)"
-            ).execute()
-            
-            files = results.get("files", [])
-            print(f"📁 Found {len(files)} video files in Google Drive folder")
+            # Sizes and durations are known up front; the confirmation tab shows them
+            self._print_listing_summary(DriveListingService.summarize(files))
+            self._listed_files = files
             
             if not files:
                 print(f"⚠️ No video files found in Google Drive folder")
@@ -236,6 +233,18 @@ class UIPreparation:
             print(f"❌ Error getting video list from Google Drive: {e}")
             return self._create_fallback_video_list()
     
+    def _print_listing_summary(self, summary):
+        """Print what the Drive listing says about the job"""
+        if not summary['file_count']:
+            return
+        
+        print(f"📊 Drive listing: {summary['file_count']} files, {summary['total_bytes'] / (1024 ** 3):.2f} GB, "
+              f"{summary['total_duration'] / 60:.1f} min of video")
+        if summary['max_width']:
+            print(f"   📐 Largest source: {summary['max_width']}x{summary['max_height']}")
+        if summary['missing_metadata']:
+            print(f"   ⚠️ Drive has no video metadata yet for: {', '.join(summary['missing_metadata'])}")
+    
     def _create_fallback_video_list(self):
         """Create fallback video list when Google Drive access fails"""
         project_name = self.orchestrator.project_info.get('project_name', 'Video')
@@ -7,6 +7,7 @@ Split from ui_integration.py for better organization
 
 import time
 import os
+from ..video_processing.ffmpeg_runner import progress_listener, band_progress
 
 class UIProcessing:
     """Handles UI processing operations"""
@@ -46,20 +47,17 @@ class UIProcessing:
             from ..video_processor import set_processor_account_platform
             set_processor_account_platform(account_code, platform_code)
         
-        total_videos = len(downloaded_videos)
+        progress_callback(60, f"Processing {len(downloaded_videos)} videos...")
         
-        for i, video in enumerate(downloaded_videos, 1):
-            progress = 60 + (30 * i / total_videos)
-            progress_callback(progress, f"Processing video {i}/{total_videos}...")
-        
-        # Process videos using the processing_steps
-        processed_files = self.orchestrator.processing_steps.process_videos(
-            downloaded_videos,
-            project_paths,
-            project_info,
-            processing_mode,
-            creds
-        )
+        # Process videos using the processing_steps, moving through 60-90% with live render progress
+        with progress_listener(band_progress(progress_callback, 60, 90)):
+            processed_files = self.orchestrator.processing_steps.process_videos(
+                downloaded_videos,
+                project_paths,
+                project_info,
+                processing_mode,
+                creds
+            )
         
         # CRITICAL FIX: Use try/finally to ensure cleanup ALWAYS runs
         sheets_success = False
@@ -48,6 +48,25 @@ class UISheets:
             for pf in processed_files
         ]
         
+        # Journal the rows; the background worker writes them without holding up the job
+        from ..api_clients import get_sheets_journal
+        journal = get_sheets_journal()
+        if journal:
+            detected = (getattr(self.orchestrator, 'detected_account_code', 'UNKNOWN'),
+                        getattr(self.orchestrator, 'detected_platform_code', 'UNKNOWN'))
+            if 'UNKNOWN' in detected:
+                print(f"⚠️ NO DETECTED ACCOUNT/PLATFORM CODES - worksheet will be routed by name")
+                detected = (None, None)
+            # A block with no worksheet to go to is the operator's to fix, not the worker's
+            error = journal.check_route(creds, account_code=detected[0], platform_code=detected[1])
+            if error:
+                print(f"❌ WORKSHEET ROUTING ERROR: {error}")
+                raise Exception(f"Google Sheets routing failed: {error}")
+            journal.enqueue(routing_name, column1_name, data_to_write, creds,
+                            account_code=detected[0], platform_code=detected[1])
+            self._cleanup_temp_files()
+            return
+        
         def write_results():
             # Use detected account/platform for precise worksheet routing
             if (hasattr(self.orchestrator, 'detected_account_code') and 
@@ -160,6 +179,7 @@ class UISheets:
     def _cleanup_temp_files(self):
         """Cleanup temporary files"""
         print("\n--- Step 6: Cleaning up temporary files ---")
+        self.orchestrator.processing_steps.finish_downloads()
         temp_dir = "temp_downloads"
         
         if os.path.exists(temp_dir):
@@ -34,6 +34,14 @@ def generate_breakdown_report(processed_files, output_folder, duration, use_tran
     file_analyzer = FileAnalyzer(duration_calc)
     writer = ReportWriter()
     
+    # Probe every output and component file in one concurrent batch
+    duration_calc.prefetch([
+        file_info.get(key)
+        for file_info in processed_files
+        for key in ('output_path', 'client_video_path', 'connector_path',
+                    'quiz_path', 'svsl_path', 'vsl_path')
+    ])
+    
     # Start building report
     lines = []
     
@@ -1,18 +1,23 @@
 # app/src/automation/reports/report_modules/duration_calculator.py
 """
 Duration Calculator Module
-Handles video duration calculations using ffprobe
+Handles video duration calculations through the shared probe service
 """
 
 import os
 import subprocess
-import json
+from ...video_processing.probe_service import get_probe_service
 
 class DurationCalculator:
     """Calculates and caches video durations"""
     
     def __init__(self):
         self.duration_cache = {}
+        self.prober = get_probe_service()
+    
+    def prefetch(self, video_paths):
+        """Probe many files concurrently so later lookups are served from the cache"""
+        self.prober.probe_many(video_paths)
     
     def get_video_duration(self, video_path):
         """
@@ -55,37 +60,21 @@ class DurationCalculator:
     
     def _get_format_duration(self, video_path):
         """Get duration from format information"""
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'json', video_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        data = self.prober.probe(video_path)
         
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if 'format' in data and 'duration' in data['format']:
-                return float(data['format']['duration'])
+        if data and 'duration' in data.get('format', {}):
+            return float(data['format']['duration'])
         
         return 0
     
     def _get_stream_duration(self, video_path):
-        """Get duration from stream information"""
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=duration',
-            '-of', 'json', video_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        """Get duration from the first video stream"""
+        data = self.prober.probe(video_path)
         
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if 'streams' in data and len(data['streams']) > 0:
-                if 'duration' in data['streams'][0]:
-                    return float(data['streams'][0]['duration'])
+        if data:
+            video_streams = [s for s in data.get('streams', []) if s.get('codec_type') == 'video']
+            if video_streams and 'duration' in video_streams[0]:
+                return float(video_streams[0]['duration'])
         
         return 0
     
@@ -1,6 +1,7 @@
 # app/src/automation/robust_monitoring.py
 import time
 import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional, Callable, Any
 
@@ -30,6 +31,10 @@ class RobustMonitoringSystem:
         self.monitor_active: bool = False
         self.timeout_occurred: bool = False
         self.timeout_exception: Optional[Exception] = None
+        # Background downloads report here rather than to last_activity_time
+        self.last_download_activity_time: Optional[float] = None
+        self.download_waits: int = 0
+        self._download_lock = threading.Lock()
     
     def execute_with_activity_monitoring(self, 
                                         operation_func: Callable, 
@@ -85,6 +90,11 @@ class RobustMonitoringSystem:
         except Exception as e:
             # Properly stop monitoring on error
             self._stop_current_monitor()
+            
+            # Work killed by the timeout fails with its own error; report the timeout instead
+            if self.timeout_occurred and self.timeout_exception:
+                raise self.timeout_exception from e
+            
             print(f"❌ {operation_name} failed: {str(e)}")
             raise e
     
@@ -108,6 +118,38 @@ class RobustMonitoringSystem:
             if message and self.current_status:
                 self.current_status.message = message
     
+    def update_download_activity(self, message: Optional[str] = None):
+        """
+        Call this to indicate a background download is making progress
+        
+        Downloads run beside the render, so their progress must not keep a
+        stalled render alive; it only counts while the job is blocked inside
+        waiting_for_downloads()
+        """
+        self.last_download_activity_time = time.time()
+        if message and self.current_status and self.download_waits:
+            self.current_status.message = message
+    
+    @contextmanager
+    def waiting_for_downloads(self):
+        """Count download progress as activity while the job waits on a file"""
+        with self._download_lock:
+            self.download_waits += 1
+        try:
+            yield
+        finally:
+            with self._download_lock:
+                self.download_waits -= 1
+            # The wait itself was not a stall of the step that resumes now
+            self.update_activity()
+    
+    def _last_activity(self) -> float:
+        """Latest heartbeat that counts towards the no-activity timeout"""
+        last_activity = self.last_activity_time
+        if self.download_waits and self.last_download_activity_time:
+            last_activity = max(last_activity, self.last_download_activity_time)
+        return last_activity
+    
     def _monitor_activity(self, operation_name: str, no_activity_timeout: int):
         """Monitor for activity in a separate thread"""
         
@@ -121,7 +163,7 @@ class RobustMonitoringSystem:
                 break
             
             current_time = time.time()
-            time_since_activity = current_time - self.last_activity_time
+            time_since_activity = current_time - self._last_activity()
             
             # Log periodic status
             if current_time - last_check_time >= 10:  # Every 10 seconds
@@ -140,6 +182,10 @@ class RobustMonitoringSystem:
                     self.timeout_occurred = True
                     self.timeout_exception = ActivityTimeoutError(operation_name, no_activity_timeout)
                     self.monitor_active = False
+                    
+                    # Stop the job's ffmpeg processes now rather than when they finish
+                    from .video_processing.job_control import cancel_current_job
+                    cancel_current_job(str(self.timeout_exception))
                     break
         
         print(f"📊 Activity monitor stopped for {operation_name}")
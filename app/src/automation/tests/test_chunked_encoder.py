@@ -0,0 +1,104 @@
+# app/src/automation/tests/test_chunked_encoder.py
+"""
+Tests for how the chunked encoder splits a long clip
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.video_processing import chunked_encoder
+from automation.video_processing.chunked_encoder import ChunkedEncoder
+
+SPECS = {'width': 1080, 'height': 1920, 'frame_rate': 30, 'sample_rate': 48000}
+
+
+class TestPlanChunks(unittest.TestCase):
+    """ChunkedEncoder._plan_chunks against a fake keyframe list"""
+    
+    def setUp(self):
+        self.encoder = ChunkedEncoder()
+        self.start_time = 0.0
+        self.keyframes = []
+        
+        analyzer = mock.Mock()
+        analyzer.prober.probe.side_effect = lambda path: {'format': {'start_time': str(self.start_time)}}
+        analyzer.get_keyframe_times.side_effect = lambda path, start=None, end=None: [
+            k for k in self.keyframes if start <= k <= end
+        ]
+        self.encoder.analyzer = analyzer
+        
+        patches = [
+            mock.patch.object(self.encoder.config, 'CHUNKED_ENCODE_WORKERS', 4),
+            mock.patch.object(self.encoder.config, 'CHUNKED_ENCODE_MIN_CHUNK_SECONDS', 120),
+            mock.patch.object(self.encoder.config, 'CHUNKED_ENCODE_KEYFRAME_WINDOW', 10),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def keyframes_every(self, seconds, duration, offset=0.0):
+        return [offset + i * seconds for i in range(int(duration // seconds) + 1)]
+    
+    def test_short_clip_is_not_split(self):
+        self.keyframes = self.keyframes_every(2, 200)
+        self.assertEqual(self.encoder._plan_chunks("clip.mp4", 200.0, SPECS), [])
+    
+    def test_splits_evenly_at_keyframes(self):
+        self.keyframes = self.keyframes_every(2, 2400)
+        chunks = self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS)
+        self.assertEqual(chunks, [(0.0, 18000), (600.0, 18000), (1200.0, 18000), (1800.0, None)])
+    
+    def test_render_worker_limit_disables_chunking(self):
+        """Inside a parallel render worker a long clip encodes in one pass"""
+        self.keyframes = self.keyframes_every(2, 2400)
+        with mock.patch.object(chunked_encoder, '_chunk_worker_limit', 1):
+            self.assertFalse(self.encoder.should_chunk(2400.0))
+            self.assertEqual(self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS), [])
+        self.assertTrue(self.encoder.should_chunk(2400.0))
+    
+    def test_chunk_count_limited_by_min_chunk_length(self):
+        # 300s only fits two 120s chunks
+        self.keyframes = self.keyframes_every(2, 300)
+        chunks = self.encoder._plan_chunks("clip.mp4", 300.0, SPECS)
+        self.assertEqual(chunks, [(0.0, 4500), (150.0, None)])
+    
+    def test_nearest_keyframe_is_snapped_to_the_frame_grid(self):
+        # Keyframes every 5s, slightly off the 30 fps grid
+        self.keyframes = [k + 0.004 for k in self.keyframes_every(5, 2400)]
+        chunks = self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS)
+        self.assertEqual([start for start, _ in chunks], [0.0, 600.0, 1200.0, 1800.0])
+        for start, frame_count in chunks[:-1]:
+            self.assertIsInstance(frame_count, int)
+    
+    def test_frame_counts_add_up_to_the_split_points(self):
+        self.keyframes = [0.0, 597.3, 1203.7, 1801.1, 2400.0]
+        chunks = self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS)
+        starts = [start for start, _ in chunks]
+        for (start, frame_count), next_start in zip(chunks, starts[1:]):
+            self.assertEqual(frame_count, round((next_start - start) * 30))
+        self.assertEqual(sum(count for _, count in chunks[:-1]), round(starts[-1] * 30))
+    
+    def test_keyframe_timestamps_are_relative_to_the_file_start(self):
+        self.start_time = 1.4
+        self.keyframes = self.keyframes_every(2, 2400, offset=1.4)
+        chunks = self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS)
+        self.assertEqual([start for start, _ in chunks], [0.0, 600.0, 1200.0, 1800.0])
+    
+    def test_split_without_a_nearby_keyframe_is_dropped(self):
+        # Nothing within 10s of the 1200s split point
+        self.keyframes = [k for k in self.keyframes_every(2, 2400) if not 1185 <= k <= 1215]
+        chunks = self.encoder._plan_chunks("clip.mp4", 2400.0, SPECS)
+        self.assertEqual(chunks, [(0.0, 18000), (600.0, 36000), (1800.0, None)])
+    
+    def test_no_usable_keyframe_leaves_a_single_chunk(self):
+        self.keyframes = [0.0]
+        self.assertEqual(self.encoder._plan_chunks("clip.mp4", 300.0, SPECS), [(0.0, None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,403 @@
+# app/src/automation/tests/test_drive_downloads.py
+"""
+Tests for concurrent Google Drive downloads
+
+Runs GoogleDriveClient against a local HTTP server that speaks the Drive
+media endpoint (ranged GETs), so chunking, retries, resume, checksum
+verification and duplicate file names are exercised end to end.
+"""
+
+import unittest
+import sys
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httplib2
+from googleapiclient.discovery import build
+from automation.api_clients import google_drive_client
+from automation.api_clients.google_drive_client import GoogleDriveClient
+from automation.api_clients.download_stream import DownloadStream
+
+CHUNK_SIZE = 1000
+
+class FakeDriveServer:
+    """Serves /files/<id>?alt=media with Range support and scripted faults"""
+    
+    def __init__(self):
+        self.files = {}
+        self.faults = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Seconds per response, long enough for the workers to overlap
+        self.delay = 0.02
+        self.lock = threading.Lock()
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                server.handle(self)
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+    
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+    
+    def add_file(self, file_id, data, faults=None):
+        self.files[file_id] = data
+        self.faults[file_id] = list(faults or [])
+    
+    def ranges_for(self, file_id):
+        with self.lock:
+            return [r for fid, r in self.requests if fid == file_id]
+    
+    def handle(self, handler):
+        file_id = handler.path.split('?')[0].rsplit('/', 1)[-1]
+        range_header = handler.headers.get('range')
+        with self.lock:
+            self.requests.append((file_id, range_header))
+            fault = self.faults[file_id].pop(0) if self.faults.get(file_id) else None
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        
+        try:
+            time.sleep(self.delay)
+            data = self.files[file_id]
+            
+            if fault == '503':
+                handler.send_response(503)
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return
+            
+            if fault in ('rateLimitExceeded', 'forbidden'):
+                error = json.dumps({'error': {'code': 403, 'errors': [{'reason': fault}]}}).encode('utf-8')
+                handler.send_response(403)
+                handler.send_header('Content-Type', 'application/json')
+                handler.send_header('Content-Length', str(len(error)))
+                handler.end_headers()
+                handler.wfile.write(error)
+                return
+            
+            start, end = 0, len(data) - 1
+            if range_header:
+                first, last = range_header.split('=')[1].split('-')
+                start, end = int(first), min(int(last), len(data) - 1)
+                if start >= len(data):
+                    handler.send_response(416)
+                    handler.send_header('Content-Length', '0')
+                    handler.end_headers()
+                    return
+            
+            body = data[start:end + 1]
+            if fault == 'corrupt':
+                body = bytes(b ^ 0xFF for b in body)
+            
+            handler.send_response(206 if range_header else 200)
+            handler.send_header('Content-Length', str(len(body)))
+            handler.send_header('Content-Range', f"bytes {start}-{end}/{len(data)}")
+            handler.end_headers()
+            
+            if fault == 'drop':
+                # Promise the whole range, send half, hang up
+                handler.wfile.write(body[:len(body) // 2])
+                handler.wfile.flush()
+                handler.close_connection = True
+                return
+            handler.wfile.write(body)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class LocalDriveClient(GoogleDriveClient):
+    """GoogleDriveClient whose per-thread services talk to the fake server"""
+    
+    def __init__(self, endpoint):
+        super().__init__(None)
+        self.endpoint = endpoint
+    
+    def _get_thread_service(self):
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = build("drive", "v3", http=httplib2.Http(timeout=5), cache_discovery=False,
+                            static_discovery=True, client_options={'api_endpoint': self.endpoint})
+            self._thread_local.service = service
+        return service
+
+
+def file_info(file_id, name, data, md5=True):
+    info = {'id': file_id, 'name': name, 'size': str(len(data))}
+    if md5:
+        info['md5Checksum'] = hashlib.md5(data).hexdigest()
+    return info
+
+
+class TestDriveDownloads(unittest.TestCase):
+    """GoogleDriveClient._download_files against a fake Drive endpoint"""
+    
+    def setUp(self):
+        self.server = FakeDriveServer()
+        self.client = LocalDriveClient(self.server.endpoint)
+        self.temp_dir = tempfile.mkdtemp()
+        self.downloads_dir = os.path.join(self.temp_dir, "temp_downloads")
+        os.makedirs(self.downloads_dir)
+        self.hasher = mock.Mock()
+        
+        patches = [
+            mock.patch.object(google_drive_client, 'DOWNLOADS_DIR', self.downloads_dir),
+            mock.patch.object(google_drive_client, 'DOWNLOAD_CHUNK_SIZE', CHUNK_SIZE),
+            mock.patch.object(google_drive_client, 'DOWNLOAD_BACKOFF_SECONDS', 0),
+            mock.patch.object(google_drive_client, 'DOWNLOAD_WORKERS', 4),
+            mock.patch.object(google_drive_client, 'get_download_cache', lambda: None),
+            mock.patch.object(google_drive_client, 'get_content_hasher', lambda: self.hasher),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def tearDown(self):
+        self.server.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def download(self, files):
+        """Run the downloads with a watchdog so a hang fails instead of blocking the suite"""
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.update(out=self.client._download_files(files)), daemon=True
+        )
+        worker.start()
+        worker.join(30)
+        self.assertFalse(worker.is_alive(), "downloads did not finish")
+        return result['out']
+    
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def test_concurrent_workers_download_every_file(self):
+        """Several files are fetched at once and land in listing order"""
+        payloads = {f"id{i}": os.urandom(2500 + i) for i in range(4)}
+        files = []
+        for file_id, data in payloads.items():
+            self.server.add_file(file_id, data)
+            files.append(file_info(file_id, f"clip_{file_id}.mp4", data))
+        
+        paths, error = self.download(files)
+        
+        self.assertIsNone(error)
+        self.assertEqual([os.path.basename(p) for p in paths], [f['name'] for f in files])
+        for path, data in zip(paths, payloads.values()):
+            self.assertEqual(self.read(path), data)
+        self.assertGreaterEqual(self.server.max_in_flight, 2)
+    
+    def test_downloads_are_identified_by_checksum(self):
+        """The same footage under another file ID gets the same content hash"""
+        data = os.urandom(1200)
+        self.server.add_file("orig", data)
+        self.server.add_file("copy", data)
+        
+        paths, error = self.download([file_info("orig", "orig_A.mp4", data), file_info("copy", "copy_B.mp4", data)])
+        
+        self.assertIsNone(error)
+        remembered = dict(call.args for call in self.hasher.remember.call_args_list)
+        self.assertEqual(remembered, {path: f"drive-md5:{hashlib.md5(data).hexdigest()}" for path in paths})
+    
+    def test_ranged_chunks(self):
+        """A file is requested in DOWNLOAD_CHUNK_SIZE ranges"""
+        data = os.urandom(3 * CHUNK_SIZE + 17)
+        self.server.add_file("big", data)
+        
+        paths, error = self.download([file_info("big", "big_A.mp4", data)])
+        
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+        self.assertEqual(self.server.ranges_for("big"), [
+            "bytes=0-999", "bytes=1000-1999", "bytes=2000-2999", "bytes=3000-3999"
+        ])
+    
+    def test_resume_after_dropped_connection(self):
+        """A dropped chunk is retried from the bytes already in the .part file"""
+        data = os.urandom(3 * CHUNK_SIZE)
+        # Chunk 1 arrives, chunk 2 is cut off mid-body
+        self.server.add_file("flaky", data, faults=[None, 'drop'])
+        
+        paths, error = self.download([file_info("flaky", "flaky_B.mp4", data)])
+        
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+        ranges = self.server.ranges_for("flaky")
+        self.assertEqual(ranges[:3], ["bytes=0-999", "bytes=1000-1999", "bytes=1000-1999"])
+        self.assertNotIn("bytes=0-999", ranges[1:])
+        self.assertFalse(os.path.exists(paths[0] + ".part"))
+    
+    def test_retryable_status_is_retried(self):
+        """A 503 backs off and retries instead of failing the file"""
+        data = os.urandom(CHUNK_SIZE // 2)
+        self.server.add_file("busy", data, faults=['503'])
+        
+        paths, error = self.download([file_info("busy", "busy_C.mp4", data)])
+        
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+    
+    def test_rate_limit_403_is_retried(self):
+        """A 403 that only means "slow down" is retried like a 429"""
+        data = os.urandom(CHUNK_SIZE // 2)
+        self.server.add_file("throttled", data, faults=['rateLimitExceeded'])
+        
+        paths, error = self.download([file_info("throttled", "throttled_C.mp4", data)])
+        
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+    
+    def test_permission_403_fails_at_once(self):
+        data = os.urandom(CHUNK_SIZE // 2)
+        self.server.add_file("locked", data, faults=['forbidden'])
+        
+        paths, error = self.download([file_info("locked", "locked_C.mp4", data)])
+        
+        self.assertIsNone(paths)
+        self.assertEqual(len(self.server.ranges_for("locked")), 1)
+    
+    def test_md5_mismatch_restarts_from_scratch(self):
+        """Bytes that fail the checksum are thrown away and downloaded again"""
+        data = os.urandom(2 * CHUNK_SIZE)
+        self.server.add_file("bad", data, faults=['corrupt'])
+        
+        paths, error = self.download([file_info("bad", "bad_D.mp4", data)])
+        
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+        # The retry starts at byte 0 rather than resuming the corrupt .part
+        self.assertEqual(self.server.ranges_for("bad").count("bytes=0-999"), 2)
+    
+    def test_md5_mismatch_every_time_fails(self):
+        """A file that never matches its checksum is reported, not renamed into place"""
+        data = os.urandom(CHUNK_SIZE // 2)
+        self.server.add_file("rotten", data, faults=['corrupt'] * 10)
+        
+        with mock.patch.object(google_drive_client, 'DOWNLOAD_MAX_RETRIES', 2):
+            paths, error = self.download([file_info("rotten", "rotten_E.mp4", data)])
+        
+        self.assertIsNone(paths)
+        self.assertIn("rotten_E.mp4", error)
+        self.assertFalse(os.path.exists(os.path.join(self.downloads_dir, "rotten_E.mp4")))
+    
+    def test_duplicate_names_get_distinct_paths(self):
+        """Files that share a name in the folder are all downloaded, none overwritten"""
+        first, second, other = os.urandom(1500), os.urandom(1600), os.urandom(700)
+        self.server.add_file("dupA", first)
+        self.server.add_file("dupB", second)
+        self.server.add_file("solo", other)
+        files = [
+            file_info("dupA", "same_A.mp4", first),
+            file_info("dupB", "same_A.mp4", second),
+            file_info("solo", "other_B.mp4", other),
+        ]
+        
+        paths, error = self.download(files)
+        
+        self.assertIsNone(error)
+        self.assertEqual(len(set(paths)), 3)
+        self.assertEqual([os.path.basename(p) for p in paths], ["same_A.mp4", "same_A.mp4", "other_B.mp4"])
+        self.assertEqual(self.read(paths[0]), first)
+        self.assertEqual(self.read(paths[1]), second)
+        self.assertEqual(self.read(paths[2]), other)
+    
+    def test_cancel_stops_running_transfer_and_keeps_part(self):
+        """close(wait=False) returns at once; the transfer stops after its chunk and can resume"""
+        data = os.urandom(40 * CHUNK_SIZE)
+        self.server.add_file("long", data)
+        self.server.delay = 0.05
+        files = [file_info("long", "long_F.mp4", data)]
+        local_path = os.path.join(self.downloads_dir, "long_F.mp4")
+        part_path = local_path + ".part"
+        
+        stream = self.client._start_download(files)
+        deadline = time.time() + 10
+        while not (os.path.exists(part_path) and os.path.getsize(part_path) >= 2 * CHUNK_SIZE):
+            self.assertLess(time.time(), deadline, "download never started")
+            time.sleep(0.01)
+        
+        started = time.time()
+        stream.close(wait=False)
+        self.assertLess(time.time() - started, 0.2)
+        
+        stream.close()
+        kept = os.path.getsize(part_path)
+        self.assertLess(kept, len(data))
+        self.assertFalse(os.path.exists(local_path))
+        
+        # The next download picks up where the cancelled one stopped
+        self.server.delay = 0
+        paths, error = self.download(files)
+        self.assertIsNone(error)
+        self.assertEqual(self.read(paths[0]), data)
+        self.assertIn(f"bytes={kept}-{kept + CHUNK_SIZE - 1}", self.server.ranges_for("long"))
+        self.assertEqual(self.server.ranges_for("long").count("bytes=0-999"), 1)
+
+
+class TestDownloadStream(unittest.TestCase):
+    """DownloadStream look-ahead, counted until a file is rendered"""
+    
+    def start_download(self, stream):
+        """Ask for a slot in a thread; the event is set once the slot is granted"""
+        started = threading.Event()
+        threading.Thread(target=lambda: stream.wait_for_slot() and started.set(), daemon=True).start()
+        return started
+    
+    def test_slot_frees_when_a_file_is_released_not_picked_up(self):
+        stream = DownloadStream(["a.mp4", "b.mp4", "c.mp4"], max_ahead=2)
+        self.assertTrue(stream.wait_for_slot())
+        self.assertTrue(stream.wait_for_slot())
+        stream.mark_ready("a.mp4")
+        stream.mark_ready("b.mp4")
+        
+        third = self.start_download(stream)
+        self.assertEqual(stream.wait_for("a.mp4"), "a.mp4")
+        self.assertFalse(third.wait(0.2), "picking a file up must not free its slot")
+        
+        stream.release("a.mp4")
+        self.assertTrue(third.wait(5))
+    
+    def test_wait_all_lifts_the_limit(self):
+        stream = DownloadStream(["a.mp4", "b.mp4"], max_ahead=1)
+        self.assertTrue(stream.wait_for_slot())
+        second = self.start_download(stream)
+        self.assertFalse(second.wait(0.2))
+        
+        result = {}
+        waiter = threading.Thread(target=lambda: result.update(out=stream.wait_all()), daemon=True)
+        waiter.start()
+        self.assertTrue(second.wait(5))
+        
+        stream.mark_ready("a.mp4")
+        stream.mark_ready("b.mp4")
+        waiter.join(5)
+        self.assertEqual(result['out'], (["a.mp4", "b.mp4"], None))
+
+
+if __name__ == '__main__':
+    unittest.main()
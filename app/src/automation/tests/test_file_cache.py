@@ -0,0 +1,131 @@
+# app/src/automation/tests/test_file_cache.py
+"""
+Tests for the size-capped LRU file cache
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import itertools
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.video_processing import file_cache
+from automation.video_processing.file_cache import FileCache, prune_path_index
+
+
+class TestFileCache(unittest.TestCase):
+    """FileCache store/fetch/evict on a temp directory"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        # A strictly increasing clock, so LRU order never depends on timer resolution
+        clock = itertools.count(1000)
+        patcher = mock.patch.object(file_cache.time, 'time', side_effect=lambda: next(clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def make_file(self, name, size):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size))
+        return path
+    
+    def test_hit_restores_identical_file(self):
+        cache = FileCache(self.cache_dir, max_bytes=1000)
+        source = self.make_file("a.mp4", 100)
+        cache.store("key_a", source)
+        
+        dest = os.path.join(self.temp_dir, "out", "a.mp4")
+        self.assertTrue(cache.fetch("key_a", dest))
+        with open(source, 'rb') as f, open(dest, 'rb') as g:
+            self.assertEqual(f.read(), g.read())
+        self.assertFalse(cache.fetch("key_b", dest))
+        self.assertEqual((cache.get_stats()['hits'], cache.get_stats()['misses']), (1, 1))
+    
+    def test_evicts_least_recently_used_over_quota(self):
+        cache = FileCache(self.cache_dir, max_bytes=250)
+        for name in ("a", "b"):
+            cache.store(f"key_{name}", self.make_file(f"{name}.mp4", 100))
+        
+        # Using a makes b the least recently used
+        self.assertTrue(cache.fetch("key_a", os.path.join(self.temp_dir, "used.mp4")))
+        cache.store("key_c", self.make_file("c.mp4", 100))
+        
+        self.assertTrue(cache.contains("key_a"))
+        self.assertFalse(cache.contains("key_b"))
+        self.assertTrue(cache.contains("key_c"))
+        self.assertLessEqual(cache.get_stats()['size_bytes'], 250)
+        self.assertEqual(len([n for n in os.listdir(self.cache_dir) if n.endswith('.mp4')]), 2)
+    
+    def test_file_larger_than_cache_is_not_stored(self):
+        cache = FileCache(self.cache_dir, max_bytes=50)
+        self.assertIsNone(cache.store("key_big", self.make_file("big.mp4", 100)))
+        self.assertFalse(cache.contains("key_big"))
+    
+    def test_entry_whose_file_vanished_is_a_miss(self):
+        cache = FileCache(self.cache_dir, max_bytes=1000)
+        cached_path = cache.store("key_a", self.make_file("a.mp4", 100))
+        os.remove(cached_path)
+        
+        self.assertFalse(cache.fetch("key_a", os.path.join(self.temp_dir, "out.mp4")))
+        self.assertEqual(cache.get_stats()['entries'], 0)
+    
+    def test_index_survives_reload(self):
+        cache = FileCache(self.cache_dir, max_bytes=250)
+        cache.store("key_a", self.make_file("a.mp4", 100))
+        cache.store("key_b", self.make_file("b.mp4", 100))
+        cache.fetch("key_a", os.path.join(self.temp_dir, "used.mp4"))
+        
+        reloaded = FileCache(self.cache_dir, max_bytes=250)
+        self.assertEqual(reloaded.get_stats()['hits'], 1)
+        reloaded.store("key_c", self.make_file("c.mp4", 100))
+        self.assertFalse(reloaded.contains("key_b"))
+        self.assertTrue(reloaded.contains("key_a"))
+
+
+
+class TestPrunePathIndex(unittest.TestCase):
+    """prune_path_index keeps probe and hash indexes bounded"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def make_index(self, count, existing):
+        index = {}
+        for i in range(count):
+            path = os.path.join(self.temp_dir, f"{i}.mp4")
+            if i in existing:
+                open(path, 'wb').close()
+            index[path] = {'last_used': i}
+        return index
+    
+    def test_within_cap_is_left_alone(self):
+        index = self.make_index(3, existing=set())
+        self.assertEqual(prune_path_index(index, 3), 0)
+        self.assertEqual(len(index), 3)
+    
+    def test_vanished_files_go_first(self):
+        index = self.make_index(4, existing={0, 1})
+        self.assertEqual(prune_path_index(index, 3), 2)
+        self.assertEqual(sorted(os.path.basename(p) for p in index), ["0.mp4", "1.mp4"])
+    
+    def test_least_recently_used_go_next(self):
+        index = self.make_index(5, existing={0, 1, 2, 3, 4})
+        self.assertEqual(prune_path_index(index, 2), 3)
+        self.assertEqual(sorted(os.path.basename(p) for p in index), ["3.mp4", "4.mp4"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# app/src/automation/tests/test_filter_graph.py
+"""
+Tests for filter graph wiring checks, xfade offset checks and skipped-stage counting
+"""
+
+import unittest
+import sys
+import os
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.video_processing.filter_graph import (
+    FilterGraph, FilterGraphCompiler, FilterGraphError, check_xfade_offsets
+)
+
+SPECS = {'width': 1080, 'height': 1920, 'frame_rate': 30, 'sample_rate': 48000}
+
+# Streams that already match SPECS in every respect
+MATCHING_VIDEO = {
+    'width': 1080, 'height': 1920, 'sample_aspect_ratio': '1:1',
+    'r_frame_rate': '30/1', 'avg_frame_rate': '30/1', 'time_base': '1/15360', 'start_time': '0.000000'
+}
+MATCHING_AUDIO = {'sample_rate': '48000', 'channels': 2, 'channel_layout': 'stereo', 'start_time': '0.000000'}
+
+
+class TestFilterGraphValidate(unittest.TestCase):
+    """FilterGraph.validate / compile"""
+    
+    def two_input_graph(self):
+        graph = FilterGraph()
+        graph.add(['0:v'], ['null'], ['v0'])
+        graph.add(['1:v'], ['null'], ['v1'])
+        graph.add(['v0', 'v1'], ['xfade=transition=fade:duration=0.5:offset=1'], ['vout'])
+        return graph
+    
+    def test_valid_graph_compiles(self):
+        graph = self.two_input_graph()
+        self.assertEqual(graph.validate(['vout']), ['vout'])
+        self.assertEqual(
+            graph.compile(['vout']),
+            "[0:v]null[v0];[1:v]null[v1];[v0][v1]xfade=transition=fade:duration=0.5:offset=1[vout]"
+        )
+    
+    def test_parse_round_trips(self):
+        compiled = self.two_input_graph().compile(['vout'])
+        self.assertEqual(FilterGraph.parse(compiled).compile(['vout']), compiled)
+    
+    def test_label_used_before_produced(self):
+        graph = FilterGraph()
+        graph.add(['v0'], ['null'], ['vout'])
+        graph.add(['0:v'], ['null'], ['v0'])
+        with self.assertRaisesRegex(FilterGraphError, r"\[v0\] is used before it is produced"):
+            graph.validate()
+    
+    def test_label_consumed_twice(self):
+        graph = self.two_input_graph()
+        graph.add(['v0'], ['null'], ['extra'])
+        with self.assertRaisesRegex(FilterGraphError, r"\[v0\] is consumed more than once"):
+            graph.validate()
+    
+    def test_label_produced_twice(self):
+        graph = FilterGraph()
+        graph.add(['0:v'], ['null'], ['v0'])
+        graph.add(['1:v'], ['null'], ['v0'])
+        with self.assertRaisesRegex(FilterGraphError, r"\[v0\] is produced more than once"):
+            graph.validate()
+    
+    def test_unmapped_output(self):
+        graph = self.two_input_graph()
+        graph.add(['0:a'], ['anull'], ['aout'])
+        with self.assertRaisesRegex(FilterGraphError, "do not match the mapped outputs"):
+            graph.validate(['vout'])
+    
+    def test_chain_without_filters(self):
+        graph = FilterGraph()
+        graph.add(['0:v'], [], ['vout'])
+        with self.assertRaisesRegex(FilterGraphError, "has no filters"):
+            graph.validate()
+
+
+class TestCheckXfadeOffsets(unittest.TestCase):
+    """check_xfade_offsets"""
+    
+    def test_chained_offsets_fit(self):
+        # Second offset is on the joined timeline: 9.0 + 6.0 = 15.0s built so far
+        check_xfade_offsets([10.0, 6.0, 20.0], [9.0, 14.0], 0.5)
+    
+    def test_offset_at_the_very_end_fits(self):
+        check_xfade_offsets([10.0, 6.0], [9.75], 0.25)
+    
+    def test_negative_offset(self):
+        with self.assertRaisesRegex(FilterGraphError, "transition 1"):
+            check_xfade_offsets([10.0, 6.0], [-0.1], 0.25)
+    
+    def test_transition_past_the_first_clip(self):
+        with self.assertRaisesRegex(FilterGraphError, "does not fit in 10.00s"):
+            check_xfade_offsets([10.0, 6.0], [9.9], 0.25)
+    
+    def test_second_transition_measured_on_joined_length(self):
+        # 9.0 + 6.0 = 15.0s of video before the second transition
+        with self.assertRaisesRegex(FilterGraphError, "transition 2 .* does not fit in 15.00s"):
+            check_xfade_offsets([10.0, 6.0, 20.0], [9.0, 14.8], 0.5)
+    
+    def test_input_shorter_than_transition(self):
+        with self.assertRaisesRegex(FilterGraphError, "shorter than the 0.5s transition"):
+            check_xfade_offsets([10.0, 0.2], [9.0], 0.5)
+    
+    def test_offset_count_must_match(self):
+        with self.assertRaisesRegex(FilterGraphError, "1 transition offsets for 3 inputs"):
+            check_xfade_offsets([10.0, 6.0, 20.0], [9.0], 0.5)
+
+
+class TestSkippedStages(unittest.TestCase):
+    """FilterGraphCompiler only counts stages an input actually made unnecessary"""
+    
+    def setUp(self):
+        self.compiler = FilterGraphCompiler(SPECS)
+    
+    def test_matching_input_skips_everything(self):
+        self.assertEqual(self.compiler.video_filters(MATCHING_VIDEO), [])
+        self.assertEqual(self.compiler.audio_filters(MATCHING_AUDIO), [])
+        # scale, pad, setsar, fps + aresample, aformat; no timestamp reset was asked for
+        self.assertEqual((self.compiler.stages_skipped, self.compiler.stages_total), (6, 6))
+    
+    def test_unrequested_reset_is_not_counted(self):
+        self.compiler.video_filters({}, reset_timestamps=False)
+        self.compiler.audio_filters({}, reset_timestamps=False)
+        self.assertEqual((self.compiler.stages_skipped, self.compiler.stages_total), (0, 6))
+    
+    def test_requested_reset_skipped_when_already_at_zero(self):
+        self.assertNotIn("setpts=PTS-STARTPTS", self.compiler.video_filters(MATCHING_VIDEO, reset_timestamps=True))
+        self.assertEqual((self.compiler.stages_skipped, self.compiler.stages_total), (5, 5))
+    
+    def test_requested_reset_kept_for_offset_start(self):
+        stream = dict(MATCHING_AUDIO, start_time='0.021333')
+        self.assertEqual(self.compiler.audio_filters(stream, reset_timestamps=True), ["asetpts=PTS-STARTPTS"])
+        self.assertEqual((self.compiler.stages_skipped, self.compiler.stages_total), (2, 3))
+    
+    def test_resync_keeps_async_resampling(self):
+        filters = self.compiler.audio_filters(MATCHING_AUDIO, resync=True)
+        self.assertEqual(filters, ["aresample=48000:async=1"])
+    
+    def test_mismatched_size_scales_and_pads(self):
+        stream = dict(MATCHING_VIDEO, width=1920, height=1080)
+        filters = self.compiler.video_filters(stream)
+        self.assertTrue(filters[0].startswith("scale=1080:1920"))
+        self.assertTrue(filters[1].startswith("pad=1080:1920"))
+        self.assertIn("setsar=1", filters)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# app/src/automation/tests/test_google_sheets_client.py
+"""
+Tests for appending project blocks and finding the row they are anchored on
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.api_clients import google_sheets_client
+from automation.api_clients.google_sheets_client import GoogleSheetsClient
+
+
+class FakeWorksheet:
+    """Serves whole-row ranges like the Sheets API: trailing empty rows and cells dropped"""
+    
+    def __init__(self, rows, row_count=1000):
+        self.title = "Sheet1"
+        self.rows = rows
+        self.row_count = row_count
+        self.requests = []
+    
+    def get(self, cell_range):
+        self.requests.append(cell_range)
+        if cell_range.startswith('A'):
+            # Column A from a row down: "A5:A"
+            start = int(cell_range[1:].split(':')[0])
+            window = [row[:1] for row in self.rows[start - 1:]]
+        else:
+            start, end = (int(part) for part in cell_range.split(':'))
+            window = [list(row) for row in self.rows[start - 1:end]]
+        while window and not any(window[-1]):
+            window.pop()
+        return [self.trim(row) for row in window]
+    
+    def col_values(self, column):
+        self.requests.append(f"column {column}")
+        return self.trim([row[column - 1] for row in self.rows])
+    
+    def trim(self, row):
+        while row and not row[-1]:
+            row.pop()
+        return row
+
+
+class TestFindLastContentRow(unittest.TestCase):
+    """GoogleSheetsClient._find_last_content_row with and without a recorded last row"""
+    
+    def setUp(self):
+        patcher = mock.patch.object(google_sheets_client, 'SHEETS_ROW_WINDOW', 5)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.client = GoogleSheetsClient(None)
+        self.client.session = mock.Mock()
+        self.known_last = None
+        self.client.session.get_last_row.side_effect = lambda worksheet: self.known_last
+    
+    def sheet(self, content_rows, row_count=40):
+        rows = [[""] * 6 for _ in range(row_count)]
+        for row_number, column in content_rows:
+            rows[row_number - 1][column] = "x"
+        return FakeWorksheet(rows, row_count)
+    
+    def test_no_record_reads_column_a_only(self):
+        worksheet = self.sheet([(1, 0), (4, 0), (7, 5)])
+        self.assertEqual(self.client._find_last_content_row(worksheet), 4)
+        self.assertEqual(worksheet.requests, ["column 1"])
+        self.client.session.set_last_row.assert_called_with(worksheet, 4)
+    
+    def test_reads_only_below_the_record(self):
+        self.known_last = 3
+        worksheet = self.sheet([(3, 0), (4, 1)])
+        self.assertEqual(self.client._find_last_content_row(worksheet), 4)
+        self.assertEqual(worksheet.requests, ["3:7", "8:12"])
+    
+    def test_content_past_a_gap_in_the_window(self):
+        # Row 9 is in the second window, after the first one ended in empty rows
+        self.known_last = 3
+        worksheet = self.sheet([(3, 0), (4, 0), (9, 0)])
+        self.assertEqual(self.client._find_last_content_row(worksheet), 9)
+    
+    def test_every_column_counts(self):
+        # Content in a column wider than any block written so far
+        self.known_last = 3
+        worksheet = self.sheet([(3, 0), (6, 5)])
+        self.assertEqual(self.client._find_last_content_row(worksheet), 6)
+    
+    def test_stops_at_the_bottom_of_the_grid(self):
+        self.known_last = 3
+        worksheet = self.sheet([(3, 0), (6, 0), (10, 0)], row_count=10)
+        self.assertEqual(self.client._find_last_content_row(worksheet), 10)
+        self.assertEqual(worksheet.requests, ["3:7", "8:12"])
+    
+    def test_empty_recorded_row_falls_back_to_rescan(self):
+        self.known_last = 5
+        worksheet = self.sheet([(2, 0)])
+        self.assertEqual(self.client._find_last_content_row(worksheet), 2)
+        self.client.session.set_last_row.assert_called_with(worksheet, 2)
+
+
+class TestWriteProjectBlocks(unittest.TestCase):
+    """GoogleSheetsClient.write_project_blocks: rows go where the append says"""
+    
+    def setUp(self):
+        self.client = GoogleSheetsClient(None)
+        self.client.session = mock.Mock()
+        self.client.session.get_last_row.return_value = None
+        self.worksheet = FakeWorksheet([["Old project", "v01"]], row_count=100)
+        self.worksheet.id = 7
+    
+    def test_blocks_are_formatted_where_the_append_landed(self):
+        # Another writer appended first, so the rows land below the anchor's table
+        self.client.session.append_rows.return_value = {'updates': {'updatedRange': "'BC3 - FB'!A12:C14"}}
+        placed = []
+        
+        start_rows = self.client.write_project_blocks(
+            self.worksheet, [("First", [["v01", "a"], ["v02", "b"]]), ("Second", [["v03", "c"]])],
+            on_placed=placed.append
+        )
+        
+        self.assertEqual(start_rows, [12, 14])
+        self.assertEqual(placed, [1])
+        worksheet, rows, anchor_row = self.client.session.append_rows.call_args[0]
+        self.assertEqual(anchor_row, 1)
+        self.assertEqual(rows, [["First", "v01", "a"], ["", "v02", "b"], ["Second", "v03", "c"]])
+        
+        requests = self.client.session.batch_update.call_args[0][0]
+        merge = next(r['mergeCells']['range'] for r in requests if 'mergeCells' in r)
+        self.assertEqual((merge['startRowIndex'], merge['endRowIndex']), (11, 13))
+        self.assertNotIn('updateCells', str(requests))
+        self.client.session.set_last_row.assert_called_with(self.worksheet, 14)
+    
+    def test_interrupted_append_that_landed_is_found(self):
+        def append_then_drop(worksheet, rows, anchor_row, is_applied):
+            # The connection dropped after the server appended the rows
+            self.worksheet.rows += [["", ""], ["First", "v01"]]
+            return None if is_applied() else {}
+        self.client.session.append_rows.side_effect = append_then_drop
+        
+        self.assertEqual(self.client.write_project_blocks(self.worksheet, [("First", [["v01"]])]), [3])
+    
+    def test_find_block_looks_below_the_anchor(self):
+        self.worksheet.rows += [["First", "v01"], ["First", "v01"]]
+        self.assertEqual(self.client.find_block(self.worksheet, 2, "First"), 3)
+        self.assertIsNone(self.client.find_block(self.worksheet, 3, "First"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# app/src/automation/tests/test_job_manifest.py
+"""
+Tests for the per-project job manifest that lets reruns skip finished outputs
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+# The orchestrator reaches outside the automation package, so import it through app/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.automation.video_processing.content_hasher import ContentHasher
+from src.automation.orchestrator.processing.video_processing_modules import job_manifest
+from src.automation.orchestrator.processing.video_processing_modules.job_manifest import (
+    JobManifest, get_partial_output_path, commit_partial_output
+)
+
+RECIPE = {'processing_mode': 'connector_quiz', 'video_crf': 23}
+
+
+class TestJobManifest(unittest.TestCase):
+    """JobManifest against a temp project folder"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_root = os.path.join(self.temp_dir, "project")
+        os.makedirs(self.project_root)
+        
+        self.hasher = ContentHasher(os.path.join(self.temp_dir, "hashes.json"))
+        patcher = mock.patch.object(job_manifest, 'get_content_hasher', lambda: self.hasher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.client = self.write_file("client.mp4", b"client video")
+        self.asset = self.write_file("quiz.mp4", b"quiz video")
+        self.output = self.write_file(os.path.join("project", "out_v01.mp4"), b"rendered")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def write_file(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+    
+    def test_fingerprint_follows_inputs_and_recipe(self):
+        manifest = JobManifest(self.project_root)
+        fingerprint = manifest.build_fingerprint([self.client, self.asset], RECIPE)
+        
+        self.assertEqual(fingerprint, manifest.build_fingerprint([self.client, self.asset], dict(RECIPE)))
+        self.assertNotEqual(fingerprint, manifest.build_fingerprint([self.client, self.asset], dict(RECIPE, video_crf=20)))
+        self.assertNotEqual(fingerprint, manifest.build_fingerprint([self.asset, self.client], RECIPE))
+        
+        self.write_file("quiz.mp4", b"a different quiz")
+        self.assertNotEqual(fingerprint, manifest.build_fingerprint([self.client, self.asset], RECIPE))
+    
+    def test_remembered_hash_skips_reading_the_file(self):
+        manifest = JobManifest(self.project_root)
+        self.hasher.remember(self.client, "drive-md5:first")
+        
+        with mock.patch.object(self.hasher, '_hash_file') as hash_file:
+            fingerprint = manifest.build_fingerprint([self.client], RECIPE)
+        hash_file.assert_not_called()
+        
+        self.hasher.remember(self.client, "drive-md5:second")
+        self.assertNotEqual(fingerprint, manifest.build_fingerprint([self.client], RECIPE))
+    
+    def test_missing_input_has_no_fingerprint(self):
+        manifest = JobManifest(self.project_root)
+        self.assertIsNone(manifest.build_fingerprint([self.client, os.path.join(self.temp_dir, "gone.mp4")], RECIPE))
+        self.assertFalse(manifest.is_output_complete(self.output, None))
+    
+    def test_completed_output_is_skipped_on_rerun(self):
+        manifest = JobManifest(self.project_root)
+        fingerprint = manifest.build_fingerprint([self.client], RECIPE)
+        manifest.mark_output_pending(self.output, fingerprint)
+        self.assertFalse(manifest.is_output_complete(self.output, fingerprint))
+        
+        manifest.mark_output_complete(self.output, fingerprint)
+        
+        rerun = JobManifest(self.project_root)
+        self.assertTrue(rerun.is_output_complete(self.output, fingerprint))
+        self.assertFalse(rerun.is_output_complete(self.output, "another fingerprint"))
+    
+    def test_changed_or_missing_output_is_rendered_again(self):
+        manifest = JobManifest(self.project_root)
+        manifest.mark_output_complete(self.output, "fp")
+        
+        self.write_file(os.path.join("project", "out_v01.mp4"), b"truncated")
+        self.assertFalse(manifest.is_output_complete(self.output, "fp"))
+        
+        os.remove(self.output)
+        self.assertFalse(manifest.is_output_complete(self.output, "fp"))
+    
+    def test_moved_project_folder_keeps_its_outputs(self):
+        JobManifest(self.project_root).mark_output_complete(self.output, "fp")
+        
+        moved_root = os.path.join(self.temp_dir, "moved")
+        shutil.move(self.project_root, moved_root)
+        
+        manifest = JobManifest(moved_root)
+        self.assertTrue(manifest.is_output_complete(os.path.join(moved_root, "out_v01.mp4"), "fp"))
+    
+    def test_completed_mode_needs_every_output(self):
+        manifest = JobManifest(self.project_root)
+        manifest.mark_output_complete(self.output, "output fp")
+        processed_files = [{'version': 1, 'output_path': self.output}]
+        manifest.mark_mode_complete("connector_quiz", "mode fp", processed_files)
+        
+        rerun = JobManifest(self.project_root)
+        self.assertTrue(rerun.has_mode("connector_quiz"))
+        self.assertEqual(rerun.get_completed_mode("connector_quiz", "mode fp"), processed_files)
+        self.assertIsNone(rerun.get_completed_mode("connector_quiz", "changed fp"))
+        self.assertIsNone(rerun.get_completed_mode("quiz_only", "mode fp"))
+        
+        os.remove(self.output)
+        self.assertIsNone(rerun.get_completed_mode("connector_quiz", "mode fp"))
+    
+    def test_unreadable_manifest_starts_fresh(self):
+        with open(os.path.join(self.project_root, job_manifest.MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+            f.write("{broken")
+        
+        manifest = JobManifest(self.project_root)
+        self.assertFalse(manifest.has_mode("connector_quiz"))
+        manifest.mark_output_complete(self.output, "fp")
+        self.assertTrue(JobManifest(self.project_root).is_output_complete(self.output, "fp"))
+    
+    def test_partial_output_is_committed_in_place(self):
+        output_path = os.path.join(self.project_root, "out_v02.mp4")
+        partial_path = get_partial_output_path(output_path)
+        self.assertEqual(partial_path, os.path.join(self.project_root, "out_v02.partial.mp4"))
+        
+        self.write_file(os.path.join("project", "out_v02.partial.mp4"), b"done")
+        commit_partial_output(partial_path, output_path)
+        
+        self.assertFalse(os.path.exists(partial_path))
+        with open(output_path, 'rb') as f:
+            self.assertEqual(f.read(), b"done")
+
+
+if __name__ == '__main__':
+    unittest.main()
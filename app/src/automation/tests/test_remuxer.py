@@ -0,0 +1,124 @@
+# app/src/automation/tests/test_remuxer.py
+"""
+Tests for the remux fast-path conformance check
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.video_processing import remuxer as remuxer_module
+from automation.video_processing.remuxer import Remuxer
+
+SPECS = {'width': 1080, 'height': 1920, 'frame_rate': 30, 'sample_rate': 48000}
+
+CONFORMING_VIDEO = {
+    'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p',
+    'width': 1080, 'height': 1920, 'r_frame_rate': '30/1', 'avg_frame_rate': '30/1', 'duration': '12.000000'
+}
+CONFORMING_AUDIO = {
+    'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'duration': '12.010000'
+}
+
+
+class TestCheckConformance(unittest.TestCase):
+    """Remuxer.check_conformance against fake probe data"""
+    
+    def setUp(self):
+        self.remuxer = Remuxer()
+        self.probe_data = None
+        self.remuxer.prober = mock.Mock()
+        self.remuxer.prober.probe.side_effect = lambda path: self.probe_data
+    
+    def check(self, video=None, audio=None, specs=SPECS, **changes):
+        streams = [dict(CONFORMING_VIDEO, **(video or {}))]
+        if audio is not False:
+            streams.append(dict(CONFORMING_AUDIO, **(audio or {})))
+        self.probe_data = {'streams': streams, **changes}
+        return self.remuxer.check_conformance("clip.mp4", specs)
+    
+    def test_conforming_input(self):
+        self.assertEqual(self.check(), (True, "H.264/AAC at target spec"))
+    
+    def test_codecs_only_without_specs(self):
+        self.assertEqual(self.check(video={'width': 1920, 'height': 1080}, specs=None), (True, "H.264/AAC"))
+    
+    def test_silent_input_conforms(self):
+        self.assertTrue(self.check(audio=False)[0])
+    
+    def test_unprobeable_input(self):
+        self.assertEqual(self.remuxer.check_conformance("clip.mp4", SPECS), (False, "could not probe"))
+    
+    def test_no_video_stream(self):
+        self.assertEqual(self.check(streams=[CONFORMING_AUDIO]), (False, "no video stream"))
+    
+    def test_wrong_codecs(self):
+        self.assertEqual(self.check(video={'codec_name': 'hevc'}), (False, "video codec hevc"))
+        self.assertEqual(self.check(audio={'codec_name': 'opus'}), (False, "audio codec opus"))
+        self.assertEqual(self.check(video={'pix_fmt': 'yuv422p10le'}), (False, "pixel format yuv422p10le"))
+    
+    def test_wrong_geometry(self):
+        self.assertEqual(self.check(video={'width': 1920, 'height': 1080}), (False, "1920x1080 is not 1080x1920"))
+    
+    def test_variable_frame_rate(self):
+        self.assertEqual(self.check(video={'avg_frame_rate': '2997/100'}), (False, "variable frame rate"))
+        self.assertEqual(self.check(video={'r_frame_rate': '0/0'}), (False, "unknown frame rate"))
+    
+    def test_wrong_frame_rate(self):
+        rate = {'r_frame_rate': '25/1', 'avg_frame_rate': '25/1'}
+        self.assertEqual(self.check(video=rate), (False, "25.000fps is not 30fps"))
+    
+    def test_ntsc_rate_is_not_target(self):
+        rate = {'r_frame_rate': '30000/1001', 'avg_frame_rate': '30000/1001'}
+        self.assertFalse(self.check(video=rate)[0])
+    
+    def test_wrong_audio_layout(self):
+        self.assertEqual(self.check(audio={'sample_rate': '44100'}), (False, "44100Hz is not 48000Hz"))
+        self.assertEqual(self.check(audio={'channels': 1}), (False, "1 audio channel(s)"))
+    
+    def test_audio_length_must_match_video(self):
+        self.assertEqual(self.check(audio={'duration': '12.5'}), (False, "audio and video lengths differ by 0.500s"))
+        self.assertEqual(self.check(audio={'duration': None}), (False, "unknown stream durations"))
+        self.assertTrue(self.check(audio={'duration': '12.5'}, specs=None)[0])
+
+
+class TestTryRemux(unittest.TestCase):
+    """Remuxer.try_remux decisions and the combined count"""
+    
+    def setUp(self):
+        remuxer_module.reset_remux_stats()
+        self.remuxer = Remuxer()
+        self.remuxer.check_conformance = mock.Mock(return_value=(True, "H.264/AAC at target spec"))
+        self.remuxer.remux = mock.Mock(return_value=None)
+        self.remuxer._remove = mock.Mock()
+    
+    def tearDown(self):
+        remuxer_module.set_remux_decision_hook(None)
+        remuxer_module.reset_remux_stats()
+    
+    def test_conforming_input_is_remuxed_and_counted(self):
+        self.assertTrue(self.remuxer.try_remux("clip.mp4", "out.mp4", SPECS))
+        self.assertEqual(remuxer_module.get_remux_stats(), {'remuxed': 1, 'encoded': 0})
+    
+    def test_rejected_copy_is_removed_and_counted_as_encoded(self):
+        result = self.remuxer.try_remux("clip.mp4", "out.mp4", SPECS, verify=lambda path: "profile differs")
+        self.assertFalse(result)
+        self.remuxer._remove.assert_called_once_with("out.mp4")
+        self.assertEqual(remuxer_module.get_remux_stats(), {'remuxed': 0, 'encoded': 1})
+    
+    def test_worker_decisions_go_to_the_hook(self):
+        forwarded = []
+        remuxer_module.set_remux_decision_hook(forwarded.append)
+        self.remuxer.check_conformance.return_value = (False, "video codec hevc")
+        self.assertFalse(self.remuxer.try_remux("clip.mp4", "out.mp4", SPECS))
+        self.assertEqual(forwarded, [False])
+        self.remuxer.remux.assert_not_called()
+        self.assertEqual(remuxer_module.get_remux_stats(), {'remuxed': 0, 'encoded': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# app/src/automation/tests/test_sheets_journal.py
+"""
+Tests for the Sheets journal's retry and failure handling
+"""
+
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.api_clients import sheets_journal
+from automation.api_clients.sheets_journal import SheetsJournal, TokenBucket, is_permanent_error
+
+
+class HTTPError(Exception):
+    """Stand-in for gspread's APIError: carries the response status"""
+    
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.response = mock.Mock(status_code=status)
+
+
+class FakeWorksheet:
+    def __init__(self, worksheet_id, title):
+        self.id = worksheet_id
+        self.title = title
+
+
+class FakeSheetsClient:
+    """Records written blocks; a block named in `reject` fails its whole batch"""
+    
+    def __init__(self):
+        self.spreadsheet = object()
+        self.session = mock.Mock()
+        self.worksheet = FakeWorksheet(1, "BC3 - FB")
+        self.reject = {}
+        self.written = []
+        self.batches = []
+    
+    def __call__(self, credentials):
+        return self
+    
+    def resolve_worksheet(self, routing_name, account_code=None, platform_code=None):
+        if routing_name == "missing":
+            return None, "No worksheet found for XX - YY"
+        return self.worksheet, None
+    
+    def write_project_blocks(self, worksheet, blocks, on_placed=None):
+        names = [name for name, _ in blocks]
+        self.batches.append(names)
+        for name in names:
+            if name in self.reject:
+                raise self.reject[name]
+        self.written.extend(names)
+    
+    def find_block(self, worksheet, below_row, column1_name):
+        return None
+
+
+class TestSheetsJournal(unittest.TestCase):
+    """SheetsJournal._send_due_entries against a fake Sheets client"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.client = FakeSheetsClient()
+        patcher = mock.patch.object(sheets_journal, 'GoogleSheetsClient', self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.journal = SheetsJournal(self.temp_dir)
+        self.journal.credentials = object()
+        self.journal.bucket = TokenBucket(60000, 100)
+        # Queue entries without waking the background worker
+        self.journal.start = lambda: None
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def make_due(self):
+        """Skip every entry's backoff"""
+        for entry in self.journal._load_entries():
+            entry['next_attempt'] = 0
+            self.journal._save(entry)
+    
+    def test_permanent_error_classification(self):
+        self.assertTrue(is_permanent_error(HTTPError(400)))
+        self.assertTrue(is_permanent_error(HTTPError(403)))
+        self.assertTrue(is_permanent_error("No worksheet found for BC3 - FB"))
+        self.assertFalse(is_permanent_error(HTTPError(503)))
+        self.assertFalse(is_permanent_error("Error finding worksheet: timed out"))
+    
+    def test_bad_block_does_not_fail_the_batch(self):
+        """A rejected batch is retried entry by entry; only the bad block is given up on"""
+        for name in ("good 1", "bad", "good 2"):
+            self.journal.enqueue("card", name, [["v01", "desc", "file.mp4"]])
+        self.client.reject["bad"] = HTTPError(400)
+        
+        self.journal._send_due_entries()
+        self.assertEqual(self.client.written, [])
+        self.assertEqual(self.journal.pending_count(), 3)
+        
+        self.make_due()
+        self.journal._send_due_entries()
+        self.assertEqual(sorted(self.client.written), ["good 1", "good 2"])
+        self.assertEqual(self.client.batches[1:], [["good 1"], ["bad"], ["good 2"]])
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(self.journal.failed_count(), 1)
+        
+        failed_path = self.journal._entry_paths(self.journal.failed_dir)[0]
+        with open(failed_path, 'r', encoding='utf-8') as f:
+            failed = json.load(f)
+        self.assertEqual(failed['column1_name'], "bad")
+        self.assertEqual(failed['last_error'], "HTTP 400")
+    
+    def test_transient_errors_give_up_after_max_attempts(self):
+        self.journal.enqueue("card", "flaky", [["v01", "desc", "file.mp4"]])
+        self.client.reject["flaky"] = HTTPError(503)
+        
+        with mock.patch.object(sheets_journal, 'SHEETS_JOURNAL_MAX_ATTEMPTS', 3):
+            for _ in range(2):
+                self.journal._send_due_entries()
+                self.make_due()
+            self.assertEqual(self.journal.pending_count(), 1)
+            self.journal._send_due_entries()
+        
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(self.journal.failed_count(), 1)
+    
+    def test_missing_worksheet_fails_at_once(self):
+        """A block with no worksheet is given up on at once instead of retried"""
+        self.journal.enqueue("missing", "orphan", [["v01", "desc", "file.mp4"]])
+        
+        next_due = self.journal._send_due_entries()
+        
+        self.assertIsNone(next_due)
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(self.journal.failed_count(), 1)
+    
+    def test_check_route_reports_missing_worksheet(self):
+        session = mock.Mock()
+        session.get_cached_worksheet_titles.return_value = ["BC3 - FB"]
+        with mock.patch.object(sheets_journal, 'get_sheets_session', return_value=session):
+            self.assertIn("No worksheet found", self.journal.check_route(account_code="OO", platform_code="YT"))
+            self.assertIsNone(self.journal.check_route(account_code="BC3", platform_code="FB"))
+            # Routing by card title always finds a worksheet
+            self.assertIsNone(self.journal.check_route())
+    
+    def test_check_route_never_calls_the_api(self):
+        """Without a cached worksheet list the check passes and the worker routes the block"""
+        session = mock.Mock()
+        session.get_cached_worksheet_titles.return_value = None
+        with mock.patch.object(sheets_journal, 'get_sheets_session', return_value=session):
+            self.assertIsNone(self.journal.check_route(account_code="OO", platform_code="YT"))
+        session.get_worksheets.assert_not_called()
+        session.get_spreadsheet.assert_not_called()
+    
+    def test_unreadable_entry_is_moved_aside(self):
+        with open(os.path.join(self.temp_dir, "0-broken.json"), 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        
+        self.journal._send_due_entries()
+        
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(self.journal.failed_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
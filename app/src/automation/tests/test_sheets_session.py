@@ -0,0 +1,67 @@
+# app/src/automation/tests/test_sheets_session.py
+"""
+Tests for resending a Sheets batchUpdate after a failed attempt
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.api_clients import sheets_session
+from automation.api_clients.sheets_session import SheetsSession
+
+
+class TestBatchUpdate(unittest.TestCase):
+    """SheetsSession.batch_update against a spreadsheet whose calls fail on demand"""
+    
+    def setUp(self):
+        for name, value in (('SHEETS_BACKOFF_SECONDS', 0), ('SHEETS_MAX_RETRIES', 2)):
+            patcher = mock.patch.object(sheets_session, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        with mock.patch.object(SheetsSession, '_load_row_index', return_value={}):
+            self.session = SheetsSession(credentials=None, spreadsheet_id="sheet")
+        self.spreadsheet = mock.Mock()
+        self.session.get_spreadsheet = lambda: self.spreadsheet
+    
+    def test_dropped_connection_after_apply_is_not_resent(self):
+        self.spreadsheet.batch_update.side_effect = [ConnectionError("reset"), {'replies': []}]
+        
+        result = self.session.batch_update([{"appendDimension": {}}], is_applied=lambda: True)
+        
+        self.assertIsNone(result)
+        self.assertEqual(self.spreadsheet.batch_update.call_count, 1)
+    
+    def test_dropped_connection_before_apply_is_resent(self):
+        self.spreadsheet.batch_update.side_effect = [ConnectionError("reset"), {'replies': []}]
+        
+        result = self.session.batch_update([{"appendDimension": {}}], is_applied=lambda: False)
+        
+        self.assertEqual(result, {'replies': []})
+        self.assertEqual(self.spreadsheet.batch_update.call_count, 2)
+    
+    def test_dropped_connection_without_check_is_raised(self):
+        self.spreadsheet.batch_update.side_effect = ConnectionError("reset")
+        
+        with self.assertRaises(ConnectionError):
+            self.session.batch_update([{"appendDimension": {}}])
+        self.assertEqual(self.spreadsheet.batch_update.call_count, 1)
+    
+    def test_failed_check_does_not_resend(self):
+        self.spreadsheet.batch_update.side_effect = [ConnectionError("reset"), {'replies': []}]
+        checks = mock.Mock(side_effect=[ConnectionError("still down"), False])
+        
+        result = self.session.batch_update([{"appendDimension": {}}], is_applied=checks)
+        
+        self.assertEqual(result, {'replies': []})
+        self.assertEqual(checks.call_count, 2)
+        self.assertEqual(self.spreadsheet.batch_update.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
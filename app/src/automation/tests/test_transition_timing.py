@@ -0,0 +1,92 @@
+# app/src/automation/tests/test_transition_timing.py
+"""
+Tests for the transition timing shared by the smart and the full render
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add app/src to path so the automation package imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from automation.video_processing.transition_timing import get_transition_timing
+from automation.video_processing.smart_renderer import SmartTransitionRenderer
+from automation.video_processing.transition_processor import TransitionProcessor
+
+SPECS = {'width': 1080, 'height': 1920, 'frame_rate': 30, 'sample_rate': 48000}
+
+
+class TestTransitionTiming(unittest.TestCase):
+    """get_transition_timing and TransitionTiming"""
+    
+    def test_two_videos_short_fade_with_audio_cut(self):
+        timing = get_transition_timing(2)
+        self.assertEqual((timing.duration, timing.audio), (0.25, 'cut'))
+        self.assertEqual(timing.offsets([10.0, 6.0]), [9.75])
+        self.assertEqual(timing.video_duration([10.0, 6.0]), 15.75)
+        self.assertEqual(timing.audio_duration([10.0, 6.0]), 15.75)
+    
+    def test_three_videos_start_a_second_before_each_join(self):
+        timing = get_transition_timing(3)
+        self.assertEqual((timing.duration, timing.audio), (0.5, 'crossfade'))
+        self.assertEqual(timing.offsets([10.0, 6.0, 20.0]), [9.0, 14.0])
+        self.assertEqual(timing.video_duration([10.0, 6.0, 20.0]), 34.0)
+        # acrossfade only overlaps the transition length
+        self.assertEqual(timing.audio_duration([10.0, 6.0, 20.0]), 35.0)
+    
+    def test_other_counts_have_no_transitions(self):
+        self.assertIsNone(get_transition_timing(1))
+        self.assertIsNone(get_transition_timing(4))
+
+
+class TestRenderPathsShareTiming(unittest.TestCase):
+    """The smart render builds the joins the full render would"""
+    
+    def setUp(self):
+        self.renderer = SmartTransitionRenderer()
+        self.commands = []
+        patcher = mock.patch.object(
+            self.renderer, '_run', side_effect=lambda cmd, step, duration=None: self.commands.append(cmd)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def filter_of(self, cmd):
+        return cmd[cmd.index('-filter_complex') + 1]
+    
+    def test_two_video_audio_is_cut_at_the_transition(self):
+        timing = get_transition_timing(2)
+        self.renderer._render_audio(['a.mp4', 'b.mp4'], 'out.m4a', SPECS, [10.0, 6.0], timing, 15.75)
+        graph = self.filter_of(self.commands[0])
+        self.assertIn("[0:a]atrim=0:9.75,asetpts=PTS-STARTPTS[a0]", graph)
+        self.assertIn("concat=n=2:v=0:a=1", graph)
+        self.assertNotIn("acrossfade", graph)
+    
+    def test_three_video_audio_is_crossfaded(self):
+        timing = get_transition_timing(3)
+        self.renderer._render_audio(['a.mp4', 'b.mp4', 'c.mp4'], 'out.m4a', SPECS, [10.0, 6.0, 20.0], timing, 35.0)
+        graph = self.filter_of(self.commands[0])
+        self.assertEqual(graph.count("acrossfade=d=0.5:c1=tri:c2=tri"), 2)
+        self.assertNotIn("atrim", graph)
+    
+    def test_window_offset_matches_full_render_offset(self):
+        """With the body cut at 8s, the window's xfade lands at the full render's 9.0s"""
+        timing = get_transition_timing(3)
+        self.renderer._render_window('a.mp4', 'b.mp4', 'w.mp4', 8.0, 10.0, 1.0, SPECS, timing)
+        graph = self.filter_of(self.commands[0])
+        self.assertIn("xfade=transition=fade:duration=0.5:offset=1.000000", graph)
+    
+    def test_four_videos_skip_smart_render(self):
+        processor = TransitionProcessor()
+        with mock.patch.object(processor.smart_renderer, 'render') as render, \
+             mock.patch('automation.video_processing.concat_processor.ConcatProcessor.robust_concat',
+                        return_value=None) as concat:
+            processor.apply_transitions(['a', 'b', 'c', 'd'], 'out.mp4', SPECS)
+        render.assert_not_called()
+        concat.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
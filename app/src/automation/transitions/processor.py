@@ -4,9 +4,12 @@ Main processor that applies transitions to video sequences
 """
 
 import os
-import sys
 import subprocess
 from .video_info import VideoInfo
+from ..video_processing.probe_service import get_probe_service
+from ..video_processing.ffmpeg_runner import FFmpegRunner
+from ..video_processing.job_control import JobCancelledError
+from ..video_processing.filter_graph import FilterGraph, FilterGraphError, check_xfade_offsets
 from .transition_builder import TransitionBuilder
 
 class TransitionProcessor:
@@ -16,6 +19,7 @@ class TransitionProcessor:
         self.transition_type = transition_type
         self.duration = duration
         self.builder = TransitionBuilder(transition_type, duration)
+        self.runner = FFmpegRunner()
     
     def process(self, video_list, output_path, width, height):
         """
@@ -31,6 +35,7 @@ class TransitionProcessor:
             return self._process_single(video_list[0], output_path, width, height)
         
         # Get video durations
+        get_probe_service().probe_many(video_list)
         durations = []
         for video in video_list:
             duration = VideoInfo.get_duration(video)
@@ -75,7 +80,7 @@ class TransitionProcessor:
         
         # Normalize all videos first
         filters.extend(
-            self.builder.build_normalization_filters(len(video_list), width, height)
+            self.builder.build_normalization_filters(len(video_list), width, height, video_list=video_list)
         )
         
         # Add transitions
@@ -84,9 +89,15 @@ class TransitionProcessor:
             filters.extend(self.builder.build_two_video_transition(offset))
         else:
             filters.extend(self.builder.build_multi_video_transitions(durations))
+        offsets = [sum(durations[:i]) - self.builder.duration * i for i in range(1, len(durations))]
         
-        # Combine filters
-        filter_complex = "".join(filters)
+        # Combine filters and check the wiring before encoding
+        try:
+            filter_complex = FilterGraph.parse("".join(filters)).compile(['vout', 'aout'])
+            check_xfade_offsets(durations, offsets, self.builder.duration)
+        except FilterGraphError as e:
+            print(f"⚠️ Transition graph invalid ({e}), falling back to simple concat")
+            return self._fallback_concat(video_list, output_path, width, height)
         
         command.extend([
             '-filter_complex', filter_complex,
@@ -101,6 +112,11 @@ class TransitionProcessor:
             output_path
         ])
         
+        error = self.runner.preflight(command)
+        if error:
+            print(f"⚠️ Transition graph rejected before encoding ({error}), falling back to simple concat")
+            return self._fallback_concat(video_list, output_path, width, height)
+        
         error = self._run_ffmpeg(command)
         
         if error:
@@ -120,10 +136,10 @@ class TransitionProcessor:
             command.extend(['-i', video])
         
         # Build filter complex
-        filters = self.builder.build_normalization_filters(len(video_list), width, height)
+        filters = self.builder.build_normalization_filters(len(video_list), width, height, video_list=video_list)
         filters.extend(self.builder.build_simple_concat(len(video_list)))
         
-        filter_complex = "".join(filters)
+        filter_complex = FilterGraph.parse("".join(filters)).compile(['vout', 'aout'])
         
         command.extend([
             '-filter_complex', filter_complex,
@@ -140,17 +156,10 @@ class TransitionProcessor:
     def _run_ffmpeg(self, command):
         """Run FFmpeg command with proper error handling"""
         try:
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
-            result = subprocess.run(
+            result = self.runner.run(
                 command,
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minutes
-                startupinfo=startupinfo
+                description=f"Transitions {os.path.basename(command[-1])}",
+                timeout=1800  # 30 minutes
             )
             
             if result.returncode == 0:
@@ -159,6 +168,8 @@ class TransitionProcessor:
             else:
                 return f"FFmpeg error: {result.stderr[:500]}"  # Limit error message length
                 
+        except JobCancelledError:
+            raise
         except subprocess.TimeoutExpired:
             return "Processing timed out after 30 minutes"
         except Exception as e:
@@ -4,6 +4,7 @@ Builds FFmpeg filter complex for transitions
 """
 
 from .transition_types import get_transition_config
+from ..video_processing.filter_graph import FilterGraph, FilterGraphCompiler
 
 class TransitionBuilder:
     """Builds FFmpeg filter strings for transitions"""
@@ -14,13 +15,24 @@ class TransitionBuilder:
         # Clamp duration between reasonable values
         self.duration = max(0.25, min(2.0, self.duration))
     
-    def build_normalization_filters(self, num_videos, width, height, fps=30, audio_rate=44100):
+    def build_normalization_filters(self, num_videos, width, height, fps=30, audio_rate=44100, video_list=None):
         """
         Build filters to normalize all input videos
         
+        When the input files are given, each one is probed and only the stages
+        it does not already satisfy are emitted.
+        
         Returns:
             list: Filter strings for video and audio normalization
         """
+        if video_list:
+            specs = {'width': width, 'height': height, 'frame_rate': fps, 'sample_rate': audio_rate}
+            graph = FilterGraph()
+            compiler = FilterGraphCompiler(specs)
+            video_labels, audio_labels = compiler.add_normalized_inputs(graph, video_list, match_timebase=True)
+            compiler.report()
+            return [graph.compile(video_labels + audio_labels) + ";"]
+        
         filters = []
         
         for i in range(num_videos):
@@ -1,10 +1,9 @@
 # app/src/automation/transitions/video_info.py
 """
-Handles video information extraction using ffprobe
+Handles video information extraction through the shared probe service
 """
 
-import subprocess
-import json
+from ..video_processing.probe_service import get_probe_service
 
 class VideoInfo:
     """Extract and manage video information"""
@@ -18,21 +17,10 @@ class VideoInfo:
             dict: Video info including width, height, duration
             None: If error occurs
         """
-        command = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'stream=width,height,duration,codec_name,r_frame_rate:format=duration',
-            '-of', 'json', video_path
-        ]
-        
         try:
-            result = subprocess.run(
-                command, 
-                check=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=30
-            )
-            data = json.loads(result.stdout)
+            data = get_probe_service().probe(video_path)
+            if data is None:
+                raise RuntimeError(f"ffprobe could not read {video_path}")
             
             info = {}
             
@@ -6,16 +6,65 @@ Organized components for video processing operations
 
 from .video_analyzer import VideoAnalyzer, set_fallback_dimensions, get_fallback_dimensions, get_video_dimensions_with_fallback
 from .asset_manager import AssetManager
+from .asset_cache import AssetCache, set_client_segment_cache_dir, get_client_segment_cache
+from .content_hasher import ContentHasher, get_content_hasher
+from .probe_service import ProbeService, get_probe_service
+from .file_cache import FileCache
+from .render_cache import RenderCache, get_render_cache
+from .filter_graph import FilterGraph, FilterGraphCompiler, FilterGraphError, check_xfade_offsets
+from .remuxer import (Remuxer, set_remux_decision_hook, record_remux_decision,
+                      reset_remux_stats, print_remux_stats)
 from .concat_processor import ConcatProcessor
+from .chunked_encoder import ChunkedEncoder, set_chunk_worker_limit
+from .segment_encoder import SegmentEncoder
+from .transition_timing import TransitionTiming, get_transition_timing
 from .transition_processor import TransitionProcessor
+from .tail_cache import TailCache
+from .smart_renderer import SmartTransitionRenderer
 from .processor_config import ProcessorConfig
+from .ffmpeg_runner import FFmpegRunner, add_progress_listener, remove_progress_listener, progress_listener
+from .job_control import JobControl, JobCancelledError, get_job_control, cancel_current_job
 
 __all__ = [
     'VideoAnalyzer',
     'AssetManager',
+    'AssetCache',
+    'set_client_segment_cache_dir',
+    'get_client_segment_cache',
+    'ContentHasher',
+    'get_content_hasher',
+    'ProbeService',
+    'get_probe_service',
+    'FileCache',
+    'RenderCache',
+    'get_render_cache',
+    'FilterGraph',
+    'FilterGraphCompiler',
+    'FilterGraphError',
+    'check_xfade_offsets',
+    'Remuxer',
+    'set_remux_decision_hook',
+    'record_remux_decision',
+    'reset_remux_stats',
+    'print_remux_stats',
     'ConcatProcessor',
+    'ChunkedEncoder',
+    'set_chunk_worker_limit',
+    'SegmentEncoder',
+    'TransitionTiming',
+    'get_transition_timing',
     'TransitionProcessor',
+    'TailCache',
+    'SmartTransitionRenderer',
     'ProcessorConfig',
+    'FFmpegRunner',
+    'add_progress_listener',
+    'remove_progress_listener',
+    'progress_listener',
+    'JobControl',
+    'JobCancelledError',
+    'get_job_control',
+    'cancel_current_job',
     'set_fallback_dimensions',
     'get_fallback_dimensions',
     'get_video_dimensions_with_fallback'
@@ -0,0 +1,96 @@
+# app/src/automation/video_processing/asset_cache.py
+"""
+Asset Cache Module
+Keeps connector/quiz/SVSL/VSL assets pre-normalized to a target spec on disk
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional
+from .processor_config import ProcessorConfig
+from .segment_encoder import SegmentEncoder
+from .content_hasher import get_content_hasher
+
+class AssetCache:
+    """On-disk cache of assets already scaled, padded, resampled and encoded to a target spec"""
+    
+    def __init__(self, cache_dir: str = None):
+        self.config = ProcessorConfig()
+        self.cache_dir = cache_dir or self.config.ASSET_CACHE_DIR
+        self.encoder = SegmentEncoder()
+        self.hasher = get_content_hasher()
+    
+    def get_normalized(self, asset_path: str, specs: Dict) -> Optional[str]:
+        """
+        Get a copy of the asset normalized to the target spec
+        
+        The cache key is the asset's content hash plus the target spec and
+        encoder arguments, so an edited asset or a new target spec gets its
+        own entry and stale entries are never reused.
+        
+        Args:
+            asset_path: Path to the original asset
+            specs: Target specs (width, height, frame_rate, sample_rate)
+        
+        Returns:
+            Path to the normalized file, or None if normalization failed
+        """
+        cache_key = self.build_cache_key(asset_path, specs)
+        if not cache_key:
+            return None
+        
+        asset_stem = os.path.splitext(os.path.basename(asset_path))[0]
+        cached_path = os.path.join(self.cache_dir, f"{asset_stem}_{cache_key[:16]}.mp4")
+        
+        if os.path.exists(cached_path):
+            print(f"♻️ Asset cache hit: {os.path.basename(asset_path)} → {os.path.basename(cached_path)}")
+            return cached_path
+        
+        print(f"🧱 Asset cache miss: normalizing {os.path.basename(asset_path)} "
+              f"to {specs['width']}x{specs['height']} @ {specs['frame_rate']}fps, {specs['sample_rate']}Hz")
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Encode under a temporary name so a crash never leaves a truncated cache entry
+        temp_path = os.path.join(self.cache_dir, f"{asset_stem}_{cache_key[:16]}.{os.getpid()}.partial.mp4")
+        error = self.encoder.encode(asset_path, temp_path, specs, preset=self.config.SEGMENT_PRESET)
+        
+        if error:
+            print(f"⚠️ Could not normalize {os.path.basename(asset_path)}: {error}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+        
+        os.replace(temp_path, cached_path)
+        print(f"✅ Cached normalized asset: {os.path.basename(cached_path)}")
+        return cached_path
+    
+    def build_cache_key(self, asset_path: str, specs: Dict) -> Optional[str]:
+        """Build the cache key from content hash + target spec + encoder arguments"""
+        content_hash = self.hasher.get_hash(asset_path)
+        if not content_hash:
+            return None
+        
+        key_data = {
+            'content_hash': content_hash,
+            'width': specs['width'],
+            'height': specs['height'],
+            'frame_rate': specs['frame_rate'],
+            'sample_rate': specs['sample_rate'],
+            'encode_args': self.config.get_segment_encode_args(specs, preset=self.config.SEGMENT_PRESET)
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+# Job-scoped cache of encoded client segments, shared by every mode rendered in one job
+_client_segment_cache = None
+
+def set_client_segment_cache_dir(cache_dir: Optional[str]):
+    """Share encoded client segments through cache_dir (None disables sharing)"""
+    global _client_segment_cache
+    _client_segment_cache = AssetCache(cache_dir) if cache_dir else None
+
+def get_client_segment_cache() -> Optional[AssetCache]:
+    """Get the shared client segment cache, if a job enabled one"""
+    return _client_segment_cache
@@ -5,8 +5,9 @@ Manages video assets (connectors, quiz, SVSL, VSL)
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 from .processor_config import ProcessorConfig
+from .asset_cache import AssetCache
 
 class AssetManager:
     """Manages access to video assets"""
@@ -15,6 +16,7 @@ class AssetManager:
         self.config = ProcessorConfig()
         self.account_code = account_code
         self.platform_code = platform_code
+        self.asset_cache = AssetCache()
     
     def set_account_platform(self, account_code: str, platform_code: str):
         """Update account and platform codes"""
@@ -124,4 +126,17 @@ class AssetManager:
         if not video:
             print(f"⚠️ No VSL videos found in {vsl_path}")
         
-        return video
\ No newline at end of file
+        return video
+    
+    def get_normalized_asset(self, asset_path: str, specs: Dict) -> str:
+        """
+        Get the asset pre-normalized to the target spec
+        
+        Falls back to the original asset if the cache is disabled or
+        normalization fails, so callers can always use the returned path.
+        """
+        if not self.config.ASSET_CACHE_ENABLED or not asset_path:
+            return asset_path
+        
+        normalized = self.asset_cache.get_normalized(asset_path, specs)
+        return normalized or asset_path
\ No newline at end of file
@@ -0,0 +1,228 @@
+# app/src/automation/video_processing/chunked_encoder.py
+"""
+Chunked Encoder Module
+Normalizes long clips as parallel video chunks split at source keyframes
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .processor_config import ProcessorConfig
+from .video_analyzer import VideoAnalyzer
+from .ffmpeg_runner import FFmpegRunner
+from .job_control import JobCancelledError
+
+# Chunk processes per encode in this process (None for CHUNKED_ENCODE_WORKERS). Parallel
+# render workers set 1: the pool already runs an encode per worker, and chunking
+# inside each would multiply the ffmpeg processes competing for the same cores
+_chunk_worker_limit: Optional[int] = None
+
+def set_chunk_worker_limit(limit: Optional[int]):
+    """Cap the chunk processes of every encode in this process (None lifts the cap)"""
+    global _chunk_worker_limit
+    _chunk_worker_limit = limit
+
+
+class ChunkedEncoder:
+    """
+    Encodes one long clip with several ffmpeg processes at once
+    
+    The timeline is split at source keyframes (snapped to the output frame
+    grid), each chunk's video is encoded by its own ffmpeg process, and the
+    chunks are joined with the concat demuxer. Audio is encoded in a single
+    pass alongside the chunks so it has no seams, then muxed with the joined
+    video. Every chunk uses the normalized segment arguments, so the result is
+    interchangeable with a single-process encode.
+    """
+    
+    def __init__(self):
+        self.config = ProcessorConfig()
+        self.analyzer = VideoAnalyzer()
+        self.runner = FFmpegRunner()
+    
+    def should_chunk(self, duration: float) -> bool:
+        """Check whether a clip is long enough to be worth chunking"""
+        return (
+            self.config.CHUNKED_ENCODE_ENABLED
+            and self.get_chunk_workers() > 1
+            and duration >= self.config.CHUNKED_ENCODE_MIN_DURATION
+        )
+    
+    def get_chunk_workers(self) -> int:
+        """Chunk processes one encode may run at once"""
+        if _chunk_worker_limit is None:
+            return self.config.CHUNKED_ENCODE_WORKERS
+        return min(self.config.CHUNKED_ENCODE_WORKERS, _chunk_worker_limit)
+    
+    def encode(self, input_path: str, output_path: str, specs: Dict, video_filter: str,
+               audio_filter: str, duration: float, preset: str = None) -> Optional[str]:
+        """
+        Encode a clip in parallel chunks
+        
+        Args:
+            input_path: Source clip
+            output_path: Destination segment
+            specs: Target specs (width, height, frame_rate, sample_rate, preset)
+            video_filter: Normalization filter applied to every chunk
+            audio_filter: Normalization filter for the single audio pass
+            duration: Source video duration in seconds
+            preset: Optional x264 preset override
+        
+        Returns:
+            None on success, error message if the caller should encode in one pass
+        """
+        chunks = self._plan_chunks(input_path, duration, specs)
+        if len(chunks) < 2:
+            return "no usable keyframes to split at"
+        
+        print(f"🧩 CHUNKED ENCODE: {os.path.basename(input_path)} ({duration / 60:.1f} min) "
+              f"in {len(chunks)} parallel chunks")
+        
+        work_dir = f"{os.path.splitext(output_path)[0]}.chunks"
+        os.makedirs(work_dir, exist_ok=True)
+        
+        try:
+            workers = min(len(chunks), self.get_chunk_workers())
+            chunk_specs = dict(specs)
+            chunk_specs['threads'] = max(1, int(specs.get('threads') or os.cpu_count() or 1) // workers)
+            
+            chunk_paths = [os.path.join(work_dir, f"chunk_{i:03d}.mp4") for i in range(len(chunks))]
+            audio_path = os.path.join(work_dir, "audio.m4a")
+            
+            # One extra thread for the audio pass, which runs alongside the chunks
+            with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+                audio_future = executor.submit(
+                    self._encode_audio, input_path, audio_path, audio_filter, specs, duration
+                )
+                chunk_futures = [
+                    executor.submit(
+                        self._encode_chunk, input_path, chunk_path, start, frame_count,
+                        video_filter, chunk_specs, preset, index
+                    )
+                    for index, (chunk_path, (start, frame_count)) in enumerate(zip(chunk_paths, chunks))
+                ]
+                errors = [future.result() for future in chunk_futures + [audio_future]]
+            
+            errors = [error for error in errors if error]
+            if errors:
+                return errors[0]
+            
+            from .concat_processor import ConcatProcessor
+            video_path = os.path.join(work_dir, "video.mp4")
+            error = ConcatProcessor().concat_demux_copy(chunk_paths, video_path, extra_args=[])
+            if error:
+                return f"chunk join failed: {error}"
+            
+            error = self._mux(video_path, audio_path, output_path, duration)
+            if error:
+                return error
+            
+            print(f"✅ Chunked encode complete: {os.path.basename(output_path)}")
+            return None
+        
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _plan_chunks(self, input_path: str, duration: float, specs: Dict) -> List[Tuple[float, Optional[int]]]:
+        """
+        Choose chunk start times at source keyframes
+        
+        Returns:
+            List of (start seconds, frame count) per chunk; the last chunk has no
+            frame count and runs to the end of the clip
+        """
+        frame_rate = float(specs['frame_rate'])
+        count = min(
+            self.get_chunk_workers(),
+            int(duration // self.config.CHUNKED_ENCODE_MIN_CHUNK_SECONDS)
+        )
+        if count < 2:
+            return []
+        
+        # Keyframe timestamps are absolute; -ss counts from the start of the file
+        data = self.analyzer.prober.probe(input_path) or {}
+        try:
+            start_time = float(data.get('format', {}).get('start_time', 0) or 0)
+        except ValueError:
+            start_time = 0.0
+        
+        window = self.config.CHUNKED_ENCODE_KEYFRAME_WINDOW
+        starts = [0.0]
+        for index in range(1, count):
+            target = duration * index / count
+            keyframes = self.analyzer.get_keyframe_times(
+                input_path, start=start_time + target - window, end=start_time + target + window
+            )
+            if not keyframes:
+                continue
+            
+            nearest = min(keyframes, key=lambda k: abs(k - start_time - target)) - start_time
+            # Chunk lengths must be whole frames so the chunks add up to the single-pass frame count
+            snapped = round(nearest * frame_rate) / frame_rate
+            if snapped - starts[-1] >= self.config.CHUNKED_ENCODE_MIN_CHUNK_SECONDS / 2 and \
+                    duration - snapped >= self.config.CHUNKED_ENCODE_MIN_CHUNK_SECONDS / 2:
+                starts.append(snapped)
+        
+        chunks = []
+        for index, start in enumerate(starts):
+            if index + 1 < len(starts):
+                frame_count = int(round((starts[index + 1] - start) * frame_rate))
+            else:
+                frame_count = None
+            chunks.append((start, frame_count))
+        return chunks
+    
+    def _encode_chunk(self, input_path: str, chunk_path: str, start: float, frame_count: Optional[int],
+                      video_filter: str, specs: Dict, preset: Optional[str], index: int) -> Optional[str]:
+        """Encode the video of one chunk"""
+        cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+        if start > 0:
+            cmd.extend(['-ss', f"{start:.6f}"])
+        cmd.extend(['-i', input_path, '-map', '0:v:0', '-an', '-vf', video_filter])
+        if frame_count is not None:
+            cmd.extend(['-frames:v', str(frame_count)])
+        cmd.extend(self.config.get_segment_video_args(specs, preset=preset))
+        cmd.extend(self.config.get_thread_args(specs))
+        cmd.append(chunk_path)
+        
+        chunk_duration = frame_count / float(specs['frame_rate']) if frame_count is not None else None
+        return self._run(cmd, f"chunk {index + 1}", chunk_duration)
+    
+    def _encode_audio(self, input_path: str, audio_path: str, audio_filter: str,
+                      specs: Dict, duration: float) -> Optional[str]:
+        """Encode the whole clip's audio in one pass so there are no seams between chunks"""
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', input_path,
+            '-map', '0:a:0', '-vn',
+            '-af', audio_filter
+        ]
+        cmd.extend(self.config.get_segment_audio_args(specs))
+        cmd.append(audio_path)
+        return self._run(cmd, "audio", duration)
+    
+    def _mux(self, video_path: str, audio_path: str, output_path: str, duration: float) -> Optional[str]:
+        """Combine the joined video and the audio pass without re-encoding"""
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', video_path, '-i', audio_path,
+            '-map', '0:v:0', '-map', '1:a:0',
+            '-c', 'copy',
+            '-video_track_timescale', str(self.config.SEGMENT_VIDEO_TIMESCALE),
+            '-movflags', '+faststart',
+            output_path
+        ]
+        return self._run(cmd, "mux", duration)
+    
+    def _run(self, cmd: List[str], step: str, duration: float = None) -> Optional[str]:
+        """Run an FFmpeg step and return an error message on failure"""
+        try:
+            result = self.runner.run(cmd, description=f"Chunked encode {step}", duration=duration)
+            if result.returncode == 0:
+                return None
+            return f"{step} failed: {result.stderr[:300]}"
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            return f"{step} failed: {e}"
@@ -4,15 +4,172 @@ Concatenation Processor Module
 Handles robust video concatenation with perfect sync
 """
 
-import subprocess
-from typing import List, Dict, Optional
+import os
+from typing import List, Dict, Optional, Tuple
 from .processor_config import ProcessorConfig
+from .video_analyzer import VideoAnalyzer
+from .segment_encoder import SegmentEncoder
+from .remuxer import Remuxer
+from .asset_cache import get_client_segment_cache
+from .ffmpeg_runner import FFmpegRunner
+from .job_control import JobCancelledError
+from .filter_graph import FilterGraph, FilterGraphCompiler
+
+# Stream parameters that must be identical for the concat demuxer to join with -c copy
+COPY_COMPATIBLE_KEYS = [
+    'video_codec', 'video_profile', 'width', 'height', 'pix_fmt',
+    'r_frame_rate', 'time_base', 'audio_codec', 'sample_rate', 'channels'
+]
 
 class ConcatProcessor:
     """Handles video concatenation with perfect normalization"""
     
     def __init__(self):
         self.config = ProcessorConfig()
+        self.analyzer = VideoAnalyzer()
+        self.segment_encoder = SegmentEncoder()
+        self.remuxer = Remuxer()
+        self.runner = FFmpegRunner()
+    
+    def concat(self, video_list: List[str], output_path: str, specs: Dict) -> Optional[str]:
+        """Concatenate using the configured strategy"""
+        if self.config.CONCAT_STRATEGY == "encode_once" and len(video_list) > 1:
+            return self.encode_once_concat(video_list, output_path, specs)
+        return self.robust_concat(video_list, output_path, specs)
+    
+    def encode_once_concat(self, video_list: List[str], output_path: str, specs: Dict) -> Optional[str]:
+        """
+        Encode only the client segment, then join every segment with stream copy
+        
+        The endpoint assets are expected to come pre-normalized from the asset
+        cache. If any segment's stream parameters differ from the freshly
+        encoded client segment, falls back to the filter-graph concat.
+        """
+        print(f"⚡ ENCODE-ONCE CONCAT: Encoding client segment, stream-copying {len(video_list) - 1} cached segment(s)...")
+        
+        segments, temp_files = self.prepare_segments(video_list, output_path, specs)
+        
+        try:
+            if not segments:
+                print("🔄 Client segment encode failed - using robust concat")
+                return self.robust_concat(video_list, output_path, specs)
+            
+            mismatches = self.find_incompatible_segments(segments)
+            if mismatches:
+                print(f"⚠️ Segments are not stream-copy compatible: {', '.join(mismatches)}")
+                print("🔄 Falling back to robust concat")
+                return self.robust_concat(video_list, output_path, specs)
+            
+            error = self.concat_demux_copy(segments, output_path)
+            if error:
+                print(f"⚠️ Stream-copy join failed: {error}")
+                print("🔄 Falling back to robust concat")
+                return self.robust_concat(video_list, output_path, specs)
+            
+            print("✅ Encode-once concatenation successful")
+            return None
+        
+        finally:
+            self._remove_files(temp_files)
+    
+    def prepare_segments(self, video_list: List[str], output_path: str, specs: Dict) -> Tuple[Optional[List[str]], List[str]]:
+        """
+        Encode the client clip (first entry) to the normalized segment format
+        
+        A client that already matches the target specs and joins the other
+        segments as is gets stream-copied instead of encoded.
+        
+        Returns:
+            Tuple of (segment paths or None on failure, temporary files to remove)
+        """
+        client_segment = f"{os.path.splitext(output_path)[0]}.client_segment.mp4"
+        
+        def joins_other_segments(remuxed_path):
+            mismatches = self.find_incompatible_segments([remuxed_path] + list(video_list[1:]))
+            return f"does not join the cached segments ({mismatches[0]})" if mismatches else None
+        
+        if self.remuxer.try_remux(video_list[0], client_segment, specs, verify=joins_other_segments):
+            return [client_segment] + list(video_list[1:]), [client_segment]
+        
+        # When several modes render the same client, reuse the segment the first mode encoded
+        shared_cache = get_client_segment_cache()
+        if shared_cache:
+            shared_segment = shared_cache.get_normalized(video_list[0], specs)
+            if shared_segment:
+                return [shared_segment] + list(video_list[1:]), []
+        
+        error = self.segment_encoder.encode(video_list[0], client_segment, specs, preset=self.config.SEGMENT_PRESET)
+        if error:
+            print(f"❌ Client segment encode failed: {error}")
+            return None, [client_segment]
+        
+        return [client_segment] + list(video_list[1:]), [client_segment]
+    
+    def find_incompatible_segments(self, segments: List[str]) -> List[str]:
+        """
+        Compare every segment's stream parameters against the first segment
+        
+        Returns:
+            List of human-readable mismatch descriptions (empty if compatible)
+        """
+        reference = self.analyzer.get_stream_parameters(segments[0])
+        if not reference:
+            return [f"{os.path.basename(segments[0])}: could not probe"]
+        
+        mismatches = []
+        for segment in segments[1:]:
+            params = self.analyzer.get_stream_parameters(segment)
+            if not params:
+                mismatches.append(f"{os.path.basename(segment)}: could not probe")
+                continue
+            
+            for key in COPY_COMPATIBLE_KEYS:
+                if params.get(key) != reference.get(key):
+                    mismatches.append(
+                        f"{os.path.basename(segment)}: {key}={params.get(key)} (expected {reference.get(key)})"
+                    )
+        
+        return mismatches
+    
+    def concat_demux_copy(self, segments: List[str], output_path: str, extra_args: List[str] = None) -> Optional[str]:
+        """Join segments with the concat demuxer without re-encoding"""
+        list_path = f"{os.path.splitext(output_path)[0]}.concat.txt"
+        
+        try:
+            with open(list_path, 'w', encoding='utf-8') as f:
+                for segment in segments:
+                    escaped = os.path.abspath(segment).replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+            
+            cmd = [
+                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                '-f', 'concat', '-safe', '0',
+                '-i', list_path,
+                '-c', 'copy'
+            ]
+            cmd.extend(extra_args if extra_args is not None else ['-movflags', '+faststart'])
+            cmd.append(output_path)
+            
+            result = self.runner.run(cmd, description=f"Join {os.path.basename(output_path)}")
+            if result.returncode == 0:
+                return None
+            return f"FFmpeg error: {result.stderr[:300]}"
+        
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            return f"Stream-copy join failed: {e}"
+        finally:
+            self._remove_files([list_path])
+    
+    def _remove_files(self, paths: List[str]):
+        """Remove temporary files, ignoring ones that were never created"""
+        for path in paths:
+            try:
+                if path and os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                print(f"⚠️ Could not remove temporary file {path}: {e}")
     
     def robust_concat(self, video_list: List[str], output_path: str, specs: Dict) -> Optional[str]:
         """
@@ -45,15 +202,19 @@ class ConcatProcessor:
                 '-b:a', self.config.DEFAULT_AUDIO_BITRATE,
                 '-ar', str(specs['sample_rate']),
                 '-ac', '2',  # Ensure stereo
-                '-movflags', '+faststart',
-                output_path
+                '-movflags', '+faststart'
             ])
+            cmd.extend(self.config.get_thread_args(specs))
+            cmd.append(output_path)
             
             self._print_processing_info(specs)
             
             # Execute FFmpeg
             print("🎬 Starting FFmpeg processing...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.runner.run(
+                cmd, description=f"Concat {os.path.basename(output_path)}",
+                duration=specs.get('total_duration')
+            )
             
             if result.returncode == 0:
                 print(f"✅ ROBUST concatenation successful - perfect sync guaranteed")
@@ -63,46 +224,28 @@ class ConcatProcessor:
                 print(f"   Error: {result.stderr[:500]}")
                 return f"FFmpeg error: {result.stderr[:200]}"
                 
+        except JobCancelledError:
+            raise
         except Exception as e:
             print(f"❌ Robust concatenation failed: {e}")
             return f"Robust concatenation failed: {e}"
     
     def _build_filter_complex(self, video_list: List[str], specs: Dict) -> str:
         """Build the filter_complex string for FFmpeg"""
-        filter_parts = []
-        
-        # Normalize each input video to identical specs
-        for i in range(len(video_list)):
-            # Video normalization
-            video_filter = (
-                f"[{i}:v]"
-                f"scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-                f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-                f"fps={specs['frame_rate']},"
-                f"setsar=1"
-                f"[v{i}]"
-            )
-            filter_parts.append(video_filter)
-            
-            # Audio normalization
-            audio_filter = (
-                f"[{i}:a]"
-                f"aresample={specs['sample_rate']},"
-                f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo,"
-                f"asetpts=PTS-STARTPTS"
-                f"[a{i}]"
-            )
-            filter_parts.append(audio_filter)
+        graph = FilterGraph()
+        compiler = FilterGraphCompiler(specs)
         
-        # Concatenate all normalized streams
-        concat_inputs = ""
-        for i in range(len(video_list)):
-            concat_inputs += f"[v{i}][a{i}]"
+        # Normalize each input only as far as it differs from the target specs
+        video_labels, audio_labels = compiler.add_normalized_inputs(graph, video_list, reset_timestamps=True)
+        compiler.report()
         
-        concat_filter = f"{concat_inputs}concat=n={len(video_list)}:v=1:a=1[outv][outa]"
-        filter_parts.append(concat_filter)
+        # Concatenate all normalized streams
+        concat_inputs = []
+        for video_label, audio_label in zip(video_labels, audio_labels):
+            concat_inputs.extend([video_label, audio_label])
+        graph.add(concat_inputs, [f"concat=n={len(video_list)}:v=1:a=1"], ['outv', 'outa'])
         
-        return ";".join(filter_parts)
+        return graph.compile(['outv', 'outa'])
     
     def _print_processing_info(self, specs: Dict):
         """Print processing information"""
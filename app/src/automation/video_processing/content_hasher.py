@@ -0,0 +1,147 @@
+# app/src/automation/video_processing/content_hasher.py
+"""
+Content Hasher Module
+Computes content hashes for video files, remembered per (path, size, mtime);
+files whose identity is already known (Drive downloads) are never read
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+from .processor_config import ProcessorConfig
+from .file_cache import prune_path_index
+
+class ContentHasher:
+    """Hashes file contents once per modification and remembers the result on disk"""
+    
+    CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB reads keep memory flat for multi-GB files
+    
+    def __init__(self, index_path: str = None):
+        self.config = ProcessorConfig()
+        self.index_path = index_path or self.config.CONTENT_HASH_INDEX
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = self._load_index()
+    
+    def get_hash(self, file_path: str) -> Optional[str]:
+        """
+        Get the SHA-256 of a file's contents
+        
+        The file is only read when its size or modification time changed
+        since the last time it was hashed or remember()ed.
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            Hex digest (or the identifier given to remember()), or None if
+            the file cannot be read
+        """
+        try:
+            abs_path = os.path.abspath(file_path)
+            stat = os.stat(abs_path)
+        except OSError as e:
+            print(f"⚠️ Cannot hash {os.path.basename(file_path)}: {e}")
+            return None
+        
+        with self._lock:
+            entry = self._index.get(abs_path)
+            if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                entry['last_used'] = time.time()
+                return entry['sha256']
+        
+        print(f"🔑 Hashing {os.path.basename(abs_path)} ({stat.st_size / (1024 * 1024):.1f} MB)...")
+        digest = self._hash_file(abs_path)
+        if not digest:
+            return None
+        
+        self._record(abs_path, stat, digest)
+        return digest
+    
+    def remember(self, file_path: str, digest: str):
+        """
+        Record a file's hash without reading it
+        
+        For files identified some other way, such as a Drive download verified
+        against its md5Checksum. get_hash() returns digest until the file's
+        size or modification time changes.
+        
+        Args:
+            file_path: Path to the file
+            digest: Identifier to return for it
+        """
+        try:
+            abs_path = os.path.abspath(file_path)
+            stat = os.stat(abs_path)
+        except OSError as e:
+            print(f"⚠️ Cannot record hash of {os.path.basename(file_path)}: {e}")
+            return
+        
+        self._record(abs_path, stat, digest)
+    
+    def _record(self, abs_path: str, stat: os.stat_result, digest: str):
+        """Store a digest for a file as it is now"""
+        with self._lock:
+            self._index[abs_path] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'last_used': time.time(),
+                'sha256': digest
+            }
+            self._save_index()
+    
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """Stream the file through SHA-256"""
+        try:
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                    sha.update(chunk)
+            return sha.hexdigest()
+        except OSError as e:
+            print(f"⚠️ Could not hash {os.path.basename(file_path)}: {e}")
+            return None
+    
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the hash index from disk"""
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not read content hash index, starting fresh: {e}")
+            return {}
+    
+    def _save_index(self):
+        """Merge with the on-disk index and write it back atomically"""
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            
+            # Another process may have hashed files since we loaded
+            merged = self._load_index()
+            merged.update(self._index)
+            self._index = merged
+            dropped = prune_path_index(self._index, self.config.CONTENT_HASH_INDEX_MAX_ENTRIES)
+            if dropped:
+                print(f"🧹 Content hash index: dropped {dropped} stale entries")
+            
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, indent=2)
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            print(f"⚠️ Could not save content hash index: {e}")
+
+
+# Shared instance so every component reuses the same in-memory index
+_default_hasher = None
+
+def get_content_hasher() -> ContentHasher:
+    """Get the shared content hasher"""
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = ContentHasher()
+    return _default_hasher
@@ -0,0 +1,328 @@
+# app/src/automation/video_processing/ffmpeg_runner.py
+"""
+FFmpeg Runner Module
+Runs ffmpeg with streamed progress, a bounded stderr buffer and progress listeners
+"""
+
+import os
+import sys
+import time
+import threading
+import subprocess
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from .job_control import get_job_control, JobCancelledError
+from .processor_config import ProcessorConfig
+
+# Only the tail of stderr is kept; hour-long renders would otherwise buffer megabytes
+STDERR_TAIL_BYTES = 64 * 1024
+
+# Minimum seconds between progress events for the same run
+PROGRESS_INTERVAL = 1.0
+
+# Output options that belong to the real muxer and are rejected by the null muxer
+MUXER_ONLY_OPTIONS = {'-f', '-movflags'}
+
+_listeners: List[Callable[[Dict], None]] = []
+_listeners_lock = threading.Lock()
+
+def add_progress_listener(listener: Callable[[Dict], None]):
+    """Register a callback that receives every ffmpeg progress event in this process"""
+    with _listeners_lock:
+        _listeners.append(listener)
+
+def remove_progress_listener(listener: Callable[[Dict], None]):
+    """Unregister a progress callback"""
+    with _listeners_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+@contextmanager
+def progress_listener(listener: Callable[[Dict], None]):
+    """Register a progress callback for the duration of a with-block"""
+    add_progress_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_progress_listener(listener)
+
+def dispatch_progress(progress: Dict):
+    """Deliver a progress event to every registered listener"""
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(progress)
+        except Exception as e:
+            print(f"⚠️ Progress listener failed: {e}")
+
+def format_progress(progress: Dict) -> str:
+    """Format a progress event as a one-line status message"""
+    out_time = progress.get('out_time', 0)
+    parts = [f"🎬 {progress.get('description') or 'FFmpeg'}: {int(out_time // 60)}:{int(out_time % 60):02d}"]
+    if progress.get('percent') is not None:
+        parts.append(f"{progress['percent']:.0f}%")
+    if progress.get('fps'):
+        parts.append(f"{progress['fps']:.0f} fps")
+    if progress.get('speed'):
+        parts.append(f"{progress['speed']:.1f}x")
+    return " • ".join(parts)
+
+def band_progress(progress_callback: Callable[[float, str], None], start: float, end: float) -> Callable[[Dict], None]:
+    """
+    Build a listener that moves a progress_callback(percent, message) bar within start..end
+    
+    Every ffmpeg run reports its own 0-100%, so the bar keeps its highest
+    position instead of jumping back when the next run starts.
+    """
+    position = [start]
+    
+    def listener(progress: Dict):
+        percent = progress.get('percent') or 0
+        position[0] = max(position[0], start + (end - start) * min(percent, 100) / 100)
+        progress_callback(position[0], format_progress(progress))
+    
+    return listener
+
+
+class FFmpegResult:
+    """Outcome of an ffmpeg run (mirrors the subprocess.CompletedProcess fields callers use)"""
+    
+    def __init__(self, args: List[str], returncode: int, stderr: str, progress: Dict):
+        self.args = args
+        self.returncode = returncode
+        self.stderr = stderr
+        self.stdout = ""
+        self.progress = progress
+
+
+class FFmpegRunner:
+    """Runs ffmpeg commands and streams their progress instead of buffering output"""
+    
+    def run(self, cmd: List[str], description: str = None, duration: float = None,
+            timeout: float = None, on_progress: Callable[[Dict], None] = None) -> FFmpegResult:
+        """
+        Run an ffmpeg command
+        
+        Args:
+            cmd: Full ffmpeg command line
+            description: Short label included in progress events
+            duration: Expected output duration in seconds, used for percentages
+            timeout: Kill the process after this many seconds (raises TimeoutExpired)
+            on_progress: Optional callback for this run only, in addition to listeners
+        
+        Returns:
+            FFmpegResult with the return code and the tail of stderr
+        
+        Raises:
+            JobCancelledError: If the job is cancelled before or during the run
+        """
+        cmd = self._with_progress_args(cmd)
+        
+        job = get_job_control()
+        job.check_cancelled()
+        
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            **self._platform_kwargs(job)
+        )
+        job.register_process(process)
+        
+        stderr_tail = deque()
+        stderr_thread = threading.Thread(
+            target=self._drain_stderr, args=(process, stderr_tail), daemon=True
+        )
+        stderr_thread.start()
+        
+        timed_out = threading.Event()
+        timer = None
+        if timeout:
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.daemon = True
+            timer.start()
+        
+        last_progress = {}
+        try:
+            last_progress = self._read_progress(process, description, duration, on_progress)
+            process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            stderr_thread.join(timeout=5)
+            job.unregister_process(process.pid)
+        
+        if job.cancelled:
+            raise JobCancelledError(job.cancel_reason or "Job cancelled")
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, stderr="".join(stderr_tail))
+        
+        return FFmpegResult(cmd, process.returncode, "".join(stderr_tail), last_progress)
+    
+    def dry_run(self, cmd: List[str], seconds: float, description: str = None,
+                timeout: float = None) -> FFmpegResult:
+        """
+        Run an encode command on a short slice, discarding the output
+        
+        The inputs, filter graph and encoder settings are used as given, so
+        graph wiring, format negotiation and encoder errors show up without
+        paying for the full encode.
+        
+        Args:
+            cmd: Full ffmpeg command line; the last element is the output path
+            seconds: Output duration to process
+            description: Short label included in progress events
+            timeout: Kill the process after this many seconds (raises TimeoutExpired)
+        
+        Returns:
+            FFmpegResult of the dry run
+        """
+        # Input options (an input -f included) come before the last -i and are kept
+        last_input = max((i for i, arg in enumerate(cmd) if arg == '-i'), default=-2)
+        dry_cmd = list(cmd[:last_input + 2])
+        skip_value = False
+        for arg in cmd[last_input + 2:-1]:
+            if skip_value:
+                skip_value = False
+                continue
+            if arg in MUXER_ONLY_OPTIONS:
+                skip_value = True
+                continue
+            dry_cmd.append(arg)
+        dry_cmd.extend(['-t', str(seconds), '-f', 'null', '-'])
+        
+        return self.run(dry_cmd, description=description, timeout=timeout)
+    
+    def preflight(self, cmd: List[str]) -> Optional[str]:
+        """
+        Dry-run an encode command with the GRAPH_DRY_RUN_* settings
+        
+        Args:
+            cmd: Full ffmpeg command line; the last element is the output path
+        
+        Returns:
+            None if the command is expected to work (or dry runs are disabled),
+            otherwise the reason it won't
+        """
+        if not ProcessorConfig.GRAPH_DRY_RUN_ENABLED:
+            return None
+        
+        try:
+            result = self.dry_run(
+                cmd, ProcessorConfig.GRAPH_DRY_RUN_SECONDS,
+                description=f"Dry run {os.path.basename(cmd[-1])}",
+                timeout=ProcessorConfig.GRAPH_DRY_RUN_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            return f"dry run did not finish within {ProcessorConfig.GRAPH_DRY_RUN_TIMEOUT}s"
+        
+        if result.returncode != 0:
+            return result.stderr.strip()[-300:] or f"ffmpeg exited with code {result.returncode}"
+        return None
+    
+    def _with_progress_args(self, cmd: List[str]) -> List[str]:
+        """Ask ffmpeg for machine-readable progress on stdout"""
+        if '-progress' in cmd:
+            return list(cmd)
+        return [cmd[0], '-progress', 'pipe:1', '-nostats'] + list(cmd[1:])
+    
+    def _platform_kwargs(self, job) -> Dict:
+        """Start ffmpeg in its own process group and hide its console window on Windows"""
+        kwargs = job.popen_kwargs()
+        if sys.platform == "win32":
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            kwargs['startupinfo'] = startupinfo
+        return kwargs
+    
+    def _drain_stderr(self, process: subprocess.Popen, stderr_tail: deque):
+        """Keep only the last STDERR_TAIL_BYTES of stderr"""
+        size = 0
+        for line in process.stderr:
+            stderr_tail.append(line)
+            size += len(line)
+            while size > STDERR_TAIL_BYTES and len(stderr_tail) > 1:
+                size -= len(stderr_tail.popleft())
+    
+    def _read_progress(self, process: subprocess.Popen, description: Optional[str],
+                       duration: Optional[float], on_progress: Optional[Callable]) -> Dict:
+        """Parse -progress key=value blocks and emit throttled progress events"""
+        block = {}
+        last_progress = {}
+        last_emit = 0.0
+        
+        for line in process.stdout:
+            key, _, value = line.strip().partition('=')
+            if not key:
+                continue
+            if key != 'progress':
+                block[key] = value
+                continue
+            
+            progress = self._build_progress(block, value, description, duration, process.pid)
+            block = {}
+            last_progress = progress
+            
+            now = time.time()
+            if value == 'end' or now - last_emit >= PROGRESS_INTERVAL:
+                last_emit = now
+                if on_progress:
+                    try:
+                        on_progress(progress)
+                    except Exception as e:
+                        print(f"⚠️ Progress callback failed: {e}")
+                dispatch_progress(progress)
+        
+        return last_progress
+    
+    def _build_progress(self, block: Dict, state: str, description: Optional[str],
+                        duration: Optional[float], pid: int) -> Dict:
+        """Turn one -progress block into a structured event"""
+        out_time = 0.0
+        # out_time_ms is reported in microseconds, just like out_time_us
+        for key in ('out_time_us', 'out_time_ms'):
+            try:
+                out_time = max(0.0, int(block[key]) / 1_000_000)
+                break
+            except (KeyError, ValueError):
+                continue
+        
+        try:
+            fps = float(block.get('fps', 0))
+        except ValueError:
+            fps = 0.0
+        
+        try:
+            speed = float(block.get('speed', '0').rstrip('x') or 0)
+        except ValueError:
+            speed = 0.0
+        
+        try:
+            frame = int(block.get('frame', 0))
+        except ValueError:
+            frame = 0
+        
+        percent = None
+        if duration and duration > 0:
+            percent = 100.0 if state == 'end' else min(100.0, out_time / duration * 100)
+        
+        return {
+            'description': description,
+            'pid': pid,
+            'out_time': out_time,
+            'fps': fps,
+            'speed': speed,
+            'frame': frame,
+            'percent': percent,
+            'state': state
+        }
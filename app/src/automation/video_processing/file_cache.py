@@ -0,0 +1,231 @@
+# app/src/automation/video_processing/file_cache.py
+"""
+File Cache Module
+Size-capped, least-recently-used cache of whole files addressed by key
+"""
+
+import os
+import json
+import time
+import shutil
+import threading
+from typing import Dict, Optional
+
+def link_or_copy(source_path: str, dest_path: str) -> str:
+    """
+    Hardlink a file, falling back to a copy across filesystems
+    
+    Returns:
+        'link' or 'copy', whichever was used
+    """
+    try:
+        os.link(source_path, dest_path)
+        return 'link'
+    except OSError:
+        shutil.copy2(source_path, dest_path)
+        return 'copy'
+
+
+def prune_path_index(index: Dict[str, Dict], max_entries: int) -> int:
+    """
+    Keep a per-file index within max_entries
+    
+    Entries whose file no longer exists go first, then the least recently
+    used ones (by their 'last_used' time).
+    
+    Args:
+        index: Dict keyed by absolute file path (modified in place)
+        max_entries: Most entries to keep
+    
+    Returns:
+        Number of entries dropped
+    """
+    before = len(index)
+    if before <= max_entries:
+        return 0
+    
+    for path in [path for path in index if not os.path.exists(path)]:
+        del index[path]
+    
+    excess = len(index) - max_entries
+    if excess > 0:
+        for path in sorted(index, key=lambda path: index[path].get('last_used', 0))[:excess]:
+            del index[path]
+    
+    return before - len(index)
+
+
+class FileCache:
+    """
+    Directory of cached files with an LRU index and hit statistics
+    
+    Files are stored and handed out by hardlink where possible, so a hit costs
+    no copying. Writers must replace files rather than rewrite them in place,
+    which the rest of the pipeline already does (temp name + os.replace).
+    """
+    
+    INDEX_FILENAME = "index.json"
+    
+    def __init__(self, cache_dir: str, max_bytes: int, label: str = "File cache"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.label = label
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+    
+    def fetch(self, key: str, dest_path: str) -> bool:
+        """
+        Materialize a cached file at dest_path
+        
+        Args:
+            key: Cache key
+            dest_path: Where the file should appear (replaced atomically)
+        
+        Returns:
+            True on a hit, False on a miss
+        """
+        with self._lock:
+            entry = self._index['entries'].get(key)
+            cached_path = os.path.join(self.cache_dir, entry['file']) if entry else None
+            
+            if not entry or not os.path.exists(cached_path):
+                self._index['entries'].pop(key, None)
+                self._index['stats']['misses'] += 1
+                self._save_index()
+                return False
+            
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+                temp_path = f"{dest_path}.{os.getpid()}.cache_tmp"
+                method = link_or_copy(cached_path, temp_path)
+                os.replace(temp_path, dest_path)
+            except OSError as e:
+                print(f"⚠️ {self.label}: could not restore {os.path.basename(dest_path)}: {e}")
+                self._index['stats']['misses'] += 1
+                self._save_index()
+                return False
+            
+            entry['last_used'] = time.time()
+            self._index['stats']['hits'] += 1
+            self._save_index()
+        
+        print(f"♻️ {self.label} hit ({method}): {os.path.basename(dest_path)}")
+        return True
+    
+    def store(self, key: str, source_path: str) -> Optional[str]:
+        """
+        Add a file to the cache, evicting the least recently used entries if over quota
+        
+        Args:
+            key: Cache key
+            source_path: Finished file to cache (left in place)
+        
+        Returns:
+            Path of the cached file, or None if it could not be stored
+        """
+        try:
+            size = os.path.getsize(source_path)
+        except OSError:
+            return None
+        
+        if size > self.max_bytes:
+            print(f"⚠️ {self.label}: {os.path.basename(source_path)} is larger than the whole cache, not stored")
+            return None
+        
+        file_name = f"{key[:16]}_{os.path.basename(source_path)}"
+        cached_path = os.path.join(self.cache_dir, file_name)
+        
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_path = f"{cached_path}.{os.getpid()}.cache_tmp"
+                link_or_copy(source_path, temp_path)
+                os.replace(temp_path, cached_path)
+            except OSError as e:
+                print(f"⚠️ {self.label}: could not store {os.path.basename(source_path)}: {e}")
+                return None
+            
+            self._index['entries'][key] = {
+                'file': file_name,
+                'size': size,
+                'last_used': time.time()
+            }
+            self._evict()
+            self._save_index()
+        
+        return cached_path
+    
+    def contains(self, key: str) -> bool:
+        """Check for an entry without counting a hit or a miss"""
+        with self._lock:
+            entry = self._index['entries'].get(key)
+            return bool(entry) and os.path.exists(os.path.join(self.cache_dir, entry['file']))
+    
+    def get_stats(self) -> Dict:
+        """Hit/miss counts since the cache was created, plus current usage"""
+        with self._lock:
+            hits = self._index['stats']['hits']
+            misses = self._index['stats']['misses']
+            lookups = hits + misses
+            return {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'entries': len(self._index['entries']),
+                'size_bytes': sum(e.get('size', 0) for e in self._index['entries'].values()),
+                'max_bytes': self.max_bytes
+            }
+    
+    def print_stats(self):
+        """Print a one-line summary of the cache's hit rate and usage"""
+        stats = self.get_stats()
+        print(f"📊 {self.label}: {stats['hits']}/{stats['hits'] + stats['misses']} hits "
+              f"({stats['hit_rate'] * 100:.0f}%), {stats['entries']} entries, "
+              f"{stats['size_bytes'] / (1024 ** 3):.1f}/{stats['max_bytes'] / (1024 ** 3):.0f} GB")
+    
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its quota (caller holds the lock)"""
+        entries = self._index['entries']
+        total = sum(e.get('size', 0) for e in entries.values())
+        
+        for key, entry in sorted(entries.items(), key=lambda item: item[1].get('last_used', 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, entry['file']))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"⚠️ {self.label}: could not evict {entry['file']}: {e}")
+                continue
+            total -= entry.get('size', 0)
+            del entries[key]
+            print(f"🧹 {self.label}: evicted {entry['file']}")
+    
+    def _load_index(self) -> Dict:
+        """Load the index from the cache directory"""
+        index = {'entries': {}, 'stats': {'hits': 0, 'misses': 0}}
+        if not os.path.exists(self.index_path):
+            return index
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            index['entries'].update(stored.get('entries', {}))
+            index['stats'].update(stored.get('stats', {}))
+        except Exception as e:
+            print(f"⚠️ Could not read {self.label.lower()} index, starting fresh: {e}")
+        
+        return index
+    
+    def _save_index(self):
+        """Write the index atomically (caller holds the lock)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, indent=2)
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            print(f"⚠️ Could not save {self.label.lower()} index: {e}")
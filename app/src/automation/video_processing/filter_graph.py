@@ -0,0 +1,304 @@
+# app/src/automation/video_processing/filter_graph.py
+"""
+Filter Graph Module
+Compiles -filter_complex graphs, skipping normalization stages an input already satisfies
+"""
+
+import re
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+from .probe_service import get_probe_service
+
+# [0:v], [1:a], [2:v:0] ... refer to input streams rather than graph labels
+_STREAM_SPECIFIER = re.compile(r"^\d+:[va](:\d+)?$")
+
+# Offsets are computed from float durations, so allow for rounding
+_TIME_TOLERANCE = 0.001
+
+class FilterGraphError(ValueError):
+    """Raised when a filter graph is wired incorrectly"""
+
+
+def check_xfade_offsets(durations: List[float], offsets: List[float], transition_duration: float):
+    """
+    Check that chained xfade offsets fall inside the clips they join
+    
+    Args:
+        durations: Duration of every input, in order
+        offsets: xfade offset of each transition (one fewer than durations)
+        transition_duration: Length of every transition
+    
+    Raises:
+        FilterGraphError: If a transition starts before zero or runs past its inputs
+    """
+    if len(offsets) != len(durations) - 1:
+        raise FilterGraphError(f"{len(offsets)} transition offsets for {len(durations)} inputs")
+    
+    # Length of the stream built so far; each xfade yields offset + next clip
+    length = durations[0]
+    for index, offset in enumerate(offsets):
+        next_duration = durations[index + 1]
+        if offset < 0 or offset + transition_duration > length + _TIME_TOLERANCE:
+            raise FilterGraphError(
+                f"transition {index + 1} at {offset:.2f}s does not fit in {length:.2f}s of video"
+            )
+        if next_duration + _TIME_TOLERANCE < transition_duration:
+            raise FilterGraphError(
+                f"input {index + 1} ({next_duration:.2f}s) is shorter than the {transition_duration}s transition"
+            )
+        length = offset + next_duration
+
+
+class FilterGraph:
+    """
+    A -filter_complex graph assembled from labelled chains
+    
+    compile() checks the wiring before ffmpeg ever sees it: every label is
+    produced once, consumed at most once and only after it is produced, and
+    the labels left unconsumed are exactly the outputs the caller maps.
+    """
+    
+    def __init__(self):
+        self.chains: List[Tuple[List[str], List[str], List[str]]] = []
+    
+    def add(self, inputs: List[str], filters: List[str], outputs: List[str]):
+        """
+        Append a chain
+        
+        Args:
+            inputs: Input labels or stream specifiers, without brackets
+            filters: Filters applied in order (joined with commas)
+            outputs: Output labels, without brackets
+        """
+        self.chains.append((list(inputs), list(filters), list(outputs)))
+    
+    @classmethod
+    def parse(cls, filter_complex: str) -> 'FilterGraph':
+        """Build a graph from an existing -filter_complex string"""
+        graph = cls()
+        for chain in filter_complex.split(';'):
+            chain = chain.strip()
+            if not chain:
+                continue
+            
+            inputs = []
+            while chain.startswith('['):
+                label, chain = chain[1:].split(']', 1)
+                inputs.append(label)
+            
+            outputs = []
+            while chain.endswith(']'):
+                chain, label = chain[:-1].rsplit('[', 1)
+                outputs.insert(0, label)
+            
+            graph.add(inputs, [chain] if chain else [], outputs)
+        return graph
+    
+    def validate(self, expected_outputs: List[str] = None) -> List[str]:
+        """
+        Check the graph's wiring
+        
+        Args:
+            expected_outputs: Labels the caller will -map; if given, the
+                unconsumed labels must match them exactly
+        
+        Returns:
+            The graph's output labels, in the order they were produced
+        
+        Raises:
+            FilterGraphError: Describing the first problem found
+        """
+        produced = []
+        consumed = set()
+        
+        for index, (inputs, filters, outputs) in enumerate(self.chains):
+            if not filters:
+                raise FilterGraphError(f"chain {index} has no filters")
+            
+            for label in inputs:
+                if _STREAM_SPECIFIER.match(label):
+                    continue
+                if label not in produced:
+                    raise FilterGraphError(f"[{label}] is used before it is produced (chain {index})")
+                if label in consumed:
+                    raise FilterGraphError(f"[{label}] is consumed more than once (chain {index})")
+                consumed.add(label)
+            
+            for label in outputs:
+                if label in produced or _STREAM_SPECIFIER.match(label):
+                    raise FilterGraphError(f"[{label}] is produced more than once (chain {index})")
+                produced.append(label)
+        
+        graph_outputs = [label for label in produced if label not in consumed]
+        if expected_outputs is not None and sorted(graph_outputs) != sorted(expected_outputs):
+            raise FilterGraphError(
+                f"graph outputs {graph_outputs} do not match the mapped outputs {list(expected_outputs)}"
+            )
+        return graph_outputs
+    
+    def compile(self, expected_outputs: List[str] = None) -> str:
+        """Validate the graph and render it as a -filter_complex string"""
+        self.validate(expected_outputs)
+        return ";".join(
+            "".join(f"[{label}]" for label in inputs) + ",".join(filters) + "".join(f"[{label}]" for label in outputs)
+            for inputs, filters, outputs in self.chains
+        )
+
+
+class FilterGraphCompiler:
+    """
+    Plans per-input normalization from probed stream properties
+    
+    Each stage (scale, pad, setsar, fps, resample, channel layout, timestamp
+    reset) is only emitted when the input does not already satisfy it, so an
+    input that matches the target spec passes through without being scaled or
+    resampled.
+    """
+    
+    def __init__(self, specs: Dict):
+        """
+        Args:
+            specs: Target specs with width, height, frame_rate and sample_rate
+        """
+        self.specs = specs
+        self.prober = get_probe_service()
+        self.stages_skipped = 0
+        self.stages_total = 0
+    
+    def video_filters(self, stream: Optional[Dict], reset_timestamps: bool = False,
+                      extra_filters: List[str] = None, timebase_matches: bool = True) -> List[str]:
+        """Video normalization stages this stream actually needs"""
+        width, height = int(self.specs['width']), int(self.specs['height'])
+        stream = stream or {}
+        src_width, src_height = stream.get('width'), stream.get('height')
+        
+        size_matches = src_width == width and src_height == height
+        aspect_matches = bool(src_width and src_height) and src_width * height == src_height * width
+        
+        stages = [
+            (f"scale={width}:{height}:force_original_aspect_ratio=decrease", size_matches),
+            (f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black", size_matches or aspect_matches),
+            # scale rewrites the SAR, so setsar can only go when nothing is scaled
+            ("setsar=1", size_matches and stream.get('sample_aspect_ratio') == '1:1'),
+            # fps also unifies time bases, which xfade insists on
+            (f"fps={self.specs['frame_rate']}", timebase_matches and self._is_constant_rate(stream))
+        ]
+        # Only a requested reset counts as a stage, skipped or not
+        if reset_timestamps:
+            stages.append(("setpts=PTS-STARTPTS", self._starts_at_zero(stream)))
+        return self._keep(stages) + list(extra_filters or [])
+    
+    def audio_filters(self, stream: Optional[Dict], resync: bool = False,
+                      reset_timestamps: bool = False) -> List[str]:
+        """Audio normalization stages this stream actually needs"""
+        sample_rate = int(self.specs['sample_rate'])
+        stream = stream or {}
+        
+        try:
+            rate_matches = int(stream.get('sample_rate', 0)) == sample_rate
+        except (TypeError, ValueError):
+            rate_matches = False
+        layout_matches = stream.get('channels') == 2 and stream.get('channel_layout') == 'stereo'
+        
+        stages = [
+            # async resampling corrects drift, so it is kept whenever it was asked for
+            (f"aresample={sample_rate}:async=1" if resync else f"aresample={sample_rate}",
+             rate_matches and not resync),
+            (f"aformat=sample_rates={sample_rate}:channel_layouts=stereo", rate_matches and layout_matches)
+        ]
+        if reset_timestamps:
+            stages.append(("asetpts=PTS-STARTPTS", self._starts_at_zero(stream)))
+        return self._keep(stages)
+    
+    def probe_streams(self, video_path: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Get the first video and audio stream of a file from the probe cache"""
+        data = self.prober.probe(video_path) or {}
+        streams = data.get('streams', [])
+        video_stream = next((s for s in streams if s.get('codec_type') == 'video'), None)
+        audio_stream = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+        return video_stream, audio_stream
+    
+    def timebases_match(self, video_streams: List[Optional[Dict]]) -> bool:
+        """
+        True if inputs joined by xfade can all skip fps
+        
+        fps also resets the time base, so it has to be applied to every input
+        or to none of them.
+        """
+        time_bases = {(stream or {}).get('time_base') for stream in video_streams}
+        if len(time_bases) != 1 or None in time_bases:
+            return False
+        return all(self._is_constant_rate(stream) for stream in video_streams)
+    
+    def add_normalized_inputs(self, graph: FilterGraph, video_list: List[str],
+                              reset_timestamps: bool = False, audio_resync: bool = False,
+                              extra_video_filters: List[str] = None,
+                              match_timebase: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Add normalization chains for every input to a graph
+        
+        Args:
+            graph: Graph to add the chains to
+            video_list: Input files, in -i order
+            reset_timestamps: Start every stream at PTS 0
+            audio_resync: Resample audio with async drift correction
+            extra_video_filters: Filters appended after normalization (e.g. format=yuva420p)
+            match_timebase: The graph joins inputs with xfade, so video time bases must agree
+        
+        Returns:
+            Tuple of (video labels, audio labels), one per input: v0.., a0..
+        """
+        self.prober.probe_many(video_list)
+        streams = [self.probe_streams(path) for path in video_list]
+        timebase_matches = not match_timebase or self.timebases_match([video for video, _ in streams])
+        
+        video_labels = [f"v{i}" for i in range(len(video_list))]
+        audio_labels = [f"a{i}" for i in range(len(video_list))]
+        
+        # A repeated file gets its own chain per -i: concat and xfade read the
+        # branches one after another, so splitting one chain would hold every
+        # frame of the earlier branch in memory
+        for index, (video_stream, audio_stream) in enumerate(streams):
+            graph.add(
+                [f"{index}:v"],
+                self.video_filters(video_stream, reset_timestamps, extra_video_filters, timebase_matches) or ['null'],
+                [video_labels[index]]
+            )
+            graph.add(
+                [f"{index}:a"],
+                self.audio_filters(audio_stream, audio_resync, reset_timestamps) or ['anull'],
+                [audio_labels[index]]
+            )
+        
+        return video_labels, audio_labels
+    
+    def report(self):
+        """Print how much normalization work was skipped"""
+        if self.stages_total:
+            print(f"🧮 Filter graph: skipped {self.stages_skipped}/{self.stages_total} "
+                  f"normalization stages already satisfied by the inputs")
+    
+    def _keep(self, stages: List[Tuple[str, bool]]) -> List[str]:
+        """Keep the stages that are not already satisfied and count the rest"""
+        kept = [stage for stage, satisfied in stages if not satisfied]
+        self.stages_total += len(stages)
+        self.stages_skipped += len(stages) - len(kept)
+        return kept
+    
+    def _is_constant_rate(self, stream: Dict) -> bool:
+        """True if the stream is constant frame rate at the target rate"""
+        try:
+            real_rate = Fraction(stream.get('r_frame_rate', '0/1'))
+            average_rate = Fraction(stream.get('avg_frame_rate', '0/1'))
+        except (ValueError, ZeroDivisionError):
+            return False
+        if not real_rate or real_rate != average_rate:
+            return False
+        return abs(float(real_rate) - float(self.specs['frame_rate'])) < 0.001
+    
+    def _starts_at_zero(self, stream: Dict) -> bool:
+        """True if the stream's first timestamp is zero"""
+        try:
+            return abs(float(stream.get('start_time'))) < 1e-6
+        except (TypeError, ValueError):
+            return False
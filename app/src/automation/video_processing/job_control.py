@@ -0,0 +1,222 @@
+# app/src/automation/video_processing/job_control.py
+"""
+Job Control Module
+Tracks the ffmpeg processes and partial outputs of the running job so a cancel
+or timeout can stop them immediately
+"""
+
+import os
+import sys
+import time
+import signal
+import shutil
+import threading
+import subprocess
+from typing import Dict, Optional, Set
+
+class JobCancelledError(Exception):
+    """Raised when work is attempted for a job that has been cancelled"""
+    def __init__(self, reason: str = "Job cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+def kill_process_tree(pid: int):
+    """Kill a process together with every process it started"""
+    if sys.platform == "win32":
+        subprocess.run(
+            ['taskkill', '/T', '/F', '/PID', str(pid)],
+            capture_output=True,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        return
+    
+    try:
+        pgid = os.getpgid(pid)
+        # Never signal our own group; that would take the app down with the job
+        if pgid != os.getpgrp():
+            os.killpg(pgid, signal.SIGKILL)
+            return
+    except (ProcessLookupError, PermissionError):
+        pass
+    
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+class JobControl:
+    """
+    Process and output registry for the job running in this process
+    
+    Every ffmpeg started through FFmpegRunner is registered here and started in
+    its own process group, so cancelling kills the whole tree rather than just
+    the direct child. Outputs are registered while they are being written and
+    deleted on cancel if they never completed.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._processes: Dict[int, Optional[subprocess.Popen]] = {}
+        self._partial_outputs: Set[str] = set()
+        self.job_name = None
+        self.cancel_reason = None
+        # Pool workers lead their own group and keep ffmpeg inside it
+        self.isolate_processes = True
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def begin(self, job_name: str = None):
+        """Start tracking a new job, clearing any previous cancellation"""
+        with self._lock:
+            self._cancelled.clear()
+            self._processes.clear()
+            self._partial_outputs.clear()
+            self.job_name = job_name
+            self.cancel_reason = None
+    
+    def check_cancelled(self):
+        """Raise JobCancelledError if the job has been cancelled"""
+        if self.cancelled:
+            raise JobCancelledError(self.cancel_reason or "Job cancelled")
+    
+    def popen_kwargs(self) -> Dict:
+        """Popen arguments that put a child in its own process group"""
+        if not self.isolate_processes:
+            return {}
+        if sys.platform == "win32":
+            return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {'start_new_session': True}
+    
+    def use_worker_process_group(self):
+        """
+        Make this process (a pool worker) the leader of its own process group
+        
+        ffmpeg children then stay in the worker's group, so killing the worker's
+        tree from the parent process also stops every render it started.
+        """
+        if sys.platform != "win32":
+            try:
+                os.setsid()
+            except OSError:
+                pass
+        self.isolate_processes = False
+    
+    def register_process(self, process: subprocess.Popen):
+        """Track a started process; kills it straight away if the job was cancelled meanwhile"""
+        with self._lock:
+            self._processes[process.pid] = process
+        if self.cancelled:
+            self._kill(process.pid, process)
+    
+    def register_pid(self, pid: int):
+        """Track a process started elsewhere (e.g. a pool worker)"""
+        with self._lock:
+            self._processes.setdefault(pid, None)
+        if self.cancelled:
+            self._kill(pid, None)
+    
+    def unregister_process(self, pid: int):
+        """Stop tracking a process that has exited"""
+        with self._lock:
+            self._processes.pop(pid, None)
+    
+    def register_output(self, output_path: str):
+        """Mark an output as being written"""
+        with self._lock:
+            self._partial_outputs.add(os.path.abspath(output_path))
+    
+    def complete_output(self, output_path: str):
+        """Mark an output as finished so cancelling keeps it"""
+        with self._lock:
+            self._partial_outputs.discard(os.path.abspath(output_path))
+    
+    def cancel(self, reason: str = "Job cancelled"):
+        """
+        Cancel the job: refuse new processes, kill running process trees and
+        delete outputs that were still being written
+        """
+        with self._lock:
+            if not self.cancelled:
+                self.cancel_reason = reason
+            self._cancelled.set()
+        
+        self.terminate(reason)
+    
+    def terminate(self, reason: str):
+        """Kill running process trees and delete partial outputs without cancelling the job"""
+        with self._lock:
+            processes = dict(self._processes)
+            self._processes.clear()
+            partial_outputs = set(self._partial_outputs)
+            self._partial_outputs.clear()
+        
+        if processes or partial_outputs:
+            print(f"🛑 Stopping {self.job_name or 'job'}: {reason}")
+        
+        for pid, process in processes.items():
+            self._kill(pid, process)
+        
+        for output_path in partial_outputs:
+            self._remove_partial_output(output_path)
+    
+    def _kill(self, pid: int, process: Optional[subprocess.Popen]):
+        """Kill a process tree and reap the direct child if we own it"""
+        try:
+            kill_process_tree(pid)
+            if process is not None:
+                process.kill()
+                process.wait(timeout=5)
+            print(f"   🔪 Killed process tree {pid}")
+        except Exception as e:
+            print(f"⚠️ Could not kill process {pid}: {e}")
+    
+    def _remove_partial_output(self, output_path: str):
+        """Delete a partial output and the temp files rendered next to it"""
+        directory = os.path.dirname(output_path)
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return
+        
+        targets = [
+            os.path.join(directory, name) for name in names
+            if name == os.path.basename(output_path) or name.startswith(f"{stem}.")
+        ]
+        
+        for target in targets:
+            # Windows keeps the file locked for a moment after the writer dies
+            for attempt in range(5):
+                try:
+                    if os.path.isdir(target):
+                        shutil.rmtree(target)
+                    else:
+                        os.remove(target)
+                    print(f"   🗑️ Removed partial output: {os.path.basename(target)}")
+                    break
+                except FileNotFoundError:
+                    break
+                except OSError:
+                    time.sleep(0.5)
+
+
+# One job runs per process, so every component shares the same registry
+_job_control = None
+_job_control_lock = threading.Lock()
+
+def get_job_control() -> JobControl:
+    """Get the job control for this process"""
+    global _job_control
+    with _job_control_lock:
+        if _job_control is None:
+            _job_control = JobControl()
+        return _job_control
+
+def cancel_current_job(reason: str = "Job cancelled"):
+    """Cancel whatever job is running in this process"""
+    get_job_control().cancel(reason)
@@ -0,0 +1,172 @@
+# app/src/automation/video_processing/probe_service.py
+"""
+Probe Service Module
+Single ffprobe entry point with a persistent cache keyed by (path, size, mtime)
+"""
+
+import os
+import json
+import time
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from .processor_config import ProcessorConfig
+from .file_cache import prune_path_index
+
+class ProbeService:
+    """Probes each file once per modification and remembers the result on disk"""
+    
+    def __init__(self, cache_path: str = None):
+        self.config = ProcessorConfig()
+        self.cache_path = cache_path or self.config.PROBE_CACHE_PATH
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._cache: Dict[str, Dict] = self._load_cache()
+    
+    def probe(self, video_path: str) -> Optional[Dict]:
+        """
+        Get the ffprobe format and stream data for a file
+        
+        Args:
+            video_path: Path to the media file
+        
+        Returns:
+            Dict with 'format' and 'streams' (as printed by ffprobe -show_format
+            -show_streams), or None if the file cannot be probed
+        """
+        data = self._probe_cached(video_path)
+        if data is None:
+            return None
+        
+        with self._lock:
+            self._save_cache()
+        return data
+    
+    def get_duration(self, video_path: str) -> float:
+        """Get the container duration in seconds (0 if unknown)"""
+        data = self.probe(video_path)
+        try:
+            return float(data['format']['duration']) if data else 0.0
+        except (KeyError, ValueError):
+            return 0.0
+    
+    def probe_many(self, video_paths: List[str], max_workers: int = None) -> Dict[str, Optional[Dict]]:
+        """
+        Probe several files concurrently
+        
+        Args:
+            video_paths: Paths to probe (duplicates and empty entries are ignored)
+            max_workers: Concurrent ffprobe processes (defaults to PROBE_WORKERS)
+        
+        Returns:
+            Dict mapping each path to its probe data (None if it failed)
+        """
+        unique_paths = list(dict.fromkeys(p for p in video_paths if p))
+        if not unique_paths:
+            return {}
+        
+        workers = max(1, min(max_workers or self.config.PROBE_WORKERS, len(unique_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(unique_paths, executor.map(self._probe_cached, unique_paths)))
+        
+        with self._lock:
+            self._save_cache()
+        return results
+    
+    def _probe_cached(self, video_path: str) -> Optional[Dict]:
+        """Return cached probe data, running ffprobe only when the file changed"""
+        try:
+            abs_path = os.path.abspath(video_path)
+            stat = os.stat(abs_path)
+        except OSError:
+            return None
+        
+        with self._lock:
+            entry = self._cache.get(abs_path)
+            if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                entry['last_used'] = time.time()
+                return entry['data']
+        
+        data = self._run_ffprobe(abs_path)
+        if data is None:
+            return None
+        
+        with self._lock:
+            self._cache[abs_path] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'last_used': time.time(),
+                'data': data
+            }
+            self._dirty = True
+        return data
+    
+    def _run_ffprobe(self, video_path: str) -> Optional[Dict]:
+        """Run ffprobe and keep only the format and stream sections"""
+        cmd = [
+            'ffprobe', '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format', '-show_streams',
+            video_path
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if result.returncode != 0:
+                return None
+            
+            data = json.loads(result.stdout)
+            return {
+                'format': data.get('format', {}),
+                'streams': data.get('streams', [])
+            }
+        except Exception as e:
+            print(f"⚠️ ffprobe failed for {os.path.basename(video_path)}: {e}")
+            return None
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load the probe cache from disk"""
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not read probe cache, starting fresh: {e}")
+            return {}
+    
+    def _save_cache(self):
+        """Merge with the on-disk cache and write it back atomically (caller holds the lock)"""
+        if not self._dirty:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            
+            # Another process may have probed files since we loaded
+            merged = self._load_cache()
+            merged.update(self._cache)
+            self._cache = merged
+            dropped = prune_path_index(self._cache, self.config.PROBE_CACHE_MAX_ENTRIES)
+            if dropped:
+                print(f"🧹 Probe cache: dropped {dropped} stale entries")
+            
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except Exception as e:
+            print(f"⚠️ Could not save probe cache: {e}")
+
+
+# Shared instance so every component reuses the same in-memory cache
+_default_probe_service = None
+
+def get_probe_service() -> ProbeService:
+    """Get the shared probe service"""
+    global _default_probe_service
+    if _default_probe_service is None:
+        _default_probe_service = ProbeService()
+    return _default_probe_service
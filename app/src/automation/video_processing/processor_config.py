@@ -12,6 +12,16 @@ class ProcessorConfig:
     # Paths
     SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
     ASSETS_BASE_PATH = os.path.join(SCRIPT_DIR, "Assets", "Videos")
+    CACHE_BASE_PATH = os.path.join(SCRIPT_DIR, "cache")
+    ASSET_CACHE_DIR = os.path.join(CACHE_BASE_PATH, "normalized_assets")
+    CONTENT_HASH_INDEX = os.path.join(CACHE_BASE_PATH, "content_hashes.json")
+    CONTENT_HASH_INDEX_MAX_ENTRIES = 5000  # Files remembered before vanished / least recently used ones are dropped
+    CLIENT_SEGMENT_CACHE_DIR = os.path.join(CACHE_BASE_PATH, "client_segments")
+    PROBE_CACHE_PATH = os.path.join(CACHE_BASE_PATH, "probe_cache.json")
+    PROBE_CACHE_MAX_ENTRIES = 5000  # Files remembered before vanished / least recently used ones are dropped
+    PROBE_WORKERS = 4  # Concurrent ffprobe processes for batch probing
+    RENDER_CACHE_DIR = os.path.join(CACHE_BASE_PATH, "renders")
+    TAIL_CACHE_DIR = os.path.join(CACHE_BASE_PATH, "tails")
     
     # Default settings
     DEFAULT_TRANSITION_TYPE = "fade"
@@ -26,6 +36,42 @@ class ProcessorConfig:
     DEFAULT_AUDIO_BITRATE = "192k"
     DEFAULT_VIDEO_CRF = 23
     
+    # Normalized segment settings (shared by cached assets and client segments)
+    ASSET_CACHE_ENABLED = True
+    ASSET_CACHE_PRESET = "medium"  # Assets are encoded once, so favour quality
+    # Every piece of a stream-copy join must come from the same preset, otherwise
+    # the H.264 parameter sets differ and the joined file will not decode cleanly
+    SEGMENT_PRESET = ASSET_CACHE_PRESET
+    SEGMENT_GOP_SECONDS = 2
+    SEGMENT_VIDEO_TIMESCALE = 90000
+    CONCAT_STRATEGY = "encode_once"  # "encode_once" (stream-copy join) or "filter_graph"
+    SMART_RENDER_ENABLED = True  # Re-encode only the GOP-aligned windows around transitions
+    TAIL_CACHE_ENABLED = True  # Render each connector → endpoint join once and splice it in
+    
+    # Long clips are normalized as parallel chunks split at source keyframes
+    CHUNKED_ENCODE_ENABLED = True
+    CHUNKED_ENCODE_MIN_DURATION = 600  # 10 minutes - shorter clips encode in one pass
+    CHUNKED_ENCODE_WORKERS = 4  # Parallel render workers encode in one pass instead
+    CHUNKED_ENCODE_MIN_CHUNK_SECONDS = 120
+    CHUNKED_ENCODE_KEYFRAME_WINDOW = 10  # Seconds searched around each ideal split point
+    
+    # Inputs already H.264/AAC are stream-copied: save_only container changes, and
+    # client segments that match the target spec and join the cached assets as is
+    REMUX_FAST_PATH_ENABLED = True
+    
+    # Parallel rendering of client versions
+    PARALLEL_RENDER_ENABLED = True
+    MAX_RENDER_WORKERS = 3  # Concurrent ffmpeg jobs; x264 threads are split between them
+    
+    # Finished renders reused across cards with identical inputs and recipe
+    RENDER_CACHE_ENABLED = True
+    RENDER_CACHE_MAX_GB = 50  # Least recently used renders are evicted beyond this
+    
+    # Filter graphs are tried on a short slice (null muxer) before the full encode
+    GRAPH_DRY_RUN_ENABLED = True
+    GRAPH_DRY_RUN_SECONDS = 0.5
+    GRAPH_DRY_RUN_TIMEOUT = 30
+    
     # Processing thresholds
     TRANSITION_MAX_DURATION = 300  # 5 minutes - use transitions for videos shorter than this
     LONG_VIDEO_THRESHOLD = 1200    # 20 minutes
@@ -42,4 +88,63 @@ class ProcessorConfig:
         elif duration_seconds > cls.LONG_VIDEO_THRESHOLD:
             return 'medium'
         else:
-            return 'medium'  # Prefer quality for shorter videos
\ No newline at end of file
+            return 'medium'  # Prefer quality for shorter videos
+    
+    @classmethod
+    def get_render_worker_budget(cls, job_count):
+        """
+        Split the CPU between parallel render jobs
+        
+        Returns:
+            Tuple of (worker_count, threads_per_worker) where
+            worker_count x threads_per_worker never exceeds the core count
+        """
+        cores = os.cpu_count() or 1
+        workers = max(1, min(cls.MAX_RENDER_WORKERS, job_count, cores))
+        return workers, max(1, cores // workers)
+    
+    @classmethod
+    def get_thread_args(cls, specs):
+        """Get the encoder thread limit for specs that carry a thread budget"""
+        threads = specs.get('threads')
+        return ['-threads', str(threads)] if threads else []
+    
+    @classmethod
+    def get_segment_encode_args(cls, specs, preset=None):
+        """
+        Get the encoder arguments for a normalized segment
+        
+        Every segment encoded with these arguments shares codec, profile, GOP
+        and timebase, so segments can later be joined without re-encoding.
+        """
+        return (
+            cls.get_segment_video_args(specs, preset=preset)
+            + cls.get_segment_audio_args(specs)
+            + ['-movflags', '+faststart']
+        )
+    
+    @classmethod
+    def get_segment_video_args(cls, specs, preset=None):
+        """Get the video half of the normalized segment encoder arguments"""
+        gop = max(1, int(round(float(specs['frame_rate']) * cls.SEGMENT_GOP_SECONDS)))
+        return [
+            '-c:v', 'libx264',
+            '-preset', preset or specs.get('preset', 'medium'),
+            '-crf', str(cls.DEFAULT_VIDEO_CRF),
+            '-pix_fmt', 'yuv420p',
+            '-profile:v', 'high',
+            '-g', str(gop),
+            '-keyint_min', str(gop),
+            '-sc_threshold', '0',
+            '-video_track_timescale', str(cls.SEGMENT_VIDEO_TIMESCALE)
+        ]
+    
+    @classmethod
+    def get_segment_audio_args(cls, specs):
+        """Get the audio half of the normalized segment encoder arguments"""
+        return [
+            '-c:a', 'aac',
+            '-b:a', cls.DEFAULT_AUDIO_BITRATE,
+            '-ar', str(specs['sample_rate']),
+            '-ac', '2'
+        ]
@@ -0,0 +1,192 @@
+# app/src/automation/video_processing/remuxer.py
+"""
+Remuxer Module
+Stream-copies inputs that already conform to the target instead of re-encoding them
+"""
+
+import os
+import threading
+from fractions import Fraction
+from typing import Callable, Dict, Optional, Tuple
+from .processor_config import ProcessorConfig
+from .probe_service import get_probe_service
+from .ffmpeg_runner import FFmpegRunner
+from .job_control import JobCancelledError
+
+# Codecs that can go into an .mp4 untouched and play everywhere we deliver
+REMUX_VIDEO_CODECS = {'h264'}
+REMUX_AUDIO_CODECS = {'aac'}
+REMUX_PIX_FMTS = {'yuv420p', 'yuvj420p'}
+
+# Fast-path decisions in this process; render workers forward theirs to the parent
+_stats = {'remuxed': 0, 'encoded': 0}
+_stats_lock = threading.Lock()
+_decision_hook: Optional[Callable[[bool], None]] = None
+
+def set_remux_decision_hook(hook: Optional[Callable[[bool], None]]):
+    """Send this process's fast-path decisions to hook instead of counting them here"""
+    global _decision_hook
+    _decision_hook = hook
+
+def record_remux_decision(remuxed: bool):
+    """Count one fast-path decision (remuxed, or left for the encoder)"""
+    if _decision_hook:
+        _decision_hook(remuxed)
+        return
+    with _stats_lock:
+        _stats['remuxed' if remuxed else 'encoded'] += 1
+
+def reset_remux_stats():
+    """Start counting a new batch"""
+    with _stats_lock:
+        _stats['remuxed'] = _stats['encoded'] = 0
+
+def get_remux_stats() -> Dict[str, int]:
+    """Decisions counted since the last reset, workers included"""
+    with _stats_lock:
+        return dict(_stats)
+
+def print_remux_stats():
+    """Report how many inputs skipped the encoder in this batch"""
+    stats = get_remux_stats()
+    total = stats['remuxed'] + stats['encoded']
+    if total:
+        print(f"⚡ Remux fast path: {stats['remuxed']}/{total} inputs stream-copied instead of encoded")
+
+
+class Remuxer:
+    """Decides when an input can skip libx264 and remuxes it with stream copy"""
+    
+    def __init__(self):
+        self.config = ProcessorConfig()
+        self.prober = get_probe_service()
+        self.runner = FFmpegRunner()
+    
+    def check_conformance(self, video_path: str, specs: Dict = None) -> Tuple[bool, str]:
+        """
+        Check whether a file can be delivered without touching its pixels
+        
+        Args:
+            video_path: File to check
+            specs: Optional target specs; when given, geometry, frame rate, audio
+                layout and matching audio/video lengths are required as well
+        
+        Returns:
+            Tuple of (conforms, reason) where reason explains the decision
+        """
+        data = self.prober.probe(video_path)
+        if not data:
+            return False, "could not probe"
+        
+        streams = data.get('streams', [])
+        video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+        audio = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+        
+        if not video:
+            return False, "no video stream"
+        if video.get('codec_name') not in REMUX_VIDEO_CODECS:
+            return False, f"video codec {video.get('codec_name')}"
+        if video.get('pix_fmt') not in REMUX_PIX_FMTS:
+            return False, f"pixel format {video.get('pix_fmt')}"
+        if audio and audio.get('codec_name') not in REMUX_AUDIO_CODECS:
+            return False, f"audio codec {audio.get('codec_name')}"
+        
+        if specs:
+            if (video.get('width'), video.get('height')) != (specs['width'], specs['height']):
+                return False, f"{video.get('width')}x{video.get('height')} is not {specs['width']}x{specs['height']}"
+            
+            try:
+                real_rate = Fraction(video.get('r_frame_rate', '0/1'))
+                average_rate = Fraction(video.get('avg_frame_rate', '0/1'))
+            except (ValueError, ZeroDivisionError):
+                return False, "unknown frame rate"
+            if not real_rate or real_rate != average_rate:
+                return False, "variable frame rate"
+            if abs(float(real_rate) - float(specs['frame_rate'])) > 0.01:
+                return False, f"{float(real_rate):.3f}fps is not {specs['frame_rate']}fps"
+            
+            if audio:
+                if str(audio.get('sample_rate')) != str(specs['sample_rate']):
+                    return False, f"{audio.get('sample_rate')}Hz is not {specs['sample_rate']}Hz"
+                if audio.get('channels') != 2:
+                    return False, f"{audio.get('channels')} audio channel(s)"
+                
+                # The encoder pads or trims audio to the video; a copied segment
+                # has to come that way, or the next join drifts out of sync
+                try:
+                    drift = abs(float(audio['duration']) - float(video['duration']))
+                except (KeyError, TypeError, ValueError):
+                    return False, "unknown stream durations"
+                if drift > 1 / float(real_rate):
+                    return False, f"audio and video lengths differ by {drift:.3f}s"
+        
+        return True, "H.264/AAC" + (" at target spec" if specs else "")
+    
+    def try_remux(self, video_path: str, output_path: str, specs: Dict = None,
+                  verify: Callable[[str], Optional[str]] = None) -> bool:
+        """
+        Remux a conforming input, logging and counting the decision either way
+        
+        Args:
+            video_path: Input file
+            output_path: Where the stream copy goes
+            specs: Optional target specs the input must already match
+            verify: Optional check of the remuxed file; returns a reason to
+                reject it (the file is removed and the caller encodes) or None
+        
+        Returns:
+            True if the file was remuxed, False if the caller has to process it
+        """
+        if not self.config.REMUX_FAST_PATH_ENABLED:
+            return False
+        
+        name = os.path.basename(video_path)
+        conforms, reason = self.check_conformance(video_path, specs)
+        if conforms:
+            error = self.remux(video_path, output_path)
+            if error:
+                conforms, reason = False, f"remux failed ({error})"
+            elif verify:
+                rejection = verify(output_path)
+                if rejection:
+                    conforms, reason = False, rejection
+                    self._remove(output_path)
+        
+        record_remux_decision(conforms)
+        if conforms:
+            print(f"⚡ Remux fast path: {name} is {reason}, stream-copied")
+        else:
+            print(f"🐢 Remux fast path skipped for {name}: {reason}")
+        return conforms
+    
+    def remux(self, video_path: str, output_path: str) -> Optional[str]:
+        """Copy the first video and audio stream into a faststart .mp4 without re-encoding"""
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', video_path,
+            '-map', '0:v:0', '-map', '0:a:0?',
+            '-c', 'copy',
+            '-movflags', '+faststart',
+            output_path
+        ]
+        
+        try:
+            result = self.runner.run(
+                cmd, description=f"Remux {os.path.basename(video_path)}",
+                duration=self.prober.get_duration(video_path)
+            )
+            if result.returncode == 0:
+                return None
+            return f"FFmpeg error: {result.stderr[:300]}"
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            return f"Remux failed: {e}"
+    
+    def _remove(self, path: str):
+        """Delete a rejected stream copy"""
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            print(f"⚠️ Could not remove {os.path.basename(path)}: {e}")
@@ -0,0 +1,42 @@
+# app/src/automation/video_processing/render_cache.py
+"""
+Render Cache Module
+Reuses finished renders across cards when the inputs and encode recipe are identical
+"""
+
+from typing import Optional
+from .processor_config import ProcessorConfig
+from .file_cache import FileCache
+
+class RenderCache(FileCache):
+    """
+    Content-addressed cache of rendered outputs
+    
+    Keys are render fingerprints: the content hashes of every input file plus
+    the full encode recipe (mode, transitions, target spec, CRF, preset). A
+    repeat card with the same footage and assets gets its output hardlinked
+    from the cache instead of encoded again. Looking a render up costs no
+    reads of the inputs: Drive downloads are identified by their
+    md5Checksum, and other files by a hash kept per (path, size, mtime).
+    """
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        config = ProcessorConfig()
+        super().__init__(
+            cache_dir or config.RENDER_CACHE_DIR,
+            max_bytes or int(config.RENDER_CACHE_MAX_GB * 1024 ** 3),
+            label="Render cache"
+        )
+
+
+# Shared instance so every component sees the same index and statistics
+_default_render_cache = None
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Get the shared render cache (None when disabled in ProcessorConfig)"""
+    global _default_render_cache
+    if not ProcessorConfig.RENDER_CACHE_ENABLED:
+        return None
+    if _default_render_cache is None:
+        _default_render_cache = RenderCache()
+    return _default_render_cache
@@ -0,0 +1,87 @@
+# app/src/automation/video_processing/segment_encoder.py
+"""
+Segment Encoder Module
+Encodes single clips to the normalized segment format used for stream-copy joins
+"""
+
+import os
+from typing import Dict, Optional
+from .processor_config import ProcessorConfig
+from .video_analyzer import VideoAnalyzer
+from .ffmpeg_runner import FFmpegRunner
+from .chunked_encoder import ChunkedEncoder
+from .job_control import JobCancelledError
+
+class SegmentEncoder:
+    """Encodes a clip to the exact codec, GOP and timebase shared by all segments"""
+    
+    def __init__(self):
+        self.config = ProcessorConfig()
+        self.analyzer = VideoAnalyzer()
+        self.runner = FFmpegRunner()
+        self.chunked_encoder = ChunkedEncoder()
+    
+    def encode(self, input_path: str, output_path: str, specs: Dict, preset: str = None) -> Optional[str]:
+        """
+        Encode a clip to the normalized segment format
+        
+        Args:
+            input_path: Source clip
+            output_path: Destination segment
+            specs: Target specs (width, height, frame_rate, sample_rate, preset)
+            preset: Optional x264 preset override
+        
+        Returns:
+            None on success, error message on failure
+        """
+        params = self.analyzer.get_stream_parameters(input_path)
+        duration = params.get('video_duration', 0)
+        
+        video_filter = (
+            f"scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
+            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
+            f"fps={specs['frame_rate']},"
+            f"setsar=1"
+        )
+        
+        # Pad/trim audio to the video length so every segment carries equal-length streams
+        audio_filter = (
+            f"aresample={specs['sample_rate']},"
+            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo,"
+            f"asetpts=PTS-STARTPTS"
+        )
+        if duration > 0:
+            audio_filter += f",apad,atrim=0:{duration:.6f}"
+        
+        if self.chunked_encoder.should_chunk(duration):
+            error = self.chunked_encoder.encode(
+                input_path, output_path, specs, video_filter, audio_filter, duration, preset=preset
+            )
+            if not error:
+                return None
+            print(f"⚠️ Chunked encode unavailable: {error}")
+            print("🔄 Encoding in a single pass")
+        
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', input_path,
+            '-map', '0:v:0', '-map', '0:a:0',
+            '-vf', video_filter,
+            '-af', audio_filter
+        ]
+        cmd.extend(self.config.get_segment_encode_args(specs, preset=preset))
+        cmd.extend(self.config.get_thread_args(specs))
+        cmd.append(output_path)
+        
+        try:
+            result = self.runner.run(
+                cmd, description=f"Normalize {os.path.basename(input_path)}",
+                duration=duration
+            )
+            if result.returncode == 0:
+                return None
+            return f"FFmpeg error: {result.stderr[:300]}"
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            return f"Segment encode failed: {e}"
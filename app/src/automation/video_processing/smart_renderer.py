@@ -0,0 +1,290 @@
+# app/src/automation/video_processing/smart_renderer.py
+"""
+Smart Renderer Module
+Renders transitions by re-encoding only the GOP-aligned windows around each join
+"""
+
+import os
+import shutil
+from typing import List, Dict, Optional
+from .processor_config import ProcessorConfig
+from .video_analyzer import VideoAnalyzer
+from .concat_processor import ConcatProcessor
+from .ffmpeg_runner import FFmpegRunner
+from .job_control import JobCancelledError
+from .tail_cache import TailCache
+from .transition_timing import TransitionTiming
+
+class SmartTransitionRenderer:
+    """
+    Joins normalized segments with xfade transitions without re-encoding them whole
+    
+    Each segment is cut at keyframes on both sides of a transition. The untouched
+    bodies are stream-copied, only the short windows spanning a transition are
+    re-encoded, and the audio is rendered in one audio-only pass. Render time is
+    therefore proportional to the number of transitions, not the total length.
+    
+    Joins follow the same TransitionTiming as the full render, so the output
+    matches what the full render would have produced.
+    """
+    
+    def __init__(self):
+        self.config = ProcessorConfig()
+        self.analyzer = VideoAnalyzer()
+        self.concat_processor = ConcatProcessor()
+        self.runner = FFmpegRunner()
+        self.tail_cache = TailCache(self) if self.config.TAIL_CACHE_ENABLED else None
+    
+    def render(self, video_list: List[str], output_path: str, specs: Dict,
+               timing: TransitionTiming, normalized: bool = False) -> Optional[str]:
+        """
+        Render the sequence with transitions between every pair of segments
+        
+        Args:
+            video_list: Client video first, followed by the (normalized) assets
+            output_path: Final output file
+            specs: Target specs
+            timing: Transition timing of the whole sequence (see get_transition_timing)
+            normalized: Every entry, the first included, is already a normalized segment
+        
+        Returns:
+            None on success, error message if the caller should fall back
+            to a full render
+        """
+        print(f"✂️ SMART RENDER: Re-encoding only {len(video_list) - 1} transition window(s)...")
+        
+        work_dir = f"{os.path.splitext(output_path)[0]}.smart_render"
+        if normalized:
+            segments, temp_files = list(video_list), []
+        else:
+            segments, temp_files = self.concat_processor.prepare_segments(video_list, output_path, specs)
+        
+        try:
+            if not segments:
+                return "client segment could not be encoded"
+            
+            mismatches = self.concat_processor.find_incompatible_segments(segments)
+            if mismatches:
+                return f"segments are not stream-copy compatible ({', '.join(mismatches)})"
+            
+            segments = self._use_cached_tail(segments, specs, timing)
+            
+            durations = [self.analyzer.get_stream_parameters(s).get('video_duration', 0) for s in segments]
+            cuts = self._plan_cuts(segments, durations, timing)
+            if isinstance(cuts, str):
+                return cuts
+            
+            os.makedirs(work_dir, exist_ok=True)
+            
+            pieces = []
+            for index, segment in enumerate(segments):
+                start_cut, end_cut = cuts[index]
+                
+                body_path = os.path.join(work_dir, f"body_{index:02d}.mp4")
+                is_last = index == len(segments) - 1
+                error = self._copy_body(segment, body_path, start_cut, None if is_last else end_cut, specs)
+                if error:
+                    return error
+                if os.path.exists(body_path):
+                    pieces.append(body_path)
+                
+                if is_last:
+                    break
+                
+                window_path = os.path.join(work_dir, f"window_{index:02d}.mp4")
+                error = self._render_window(
+                    segment, segments[index + 1], window_path,
+                    end_cut, durations[index], cuts[index + 1][0],
+                    specs, timing
+                )
+                if error:
+                    return error
+                pieces.append(window_path)
+            
+            video_only_path = os.path.join(work_dir, "video.mp4")
+            error = self.concat_processor.concat_demux_copy(pieces, video_only_path, extra_args=[])
+            if error:
+                return error
+            
+            audio_path = os.path.join(work_dir, "audio.m4a")
+            audio_duration = timing.audio_duration(durations)
+            error = self._render_audio(segments, audio_path, specs, durations, timing, audio_duration)
+            if error:
+                return error
+            
+            output_duration = max(timing.video_duration(durations), audio_duration)
+            error = self._mux(video_only_path, audio_path, output_path, output_duration)
+            if error:
+                return error
+            
+            print("✅ Smart render complete")
+            return None
+        
+        finally:
+            self.concat_processor._remove_files(temp_files)
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _use_cached_tail(self, segments: List[str], specs: Dict,
+                         timing: TransitionTiming) -> List[str]:
+        """
+        Replace connector + endpoint with their cached pre-rendered join
+        
+        Only applies to client → connector → endpoint sequences; the job then
+        renders a single client → tail window.
+        """
+        if not self.tail_cache or len(segments) != 3:
+            return segments
+        
+        tail = self.tail_cache.get_tail(segments[1], segments[2], specs, timing)
+        if not tail:
+            return segments
+        
+        mismatches = self.concat_processor.find_incompatible_segments([segments[0], tail])
+        if mismatches:
+            print(f"⚠️ Cached tail is not stream-copy compatible ({', '.join(mismatches)}), rendering in full")
+            return segments
+        
+        print("🔗 Splicing cached connector → endpoint tail; rendering only the client → tail window")
+        return [segments[0], tail]
+    
+    def _plan_cuts(self, segments: List[str], durations: List[float], timing: TransitionTiming):
+        """
+        Choose the keyframe where each segment's body starts and ends
+        
+        A segment's body starts at the first keyframe after the incoming
+        transition and ends at the last keyframe before the outgoing one.
+        
+        Returns:
+            List of (start_cut, end_cut) per segment, or an error message
+        """
+        gop = float(self.config.SEGMENT_GOP_SECONDS)
+        epsilon = 0.001
+        cuts = []
+        
+        for index, segment in enumerate(segments):
+            segment_duration = durations[index]
+            if segment_duration <= max(timing.lead, timing.duration):
+                return f"{os.path.basename(segment)} is shorter than the transition"
+            
+            start_cut = 0.0
+            if index > 0:
+                keyframes = self.analyzer.get_keyframe_times(segment, end=timing.duration + 2 * gop + 1)
+                candidates = [k for k in keyframes if k >= timing.duration - epsilon]
+                if not candidates:
+                    return f"no keyframe after the transition in {os.path.basename(segment)}"
+                start_cut = candidates[0]
+            
+            end_cut = segment_duration
+            if index < len(segments) - 1:
+                transition_start = segment_duration - timing.lead
+                keyframes = self.analyzer.get_keyframe_times(
+                    segment, start=transition_start - 2 * gop - 1, end=segment_duration
+                )
+                candidates = [k for k in keyframes if k <= transition_start + epsilon]
+                if not candidates:
+                    return f"no keyframe before the transition in {os.path.basename(segment)}"
+                end_cut = candidates[-1]
+            
+            if end_cut < start_cut:
+                return f"{os.path.basename(segment)} is too short to cut between its transitions"
+            
+            cuts.append((start_cut, end_cut))
+        
+        return cuts
+    
+    def _copy_body(self, segment: str, body_path: str, start_cut: float,
+                   end_cut: Optional[float], specs: Dict) -> Optional[str]:
+        """Stream-copy the video between two keyframes of a segment"""
+        cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+        if start_cut > 0:
+            cmd.extend(['-ss', f"{start_cut:.6f}"])
+        cmd.extend(['-i', segment, '-map', '0:v:0', '-c', 'copy'])
+        
+        if end_cut is not None:
+            # Closed GOPs mean the first N packets are exactly the frames before the cut
+            frame_count = int(round((end_cut - start_cut) * float(specs['frame_rate'])))
+            if frame_count <= 0:
+                return None
+            cmd.extend(['-frames:v', str(frame_count)])
+        
+        cmd.extend(['-avoid_negative_ts', 'make_zero', body_path])
+        return self._run(cmd, f"copy {os.path.basename(segment)}")
+    
+    def _render_window(self, outgoing: str, incoming: str, window_path: str,
+                       outgoing_cut: float, outgoing_duration: float, incoming_cut: float,
+                       specs: Dict, timing: TransitionTiming) -> Optional[str]:
+        """Re-encode the tail of one segment crossfaded into the head of the next"""
+        offset = max(0.0, outgoing_duration - timing.lead - outgoing_cut)
+        
+        filter_complex = (
+            f"[0:v]setpts=PTS-STARTPTS[v0];"
+            f"[1:v]setpts=PTS-STARTPTS[v1];"
+            f"[v0][v1]xfade=transition={timing.xfade}:duration={timing.duration}:offset={offset:.6f}[vout]"
+        )
+        
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-ss', f"{outgoing_cut:.6f}", '-i', outgoing,
+            '-t', f"{incoming_cut:.6f}", '-i', incoming,
+            '-filter_complex', filter_complex,
+            '-map', '[vout]', '-an'
+        ]
+        cmd.extend(self.config.get_segment_video_args(specs, preset=self.config.SEGMENT_PRESET))
+        cmd.extend(self.config.get_thread_args(specs))
+        cmd.append(window_path)
+        
+        window_duration = offset + incoming_cut
+        print(f"   🎬 Window {os.path.basename(outgoing)} → {os.path.basename(incoming)}: {window_duration:.2f}s")
+        return self._run(cmd, "transition window", window_duration)
+    
+    def _render_audio(self, segments: List[str], audio_path: str, specs: Dict, durations: List[float],
+                      timing: TransitionTiming, output_duration: float) -> Optional[str]:
+        """Join the audio of every segment in a single audio-only pass"""
+        cmd = ['ffmpeg', '-y', '-hide_banner', '-loglevel', 'error']
+        for segment in segments:
+            cmd.extend(['-i', segment])
+        
+        if timing.audio == 'cut':
+            # Each outgoing track ends where its video transition starts
+            filters = []
+            for i in range(len(segments)):
+                trim = f"atrim=0:{durations[i] - timing.lead}," if i < len(segments) - 1 else ""
+                filters.append(f"[{i}:a]{trim}asetpts=PTS-STARTPTS[a{i}]")
+            inputs = ''.join(f"[a{i}]" for i in range(len(segments)))
+            filters.append(f"{inputs}concat=n={len(segments)}:v=0:a=1[aout]")
+        else:
+            filters = [f"[{i}:a]asetpts=PTS-STARTPTS[a{i}]" for i in range(len(segments))]
+            previous = "a0"
+            for i in range(1, len(segments)):
+                label = "aout" if i == len(segments) - 1 else f"ax{i}"
+                filters.append(f"[{previous}][a{i}]acrossfade=d={timing.duration}:c1=tri:c2=tri[{label}]")
+                previous = label
+        
+        cmd.extend(['-filter_complex', ';'.join(filters), '-map', '[aout]', '-vn'])
+        cmd.extend(self.config.get_segment_audio_args(specs))
+        cmd.append(audio_path)
+        return self._run(cmd, "audio pass", output_duration)
+    
+    def _mux(self, video_path: str, audio_path: str, output_path: str, output_duration: float) -> Optional[str]:
+        """Combine the joined video and the rendered audio without re-encoding"""
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', video_path, '-i', audio_path,
+            '-map', '0:v:0', '-map', '1:a:0',
+            '-c', 'copy',
+            '-movflags', '+faststart',
+            output_path
+        ]
+        return self._run(cmd, "mux", output_duration)
+    
+    def _run(self, cmd: List[str], step: str, duration: float = None) -> Optional[str]:
+        """Run an FFmpeg step and return an error message on failure"""
+        try:
+            result = self.runner.run(cmd, description=f"Smart render {step}", duration=duration)
+            if result.returncode == 0:
+                return None
+            return f"{step} failed: {result.stderr[:300]}"
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            return f"{step} failed: {e}"
@@ -0,0 +1,101 @@
+# app/src/automation/video_processing/tail_cache.py
+"""
+Tail Cache Module
+Keeps connector → endpoint joins pre-rendered per asset pair and target spec
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional
+from .processor_config import ProcessorConfig
+from .content_hasher import get_content_hasher
+from .transition_timing import TransitionTiming
+
+class TailCache:
+    """
+    On-disk cache of rendered "connector + transition + endpoint" tails
+    
+    Every client video of an account/platform ends with the same connector and
+    endpoint, so the join between them only needs rendering once. The cached
+    tail is a normalized segment itself, which lets a job render just the
+    client → tail boundary and stream-copy the rest.
+    """
+    
+    def __init__(self, renderer, cache_dir: str = None):
+        """
+        Args:
+            renderer: SmartTransitionRenderer used to render tails on a miss
+            cache_dir: Where tails are stored (defaults to TAIL_CACHE_DIR)
+        """
+        self.config = ProcessorConfig()
+        self.cache_dir = cache_dir or self.config.TAIL_CACHE_DIR
+        self.renderer = renderer
+        self.hasher = get_content_hasher()
+    
+    def get_tail(self, connector_path: str, endpoint_path: str, specs: Dict,
+                 timing: TransitionTiming) -> Optional[str]:
+        """
+        Get the rendered connector → endpoint tail
+        
+        Args:
+            connector_path: Normalized connector segment
+            endpoint_path: Normalized quiz/SVSL/VSL segment
+            specs: Target specs
+            timing: Transition timing of the client → connector → endpoint sequence
+        
+        Returns:
+            Path to the cached tail, or None if it could not be rendered
+        """
+        cache_key = self.build_cache_key(connector_path, endpoint_path, specs, timing)
+        if not cache_key:
+            return None
+        
+        cached_path = os.path.join(self.cache_dir, f"tail_{cache_key[:16]}.mp4")
+        pair_name = f"{os.path.basename(connector_path)} → {os.path.basename(endpoint_path)}"
+        
+        if os.path.exists(cached_path):
+            print(f"♻️ Tail cache hit: {pair_name}")
+            return cached_path
+        
+        print(f"🧱 Tail cache miss: rendering {pair_name}")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Render under a temporary name so a crash never leaves a truncated cache entry
+        temp_path = os.path.join(self.cache_dir, f"tail_{cache_key[:16]}.{os.getpid()}.partial.mp4")
+        error = self.renderer.render(
+            [connector_path, endpoint_path], temp_path, specs, timing, normalized=True
+        )
+        
+        if error:
+            print(f"⚠️ Could not render tail {pair_name}: {error}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+        
+        os.replace(temp_path, cached_path)
+        print(f"✅ Cached tail: {os.path.basename(cached_path)}")
+        return cached_path
+    
+    def build_cache_key(self, connector_path: str, endpoint_path: str, specs: Dict,
+                        timing: TransitionTiming) -> Optional[str]:
+        """Build the cache key from both content hashes + target spec + transition + encoder arguments"""
+        connector_hash = self.hasher.get_hash(connector_path)
+        endpoint_hash = self.hasher.get_hash(endpoint_path)
+        if not connector_hash or not endpoint_hash:
+            return None
+        
+        key_data = {
+            'connector_hash': connector_hash,
+            'endpoint_hash': endpoint_hash,
+            'width': specs['width'],
+            'height': specs['height'],
+            'frame_rate': specs['frame_rate'],
+            'sample_rate': specs['sample_rate'],
+            'transition_lead': timing.lead,
+            'transition_duration': timing.duration,
+            'transition_xfade': timing.xfade,
+            'transition_audio': timing.audio,
+            'encode_args': self.config.get_segment_encode_args(specs, preset=self.config.SEGMENT_PRESET)
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
@@ -4,10 +4,15 @@ Transition Processor Module - FIXED
 Handles video transitions (crossfade, fade, etc.) with proper timing
 """
 
-import subprocess
+import os
 from typing import List, Dict, Optional
 from .processor_config import ProcessorConfig
 from .video_analyzer import VideoAnalyzer
+from .smart_renderer import SmartTransitionRenderer
+from .ffmpeg_runner import FFmpegRunner
+from .job_control import JobCancelledError
+from .filter_graph import FilterGraph, FilterGraphCompiler, FilterGraphError, check_xfade_offsets
+from .transition_timing import TransitionTiming, get_transition_timing
 
 class TransitionProcessor:
     """Handles video transitions between segments"""
@@ -15,11 +20,18 @@ class TransitionProcessor:
     def __init__(self):
         self.config = ProcessorConfig()
         self.analyzer = VideoAnalyzer()
+        self.smart_renderer = SmartTransitionRenderer()
+        self.runner = FFmpegRunner()
     
     def apply_transitions(self, video_list: List[str], output_path: str, 
                          specs: Dict, transition_type: str = "fade",
                          duration: float = 0.5) -> Optional[str]:
-        """Apply transitions between videos"""
+        """
+        Apply transitions between videos
+        
+        The timing of every join comes from get_transition_timing() for the
+        number of videos, for the smart and the full render alike.
+        """
         
         if len(video_list) == 1:
             # No transitions needed for single video
@@ -28,16 +40,20 @@ class TransitionProcessor:
             return concat.robust_concat(video_list, output_path, specs)
         
         print(f"🎞️ TRANSITIONS: Processing {len(video_list)} videos with {transition_type} transitions...")
+        timing = get_transition_timing(len(video_list))
+        
+        if self.config.SMART_RENDER_ENABLED and timing:
+            error = self.smart_renderer.render(video_list, output_path, specs, timing)
+            if not error:
+                return None
+            print(f"⚠️ Smart render unavailable: {error}")
+            print("🔄 Falling back to full transition render")
         
         try:
             if len(video_list) == 2:
-                return self._apply_two_video_transition(
-                    video_list, output_path, specs, transition_type, duration
-                )
+                return self._apply_two_video_transition(video_list, output_path, specs, timing)
             elif len(video_list) == 3:
-                return self._apply_three_video_transition(
-                    video_list, output_path, specs, transition_type, duration
-                )
+                return self._apply_three_video_transition(video_list, output_path, specs, timing)
             else:
                 # For 4+ videos, use robust concat for now
                 print("⚠️ 4+ videos detected, using robust concat instead of transitions")
@@ -45,6 +61,8 @@ class TransitionProcessor:
                 concat = ConcatProcessor()
                 return concat.robust_concat(video_list, output_path, specs)
                 
+        except JobCancelledError:
+            raise
         except Exception as e:
             print(f"⚠️ Transitions error: {e}")
             print("🔄 Using robust concat fallback")
@@ -54,8 +72,7 @@ class TransitionProcessor:
     
     # In app/src/automation/video_processing/transition_processor.py
     def _apply_two_video_transition(self, video_list: List[str], output_path: str,
-                                   specs: Dict, transition_type: str,
-                                   duration: float) -> Optional[str]:
+                                   specs: Dict, timing: TransitionTiming) -> Optional[str]:
         """Apply transition with PERFECT AUDIO SYNC - FIXED VERSION"""
         
         # Get durations
@@ -65,46 +82,18 @@ class TransitionProcessor:
         first_duration = first_video_info.get('duration', 10)
         second_duration = second_video_info.get('duration', 10)
         
-        # Use 0.25s transition
-        trans_duration = 0.25
+        trans_duration = timing.duration
         
         # Calculate precise transition point
-        transition_start = first_duration - trans_duration
+        transition_start = timing.offsets([first_duration, second_duration])[0]
         
         print(f"   📍 Video 1: {first_duration:.2f}s")
         print(f"   📍 Video 2: {second_duration:.2f}s")
         print(f"   📍 Transition: {transition_start:.2f}s for {trans_duration}s")
         
         # CRITICAL AUDIO SYNC FIX: Process audio and video separately
-        filter_complex = (
-            # Process videos
-            f"[0:v]scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fps={specs['frame_rate']},setsar=1[v0];"
-            
-            f"[1:v]scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fps={specs['frame_rate']},setsar=1[v1];"
-            
-            # Apply video crossfade
-            f"[v0][v1]xfade=transition=fade:duration={trans_duration}:offset={transition_start}[vout];"
-            
-            # AUDIO FIX: Split and concat at exact point
-            # Take first audio until transition point
-            f"[0:a]atrim=0:{transition_start},asetpts=PTS-STARTPTS[a0_part];"
-            
-            # Take second audio completely
-            f"[1:a]asetpts=PTS-STARTPTS[a1_part];"
-            
-            # Normalize both parts
-            f"[a0_part]aresample={specs['sample_rate']}:async=1,"
-            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo[a0_norm];"
-            
-            f"[a1_part]aresample={specs['sample_rate']}:async=1,"
-            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo[a1_norm];"
-            
-            # Concatenate audio parts
-            f"[a0_norm][a1_norm]concat=n=2:v=0:a=1[aout]"
+        filter_complex = self._build_two_video_filter(
+            video_list, specs, transition_start, trans_duration
         )
         
         # Build command
@@ -122,12 +111,23 @@ class TransitionProcessor:
             '-c:a', 'aac',
             '-b:a', '192k',
             '-ar', str(specs['sample_rate']),
-            '-ac', '2',
-            output_path
+            '-ac', '2'
         ]
+        cmd.extend(self.config.get_thread_args(specs))
+        cmd.append(output_path)
+        
+        error = self._preflight(
+            cmd, [first_duration, second_duration], [transition_start], trans_duration
+        )
+        if error:
+            print(f"⚠️ Transition graph rejected before encoding: {error}")
+            return self._concat_with_simple_cut(video_list, output_path, specs)
         
         print("🎬 Applying transition with audio sync fix...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self.runner.run(
+            cmd, description=f"Transition {os.path.basename(output_path)}",
+            duration=timing.video_duration([first_duration, second_duration])
+        )
         
         if result.returncode == 0:
             print("✅ Transition applied successfully")
@@ -146,8 +146,7 @@ class TransitionProcessor:
         return concat.robust_concat(video_list, output_path, specs)
     
     def _apply_three_video_transition(self, video_list: List[str], output_path: str,
-                                     specs: Dict, transition_type: str,
-                                     duration: float) -> Optional[str]:
+                                     specs: Dict, timing: TransitionTiming) -> Optional[str]:
         """Apply transitions between three videos - NEW"""
         
         # Get durations
@@ -156,11 +155,11 @@ class TransitionProcessor:
         
         first_duration = first_info.get('duration', 10)
         second_duration = second_info.get('duration', 10)
+        third_duration = self.analyzer.get_video_info(video_list[2]).get('duration', 10)
         
         # Calculate transition points
-        trans1_start = max(0, first_duration - 1.0)
-        trans2_start = max(0, first_duration + second_duration - 2.0)
-        actual_duration = 0.5
+        trans1_start, trans2_start = timing.offsets([first_duration, second_duration, third_duration])
+        actual_duration = timing.duration
         
         print(f"   📍 Video 1 duration: {first_duration:.1f}s")
         print(f"   📍 Video 2 duration: {second_duration:.1f}s")
@@ -169,7 +168,7 @@ class TransitionProcessor:
         
         # Build complex filter for 3 videos
         filter_complex = self._build_three_video_filter(
-            specs, trans1_start, trans2_start, actual_duration
+            video_list, specs, trans1_start, trans2_start, actual_duration
         )
         
         cmd = [
@@ -187,12 +186,26 @@ class TransitionProcessor:
             '-c:a', 'aac',
             '-b:a', self.config.DEFAULT_AUDIO_BITRATE,
             '-ar', str(specs['sample_rate']),
-            '-movflags', '+faststart',
-            output_path
+            '-movflags', '+faststart'
         ]
+        cmd.extend(self.config.get_thread_args(specs))
+        cmd.append(output_path)
+        
+        error = self._preflight(
+            cmd, [first_duration, second_duration, third_duration],
+            [trans1_start, trans2_start], actual_duration
+        )
+        if error:
+            print(f"⚠️ Transition graph rejected before encoding, using concat: {error}")
+            from .concat_processor import ConcatProcessor
+            concat = ConcatProcessor()
+            return concat.robust_concat(video_list, output_path, specs)
         
         print("🎬 Applying crossfade transitions (3 videos)...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self.runner.run(
+            cmd, description=f"Transitions {os.path.basename(output_path)}",
+            duration=specs.get('total_duration')
+        )
         
         if result.returncode == 0:
             print("✅ Transitions applied successfully")
@@ -204,6 +217,25 @@ class TransitionProcessor:
             return concat.robust_concat(video_list, output_path, specs)
         
     
+    def _preflight(self, cmd: List[str], durations: List[float], offsets: List[float],
+                   duration: float) -> Optional[str]:
+        """
+        Validate a transition render before the full encode
+        
+        Checks the xfade offsets against the input durations, then dry-runs
+        the command (FFmpegRunner.preflight) so graph and format errors
+        surface in well under a second.
+        
+        Returns:
+            None if the render is expected to work, otherwise the reason it won't
+        """
+        try:
+            check_xfade_offsets(durations, offsets, duration)
+        except FilterGraphError as e:
+            return str(e)
+        
+        return self.runner.preflight(cmd)
+    
     def _build_crossfade_filter(self, specs: Dict, transition_start: float, 
                             duration: float) -> str:
         """Build crossfade transition filter with PERFECT audio sync"""
@@ -236,38 +268,57 @@ class TransitionProcessor:
             f"[a0][a1_delayed]concat=n=2:v=0:a=1[aout]"
         )
     
-    def _build_three_video_filter(self, specs: Dict, trans1_start: float,
+    def _build_two_video_filter(self, video_list: List[str], specs: Dict,
+                               transition_start: float, duration: float) -> str:
+        """Build filter for two videos: video crossfade, audio cut at the transition point"""
+        graph = FilterGraph()
+        compiler = FilterGraphCompiler(specs)
+        
+        # Process videos
+        first_video, first_audio = compiler.probe_streams(video_list[0])
+        second_video, second_audio = compiler.probe_streams(video_list[1])
+        timebase_matches = compiler.timebases_match([first_video, second_video])
+        graph.add(['0:v'], compiler.video_filters(first_video, timebase_matches=timebase_matches) or ['null'], ['v0'])
+        graph.add(['1:v'], compiler.video_filters(second_video, timebase_matches=timebase_matches) or ['null'], ['v1'])
+        
+        # Apply video crossfade
+        graph.add(['v0', 'v1'], [f"xfade=transition=fade:duration={duration}:offset={transition_start}"], ['vout'])
+        
+        # AUDIO FIX: Take first audio until transition point, second audio completely,
+        # then normalize both parts (async resampling is always kept)
+        graph.add(
+            ['0:a'],
+            [f"atrim=0:{transition_start}", "asetpts=PTS-STARTPTS"] + compiler.audio_filters(first_audio, resync=True),
+            ['a0_norm']
+        )
+        graph.add(['1:a'], ["asetpts=PTS-STARTPTS"] + compiler.audio_filters(second_audio, resync=True), ['a1_norm'])
+        
+        # Concatenate audio parts
+        graph.add(['a0_norm', 'a1_norm'], ["concat=n=2:v=0:a=1"], ['aout'])
+        
+        compiler.report()
+        return graph.compile(['vout', 'aout'])
+    
+    def _build_three_video_filter(self, video_list: List[str], specs: Dict, trans1_start: float,
                                  trans2_start: float, duration: float) -> str:
         """Build filter for three videos with two transitions"""
-        return (
-            # Prepare all three videos
-            f"[0:v]scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fps={specs['frame_rate']},setsar=1,format=yuva420p[v0];"
-            
-            f"[1:v]scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fps={specs['frame_rate']},setsar=1,format=yuva420p[v1];"
-            
-            f"[2:v]scale={specs['width']}:{specs['height']}:force_original_aspect_ratio=decrease,"
-            f"pad={specs['width']}:{specs['height']}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fps={specs['frame_rate']},setsar=1,format=yuva420p[v2];"
-            
-            # Audio preparation
-            f"[0:a]aresample={specs['sample_rate']}:async=1,"
-            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo[a0];"
-            f"[1:a]aresample={specs['sample_rate']}:async=1,"
-            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo[a1];"
-            f"[2:a]aresample={specs['sample_rate']}:async=1,"
-            f"aformat=sample_rates={specs['sample_rate']}:channel_layouts=stereo[a2];"
-            
-            # First transition (video 0 to 1)
-            f"[v0][v1]xfade=transition=fade:duration={duration}:offset={trans1_start}[v01];"
-            f"[a0][a1]acrossfade=d={duration}:c1=tri:c2=tri[a01];"
-            
-            # Second transition (result to video 2)
-            f"[v01][v2]xfade=transition=fade:duration={duration}:offset={trans2_start}[vout];"
-            f"[a01][a2]acrossfade=d={duration}:c1=tri:c2=tri[aout]"
+        graph = FilterGraph()
+        compiler = FilterGraphCompiler(specs)
+        
+        # Prepare all three videos, normalizing only what differs from the target
+        # (each input gets its own chain: xfade reads them one after another)
+        video_labels, audio_labels = compiler.add_normalized_inputs(
+            graph, video_list, audio_resync=True,
+            extra_video_filters=['format=yuva420p'], match_timebase=True
         )
-    
-    
\ No newline at end of file
+        compiler.report()
+        
+        # First transition (video 0 to 1)
+        graph.add(video_labels[:2], [f"xfade=transition=fade:duration={duration}:offset={trans1_start}"], ['v01'])
+        graph.add(audio_labels[:2], [f"acrossfade=d={duration}:c1=tri:c2=tri"], ['a01'])
+        
+        # Second transition (result to video 2)
+        graph.add(['v01', video_labels[2]], [f"xfade=transition=fade:duration={duration}:offset={trans2_start}"], ['vout'])
+        graph.add(['a01', audio_labels[2]], [f"acrossfade=d={duration}:c1=tri:c2=tri"], ['aout'])
+        
+        return graph.compile(['vout', 'aout'])
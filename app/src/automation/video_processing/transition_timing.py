@@ -0,0 +1,64 @@
+# app/src/automation/video_processing/transition_timing.py
+"""
+Transition Timing Module
+Transition lengths, offsets and audio handling shared by every transition render path
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+@dataclass(frozen=True)
+class TransitionTiming:
+    """
+    How every join of one sequence is rendered
+    
+    Attributes:
+        lead: Seconds before the end of the outgoing segment where the transition
+            starts; whatever of the outgoing segment follows the transition is dropped
+        duration: Transition length in seconds
+        xfade: xfade transition name
+        audio: 'cut' (outgoing audio ends where the transition starts) or
+            'crossfade' (acrossfade of `duration` over the untrimmed ends)
+    """
+    lead: float
+    duration: float
+    xfade: str = 'fade'
+    audio: str = 'crossfade'
+    
+    def offsets(self, durations: List[float]) -> List[float]:
+        """xfade offset of each join on the joined output timeline"""
+        offsets = []
+        elapsed = 0.0
+        for index, segment_duration in enumerate(durations[:-1]):
+            elapsed += segment_duration
+            offsets.append(max(0, elapsed - self.lead * (index + 1)))
+        return offsets
+    
+    def video_duration(self, durations: List[float]) -> float:
+        """Length of the joined video"""
+        return sum(durations) - self.lead * (len(durations) - 1)
+    
+    def audio_duration(self, durations: List[float]) -> float:
+        """Length of the joined audio (a crossfade only overlaps `duration`)"""
+        overlap = self.lead if self.audio == 'cut' else self.duration
+        return sum(durations) - overlap * (len(durations) - 1)
+
+
+def get_transition_timing(segment_count: int) -> Optional[TransitionTiming]:
+    """
+    Get the timing used for a sequence of segment_count videos
+    
+    Both the full render and the smart render use this, so falling back from
+    one to the other never changes the output.
+    
+    Returns:
+        The timing, or None when the sequence is joined without transitions
+    """
+    if segment_count == 2:
+        # Short crossfade, audio cut at the transition point
+        return TransitionTiming(lead=0.25, duration=0.25, audio='cut')
+    if segment_count == 3:
+        # Transitions start a second before each join and last half a second
+        return TransitionTiming(lead=1.0, duration=0.5, audio='crossfade')
+    # 4+ videos are concatenated
+    return None
@@ -6,10 +6,10 @@ Analyzes video files and extracts information
 
 import os
 import subprocess
-import json
 from typing import Dict, List, Tuple, Optional
 from collections import Counter
 from .processor_config import ProcessorConfig
+from .probe_service import get_probe_service
 
 _fallback_dimensions = None
 
@@ -40,22 +40,14 @@ class VideoAnalyzer:
     
     def __init__(self):
         self.config = ProcessorConfig()
+        self.prober = get_probe_service()
     
     def get_video_info(self, video_path: str) -> Dict:
         """Get detailed video information using ffprobe"""
         try:
-            cmd = [
-                'ffprobe', '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format', '-show_streams',
-                video_path
-            ]
+            data = self.prober.probe(video_path)
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                
+            if data:
                 # Extract stream info
                 video_stream = None
                 audio_stream = None
@@ -85,6 +77,80 @@ class VideoAnalyzer:
         
         return {}
     
+    def get_stream_parameters(self, video_path: str) -> Dict:
+        """
+        Get the stream parameters that must match for a stream-copy join
+        
+        Returns:
+            Dict with codec, profile, geometry, pixel format, frame rate,
+            timebase and audio layout; empty dict if probing fails
+        """
+        try:
+            data = self.prober.probe(video_path)
+            if not data:
+                return {}
+            
+            video_stream = next((s for s in data.get('streams', []) if s.get('codec_type') == 'video'), {})
+            audio_stream = next((s for s in data.get('streams', []) if s.get('codec_type') == 'audio'), {})
+            
+            format_duration = float(data.get('format', {}).get('duration', 0) or 0)
+            
+            return {
+                'video_codec': video_stream.get('codec_name', ''),
+                'video_profile': video_stream.get('profile', ''),
+                'width': video_stream.get('width', 0),
+                'height': video_stream.get('height', 0),
+                'pix_fmt': video_stream.get('pix_fmt', ''),
+                'r_frame_rate': video_stream.get('r_frame_rate', ''),
+                'time_base': video_stream.get('time_base', ''),
+                'audio_codec': audio_stream.get('codec_name', ''),
+                'sample_rate': audio_stream.get('sample_rate', ''),
+                'channels': audio_stream.get('channels', 0),
+                'video_duration': float(video_stream.get('duration', 0) or format_duration)
+            }
+        except Exception as e:
+            print(f"⚠️ Could not read stream parameters for {os.path.basename(video_path)}: {e}")
+            return {}
+    
+    def get_keyframe_times(self, video_path: str, start: float = None, end: float = None) -> List[float]:
+        """
+        Get keyframe timestamps from packet flags, without decoding
+        
+        Args:
+            video_path: Path to the video
+            start: Optional start of the region to read (seconds)
+            end: Optional end of the region to read (seconds)
+        
+        Returns:
+            Sorted list of keyframe times in seconds
+        """
+        cmd = [
+            'ffprobe', '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time,flags',
+            '-of', 'csv=p=0'
+        ]
+        if start is not None or end is not None:
+            start_spec = f"{max(0.0, start):.3f}" if start is not None else ""
+            end_spec = f"{end:.3f}" if end is not None else ""
+            cmd.extend(['-read_intervals', f"{start_spec}%{end_spec}"])
+        cmd.append(video_path)
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                return []
+            
+            keyframes = []
+            for line in result.stdout.splitlines():
+                parts = line.strip().split(',')
+                if len(parts) >= 2 and 'K' in parts[1] and parts[0] not in ('', 'N/A'):
+                    keyframes.append(float(parts[0]))
+            return sorted(keyframes)
+        except Exception as e:
+            print(f"⚠️ Could not read keyframes for {os.path.basename(video_path)}: {e}")
+            return []
+    
     def _parse_frame_rate(self, video_stream) -> float:
         """Parse frame rate from video stream"""
         frame_rate = 30  # default
@@ -117,6 +183,9 @@ class VideoAnalyzer:
         video_infos = []
         total_duration = 0
         
+        # Probe every input at once; get_video_info below is then served from the cache
+        self.prober.probe_many(video_list)
+        
         for video in video_list:
             info = self.get_video_info(video)
             if info:
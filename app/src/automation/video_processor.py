@@ -9,11 +9,14 @@ import shutil
 from typing import Optional, List, Tuple, Dict
 from .video_processing import (
     VideoAnalyzer, AssetManager, ConcatProcessor,
-    TransitionProcessor, ProcessorConfig,
+    TransitionProcessor, ProcessorConfig, Remuxer, set_remux_decision_hook,
+    set_client_segment_cache_dir, get_client_segment_cache, set_chunk_worker_limit,
     # NEW: Import fallback functions
     set_fallback_dimensions, get_fallback_dimensions, 
     get_video_dimensions_with_fallback
 )
+from .video_processing.ffmpeg_runner import add_progress_listener
+from .video_processing.job_control import get_job_control
 
 class VideoProcessor:
     """
@@ -39,11 +42,13 @@ class VideoProcessor:
         self.asset_manager = AssetManager(account_code, platform_code)
         self.concat_processor = ConcatProcessor()
         self.transition_processor = TransitionProcessor()
+        self.remuxer = Remuxer()
         
         # Settings - ENSURE TRANSITIONS ARE ON
         self.use_transitions = True  # Force True for testing
         self.transition_type = transition_type or self.config.DEFAULT_TRANSITION_TYPE
         self.transition_duration = transition_duration or self.config.DEFAULT_TRANSITION_DURATION
+        self.encoder_threads = None  # Set when rendering alongside other jobs
         
         print(f"🎬 VideoProcessor initialized (Modular Version)")
         print(f"   ✨ TRANSITIONS FORCED ON")
@@ -65,18 +70,18 @@ class VideoProcessor:
         
         # Handle save_only mode
         if processing_mode == "save_only":
-            try:
-                shutil.copy2(client_video, output_path)
-                print(f"✅ Video copied successfully")
-                return None
-            except Exception as e:
-                return f"Copy failed: {e}"
+            return self._save_only(client_video, output_path)
         
         # Build video list based on processing mode
         video_list = self._build_video_list(client_video, processing_mode)
         
         # Determine target specs
         target_specs = self.analyzer.determine_target_specs(video_list)
+        if self.encoder_threads:
+            target_specs['threads'] = self.encoder_threads
+        
+        # Swap endpoint assets for copies already normalized to the target specs
+        video_list = self._use_normalized_assets(video_list, target_specs)
         
         # ADD THESE DEBUG LINES:
         print(f"🔍 DEBUG TRANSITIONS:")
@@ -98,10 +103,23 @@ class VideoProcessor:
             )
         else:
             print("❌ NOT USING TRANSITIONS - Using concat")
-            return self.concat_processor.robust_concat(
+            return self.concat_processor.concat(
                 video_list, output_path, target_specs
             )
     
+    def _save_only(self, client_video: str, output_path: str) -> Optional[str]:
+        """Deliver the client video as is, remuxing when only the container has to change"""
+        same_container = os.path.splitext(client_video)[1].lower() == os.path.splitext(output_path)[1].lower()
+        if not same_container and self.remuxer.try_remux(client_video, output_path):
+            return None
+        
+        try:
+            shutil.copy2(client_video, output_path)
+            print(f"✅ Video copied successfully")
+            return None
+        except Exception as e:
+            return f"Copy failed: {e}"
+    
     def _build_video_list(self, client_video: str, processing_mode: str) -> List[str]:
         """Build list of videos based on processing mode"""
         video_list = [client_video]
@@ -125,6 +143,16 @@ class VideoProcessor:
         
         return video_list
     
+    def _use_normalized_assets(self, video_list: List[str], specs: Dict) -> List[str]:
+        """Replace asset entries (everything after the client video) with cached normalized copies"""
+        if len(video_list) <= 1:
+            return video_list
+        
+        return [video_list[0]] + [
+            self.asset_manager.get_normalized_asset(video, specs)
+            for video in video_list[1:]
+        ]
+    
     def _get_asset_video(self, asset_type: str) -> Optional[str]:
         """Get asset video by type"""
         asset_getters = {
@@ -176,6 +204,22 @@ class VideoProcessor:
             self.transition_duration = duration
         print(f"✨ Transitions configured: {enabled}, Type: {self.transition_type}, Duration: {self.transition_duration}s")
     
+    def set_encoder_threads(self, threads: Optional[int]):
+        """Limit encoder threads so parallel jobs don't oversubscribe the CPU"""
+        self.encoder_threads = threads
+    
+    def get_worker_settings(self) -> Dict:
+        """Get the settings needed to build an identical processor in a worker process"""
+        shared_cache = get_client_segment_cache()
+        return {
+            'account_code': self.asset_manager.account_code,
+            'platform_code': self.asset_manager.platform_code,
+            'use_transitions': self.use_transitions,
+            'transition_type': self.transition_type,
+            'transition_duration': self.transition_duration,
+            'client_segment_cache_dir': shared_cache.cache_dir if shared_cache else None
+        }
+    
     def get_video_dimensions(self, video_path: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
         """Get video dimensions"""
         return self.analyzer.get_video_dimensions(video_path)
@@ -248,12 +292,67 @@ def _get_vsl_video() -> Optional[str]:
     processor = _get_default_processor()
     return processor.asset_manager.get_vsl_video()
 
+def get_processor_worker_settings() -> Dict:
+    """Get the default processor's settings for seeding render worker processes"""
+    processor = _get_default_processor()
+    return processor.get_worker_settings()
+
+# ============================================================================
+# PROCESS-POOL WORKER ENTRY POINTS
+# ============================================================================
+
+# Each render worker process builds its own processor from the parent's settings
+_worker_processor = None
+
+def init_render_worker(settings: Dict, encoder_threads: int = None, progress_queue=None):
+    """ProcessPoolExecutor initializer - build this worker's VideoProcessor"""
+    global _worker_processor
+    
+    # The parent cancels a worker by killing its process tree, ffmpeg included
+    get_job_control().use_worker_process_group()
+    
+    _worker_processor = VideoProcessor(
+        transition_type=settings.get('transition_type'),
+        transition_duration=settings.get('transition_duration'),
+        account_code=settings.get('account_code'),
+        platform_code=settings.get('platform_code')
+    )
+    _worker_processor.configure_transitions(
+        settings.get('use_transitions', True),
+        settings.get('transition_type'),
+        settings.get('transition_duration')
+    )
+    _worker_processor.set_encoder_threads(encoder_threads)
+    set_client_segment_cache_dir(settings.get('client_segment_cache_dir'))
+    # The pool is the parallelism here; a long clip encodes in one pass per worker
+    set_chunk_worker_limit(1)
+    
+    # Tell the parent our pid so cancelling the job can kill this worker's tree,
+    # then forward this worker's ffmpeg progress and remux decisions to it
+    if progress_queue is not None:
+        progress_queue.put({'worker_pid': os.getpid()})
+        add_progress_listener(progress_queue.put)
+        set_remux_decision_hook(lambda remuxed: progress_queue.put({'remux_decision': remuxed}))
+
+def render_in_worker(client_video: str, output_path: str,
+                     target_width: int, target_height: int,
+                     processing_mode: str = "connector_quiz") -> Optional[str]:
+    """Render one video sequence inside a worker process"""
+    processor = _worker_processor or _get_default_processor()
+    return processor.process_video_sequence(
+        client_video, output_path, target_width, target_height, processing_mode
+    )
+
 __all__ = [
     'VideoProcessor',
     'set_processor_account_platform',
     'process_video_sequence', 
     'configure_transitions',
     'get_video_dimensions',
+    'get_processor_worker_settings',
+    'init_render_worker',
+    'render_in_worker',
+    'set_client_segment_cache_dir',
     # NEW: Export fallback functions
     'set_fallback_dimensions',
     'get_fallback_dimensions',
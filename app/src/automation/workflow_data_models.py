@@ -21,6 +21,7 @@ class ConfirmationData:
     estimated_time: str
     issues: List[ValidationIssue]
     file_sizes: List[tuple]  # (filename, size_mb)
+    listing_summary: Dict = None  # DriveListingService.summarize() of the Drive folder
 
 @dataclass
 class ProcessingResult:
@@ -11,10 +11,14 @@ def create_confirmation_data_from_orchestrator(card_data: dict,
                                               processing_mode: str,
                                               project_info: dict,
                                               downloaded_videos: list,
-                                              validation_issues: list = None):
+                                              validation_issues: list = None,
+                                              listed_files: list = None):
     """
     Convert orchestrator data to ConfirmationData format
     FIXED: Standalone implementation to avoid import errors
+    
+    listed_files is the Drive folder listing, when the videos are not
+    downloaded yet; its sizes and video metadata go into the summary
     """
     
     print(f"🔄 Creating confirmation data...")
@@ -65,8 +69,8 @@ def create_confirmation_data_from_orchestrator(card_data: dict,
     # Step 5: Build output location
     output_location = _build_output_location(project_name, processing_mode)
     
-    # Step 6: Get file sizes
-    file_sizes = _get_file_sizes(downloaded_videos)
+    # Step 6: Get file sizes (from the Drive listing before anything is downloaded)
+    file_sizes = _get_file_sizes(downloaded_videos, listed_files)
     
     # Step 7: Convert validation_issues to issues (CRITICAL FIX)
     issues = []
@@ -96,7 +100,8 @@ def create_confirmation_data_from_orchestrator(card_data: dict,
         output_location=output_location,
         estimated_time=estimated_time,
         issues=issues,  # ← CORRECT: Using 'issues' not 'validation_issues'
-        file_sizes=file_sizes
+        file_sizes=file_sizes,
+        listing_summary=_summarize_listing(listed_files)
     )
     
     print(f"✅ Confirmation data created successfully")
@@ -166,13 +171,25 @@ def _build_output_location(project_name: str, processing_mode: str) -> str:
     return f"GH {project_name} {endpoint_type}"
 
 
-def _get_file_sizes(video_paths: list) -> list:
-    """Get file sizes for videos"""
+def _summarize_listing(listed_files: list):
+    """Totals from the Drive listing, or None when the videos were not listed"""
+    if not listed_files:
+        return None
+    from ..api_clients.drive_listing import DriveListingService
+    return DriveListingService.summarize(listed_files)
+
+
+def _get_file_sizes(video_paths: list, listed_files: list = None) -> list:
+    """Get file sizes for videos, from disk or else from the Drive listing"""
+    listed_sizes = {f.get('name'): int(f.get('size', 0)) for f in listed_files or []}
     file_sizes = []
     
     for path in video_paths:
         try:
-            if os.path.exists(path):
+            name = os.path.basename(path)
+            if name in listed_sizes and not os.path.exists(path):
+                file_sizes.append((name, round(listed_sizes[name] / (1024 * 1024), 2)))
+            elif os.path.exists(path):
                 size_bytes = os.path.getsize(path)
                 size_mb = round(size_bytes / (1024 * 1024), 2)
                 file_sizes.append((os.path.basename(path), size_mb))
@@ -6,6 +6,7 @@ from queue import Queue, Empty
 from typing import Callable
 
 from ..workflow_data_models import ProcessingResult
+from ..video_processing.job_control import cancel_current_job
 
 class ProcessingThreadManager:
     """Handles background processing threads with FIXED tab state integration"""
@@ -230,6 +231,9 @@ class ProcessingThreadManager:
         print("⏹️ Cancelling processing...")
         self.is_cancelled = True
         
+        # Kill running ffmpeg trees and remove half-written outputs
+        cancel_current_job("Cancelled by user")
+        
         if self.dialog.tab_manager:
             self.dialog.tab_manager.processing_active = False
     
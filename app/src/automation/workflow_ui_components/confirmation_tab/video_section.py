@@ -91,4 +91,44 @@ class VideoSection:
         
         # Display the video count
         ttk.Label(section_frame, text=video_text,
-                 style='Body.TLabel', font=('Segoe UI', 8)).pack(anchor=tk.W, padx=(15, 0))
\ No newline at end of file
+                 style='Body.TLabel', font=('Segoe UI', 8)).pack(anchor=tk.W, padx=(15, 0))
+        
+        # Sizes, durations and resolution from the Drive listing, before any download
+        listing_text = self._format_listing_summary(getattr(self.data, 'listing_summary', None))
+        if listing_text:
+            ttk.Label(section_frame, text=listing_text,
+                     style='Body.TLabel', font=('Segoe UI', 8)).pack(anchor=tk.W, padx=(15, 0))
+        
+        # Background prefetch status, filled in once the orchestrator reference is set
+        self.prefetch_label = ttk.Label(section_frame, text="", style='Body.TLabel', font=('Segoe UI', 8))
+        self.prefetch_label.pack(anchor=tk.W, padx=(15, 0))
+        self.prefetch_label.after(500, self.refresh_prefetch_status)
+    
+    def _format_listing_summary(self, summary):
+        """One line describing the Drive folder, or "" without a listing"""
+        if not summary or not summary['file_count']:
+            return ""
+        
+        text = (f"{summary['total_bytes'] / (1024 ** 3):.2f} GB, "
+                f"{summary['total_duration'] / 60:.1f} min of video")
+        if summary['max_width']:
+            text += f", up to {summary['max_width']}x{summary['max_height']}"
+        if summary['missing_metadata']:
+            text += f" ({len(summary['missing_metadata'])} not yet processed by Drive)"
+        return text
+    
+    def refresh_prefetch_status(self):
+        """Show how far the background download has got, polling until it finishes"""
+        if not self.prefetch_label.winfo_exists():
+            return
+        
+        orchestrator = getattr(self.main_tab, 'orchestrator', None)
+        stream = getattr(orchestrator, 'download_stream', None) if orchestrator else None
+        if not stream:
+            self.prefetch_label.config(text="")
+            return
+        
+        self.prefetch_label.config(text=f"📥 Prefetch: {stream.describe()}")
+        
+        if not stream.is_finished():
+            self.prefetch_label.after(1000, self.refresh_prefetch_status)
\ No newline at end of file
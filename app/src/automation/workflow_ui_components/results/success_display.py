@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk
 from .action_buttons import ActionButtons
 from .breakdown_handler import BreakdownHandler
+from ...api_clients import get_sheets_journal
 
 class SuccessDisplay:
     """Handles success results display"""
@@ -82,6 +83,15 @@ class SuccessDisplay:
             count = len(result.processed_files)
             ttk.Label(summary_frame, text=f"📊 {count} video{'s' if count != 1 else ''} processed successfully",
                      style='Body.TLabel', font=('Segoe UI', 10)).pack(anchor=tk.W, pady=(5, 0))
+        
+        # Rows the background Sheets writer gave up on need the operator's attention
+        journal = get_sheets_journal()
+        failed = journal.failed_count() if journal else 0
+        if failed:
+            ttk.Label(summary_frame,
+                     text=f"⚠️ {failed} Google Sheets write{'s' if failed != 1 else ''} failed - rows kept in {journal.failed_dir}",
+                     style='Body.TLabel', font=('Segoe UI', 10),
+                     foreground=self.theme.colors['error']).pack(anchor=tk.W, pady=(5, 0))
     
     def _create_breakdown_section(self, parent):
         """Create breakdown report section"""
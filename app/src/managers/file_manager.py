@@ -1,10 +1,10 @@
 # --- File: app/src/managers/file_manager.py ---
 import os
 import yaml
-import subprocess
 from tkinter import filedialog, messagebox
 from PIL import Image
 import tkinter as tk
+from ..automation.video_processing.ffmpeg_runner import FFmpegRunner
 
 class FileManager:
     def __init__(self, app):
@@ -25,7 +25,9 @@ class FileManager:
             
         command = ['ffmpeg', '-y', '-i', filepath, '-vframes', '1', self.app.TEMP_FRAME_FILENAME]
         try:
-            subprocess.run(command, check=True, capture_output=True, text=True)
+            result = FFmpegRunner().run(command, description="Extract preview frame")
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr[-500:])
             self.app.original_image = Image.open(self.app.TEMP_FRAME_FILENAME)
             self.app.canvas_manager.on_resize()
             self.app.toggle_controls(tk.NORMAL)
@@ -3,10 +3,12 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import subprocess
-import sys
 import threading
 import shutil
 from . import naming_generator
+from .automation.video_processing.ffmpeg_runner import FFmpegRunner
+from .automation.video_processing.probe_service import get_probe_service
+from .automation.video_processing.filter_graph import FilterGraph, FilterGraphCompiler
 
 class StitcherTool:
     def __init__(self, root, back_callback):
@@ -213,30 +215,22 @@ class StitcherTool:
                 video_list = [client_path] + [t['path'] for t in seq['templates']]
                 
                 command = ['ffmpeg', '-y']
-                filter_complex_parts = []
-                concat_inputs = ""
                 
                 # Define a universal standard for all clips
-                target_width, target_height = 1080, 1920
-                target_fps = 30
-                target_audio_rate = 44100
+                target_specs = {'width': 1080, 'height': 1920, 'frame_rate': 30, 'sample_rate': 44100}
                 
-                for j, video_path in enumerate(video_list):
+                for video_path in video_list:
                     command.extend(['-i', video_path])
-                    # Standardize each video and audio stream
-                    filter_complex_parts.append(
-                        f"[{j}:v]scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
-                        f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2,"
-                        f"setsar=1,fps={target_fps},setpts=PTS-STARTPTS[v{j}];"
-                    )
-                    filter_complex_parts.append(
-                        f"[{j}:a]aformat=sample_rates={target_audio_rate}:channel_layouts=stereo,"
-                        f"asetpts=PTS-STARTPTS[a{j}];"
-                    )
-                    concat_inputs += f"[v{j}][a{j}]"
-
-                filter_complex = "".join(filter_complex_parts) + \
-                                 f"{concat_inputs}concat=n={len(video_list)}:v=1:a=1[outv][outa]"
+                
+                # Standardize each video and audio stream, skipping what a clip already matches
+                graph = FilterGraph()
+                compiler = FilterGraphCompiler(target_specs)
+                video_labels, audio_labels = compiler.add_normalized_inputs(graph, video_list, reset_timestamps=True)
+                compiler.report()
+                
+                concat_inputs = [label for pair in zip(video_labels, audio_labels) for label in pair]
+                graph.add(concat_inputs, [f"concat=n={len(video_list)}:v=1:a=1"], ['outv', 'outa'])
+                filter_complex = graph.compile(['outv', 'outa'])
                 
                 command.extend([
                     '-filter_complex', filter_complex,
@@ -245,12 +239,19 @@ class StitcherTool:
                 ])
                 command.append(output_path)
                 
-                startupinfo = None
-                if sys.platform == "win32":
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                def show_progress(progress, completed=i):
+                    if progress.get('percent') is not None:
+                        progress_bar['value'] = completed + progress['percent'] / 100
+                        self.root.update_idletasks()
 
-                subprocess.run(command, check=True, capture_output=True, text=True, startupinfo=startupinfo)
+                result = FFmpegRunner().run(
+                    command,
+                    description=f"Export {output_name}",
+                    duration=sum(get_probe_service().get_duration(p) for p in video_list),
+                    on_progress=show_progress
+                )
+                if result.returncode != 0:
+                    raise subprocess.CalledProcessError(result.returncode, command, stderr=result.stderr)
                 progress_bar['value'] = i + 1
                 self.root.update_idletasks()
 
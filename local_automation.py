@@ -1,6 +1,7 @@
 # local_automation.py - FIXED entry point with UI integration
 import sys
 import os
+import multiprocessing
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -45,6 +46,9 @@ def show_usage():
     print("  Headless     - Command-line only (legacy mode)")
 
 if __name__ == "__main__":
+    # Required for the render worker pool when running as a frozen executable
+    multiprocessing.freeze_support()
+    
     # FIXED: Handle no arguments case - show UI with popup
     if len(sys.argv) == 1:
         # No arguments provided - show UI with Trello card popup
@@ -6,6 +6,11 @@
 import runpy
 import sys
 import os
+import multiprocessing
+
+# Render workers are spawned by re-running this executable; let them
+# take over here before the GUI is started.
+multiprocessing.freeze_support()
 
 # Ensure the project's root directory is on the Python path.
 # This allows the 'app' package to be found.